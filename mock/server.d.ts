@@ -0,0 +1,39 @@
+// Types for importing the mock backend from TypeScript tests and benchmarks
+
+export interface MockScenario {
+  patients: number
+  riskPatients: number
+  latencyMs: number
+  streamBatchDelayMs: number
+  streamDisconnectAfterBatches: number
+  streamDisconnects: number
+  streamIgnoreResume: boolean
+  comprehensiveBatch: boolean
+  callRequestsStatus: number
+  callRequestsRejected: string[]
+  events: boolean
+  eventsHeartbeatMs: number
+}
+
+export interface MockStats {
+  requests: Array<{ method: string; path: string }>
+  streamBytes: number
+  streamsAborted: number
+  streamsDropped: number
+  callRequests: Array<{ idempotency_key: string; patient_id: string; requested_at: string }>
+  eventConnections: Array<{ lastEventId: string | null }>
+}
+
+export interface MockServer {
+  url: string
+  scenario: MockScenario
+  stats: MockStats
+  events: Array<{ id: number; type: string; data: unknown }>
+  pushEvent: (type: string, data: unknown) => void
+  dropEventStreams: () => void
+  close: () => Promise<void>
+}
+
+export function makePatient(index: number): Record<string, any>
+export function createScenario(overrides?: Partial<MockScenario>): MockScenario
+export function createMockServer(options?: { port?: number; scenario?: Partial<MockScenario> }): Promise<MockServer>
@@ -0,0 +1,357 @@
+import http from 'node:http'
+import { fileURLToPath } from 'node:url'
+
+/**
+ * Mock Health Notifier backend for tests, benchmarks and offline development
+ *
+ * Serves deterministic synthetic patients under /api with the same response
+ * shapes as the Flask backend. Tests start one instance per file with
+ * createMockServer() and change `scenario` to make endpoints slow or fail;
+ * `stats` records what was requested and served. pushEvent() sends a live
+ * update to every client connected to /events/stream.
+ *
+ * Run `node mock/server.js` to serve it on port 5199 (or $PORT), then start
+ * the app with VITE_API_BASE_URL=http://127.0.0.1:5199/api.
+ */
+
+const DEFAULT_PORT = 5199
+const JSON_HEADERS = { 'Content-Type': 'application/json' }
+
+/**
+ * Synthetic patient record number `index` (0-based); the same index always gives the same patient
+ */
+export function makePatient(index) {
+  const riskScore = (index * 7) % 10
+  return {
+    patient_id: index + 1,
+    name: `Patient ${String(index + 1).padStart(5, '0')}`,
+    age: 20 + (index % 20),
+    gender: 'F',
+    risk_score: riskScore,
+    risk_level: riskScore >= 8 ? 'high' : riskScore >= 5 ? 'medium' : 'low',
+    heat_wave_risk: false,
+    pregnancy_weeks: 8 + (index % 32),
+    trimester: 1 + Math.floor((index % 32) / 11),
+    medications: ['Prenatal Vitamins'],
+    phone_number: `+1 (555) 010-${String(index % 10000).padStart(4, '0')}`,
+    updated_at: new Date(Date.UTC(2024, 6, 1) + index * 60 * 1000).toISOString()
+  }
+}
+
+function makeComprehensive(patient) {
+  return {
+    ...patient,
+    patient_name: patient.name,
+    overall_assessment: { risk_level: patient.risk_level, immediate_concerns: [] },
+    recommendations: ['Stay hydrated', 'Avoid outdoor activity at midday']
+  }
+}
+
+export function createScenario(overrides = {}) {
+  return {
+    // Size of the cohort served by the list and stream endpoints
+    patients: 200,
+    // How many of them /risk-patients returns
+    riskPatients: 50,
+    // Added before every response
+    latencyMs: 0,
+    // Pause between streamed batches
+    streamBatchDelayMs: 0,
+    // The next `streamDisconnects` stream connections are dropped after this many batches
+    streamDisconnectAfterBatches: 0,
+    streamDisconnects: 0,
+    // Serve every stream from the start, as a backend without resume support would
+    streamIgnoreResume: false,
+    // Serve the multi-id comprehensive endpoint; when false it 404s like an older backend
+    comprehensiveBatch: true,
+    // Answer every call request batch with this status instead of scheduling it (e.g. 401 or 503)
+    callRequestsStatus: 200,
+    // Patient ids whose call requests are rejected
+    callRequestsRejected: [],
+    // Serve /events/stream; when false it 404s like a backend without push updates
+    events: true,
+    // Interval of heartbeat comments on event streams
+    eventsHeartbeatMs: 15000,
+    ...overrides
+  }
+}
+
+function createStats() {
+  return {
+    requests: [],
+    // Bytes written to patient stream responses
+    streamBytes: 0,
+    // Stream responses whose client went away before the summary
+    streamsAborted: 0,
+    // Stream responses cut off by the server to simulate a dropped connection
+    streamsDropped: 0,
+    // Call requests scheduled, one per idempotency key
+    callRequests: [],
+    // Event stream connections, with the Last-Event-ID each one resumed from
+    eventConnections: []
+  }
+}
+
+const sleep = ms => new Promise(resolve => setTimeout(resolve, ms))
+
+function sendJson(res, status, body) {
+  res.writeHead(status, JSON_HEADERS)
+  res.end(JSON.stringify(body))
+}
+
+async function readJson(req) {
+  let text = ''
+  for await (const chunk of req) text += chunk
+  return text ? JSON.parse(text) : {}
+}
+
+/**
+ * POST /call-requests/batch: each request is scheduled once per idempotency key,
+ * and repeats are answered as duplicates
+ */
+async function scheduleCallRequests(req, res, server) {
+  const { scenario, stats } = server
+  const body = await readJson(req)
+  if (scenario.callRequestsStatus !== 200) {
+    sendJson(res, scenario.callRequestsStatus, { success: false, error: 'Call requests unavailable' })
+    return
+  }
+
+  const results = (body.requests || []).map(item => {
+    const key = item.idempotency_key
+    if (stats.callRequests.some(scheduled => scheduled.idempotency_key === key)) {
+      return { idempotency_key: key, status: 'duplicate' }
+    }
+    if (scenario.callRequestsRejected.includes(String(item.patient_id))) {
+      return { idempotency_key: key, status: 'rejected', error: 'Patient has no phone number on file' }
+    }
+    stats.callRequests.push(item)
+    return { idempotency_key: key, status: 'scheduled' }
+  })
+  sendJson(res, 200, { success: true, results })
+}
+
+function writeEvent(res, event) {
+  if (res.destroyed) return
+  res.write(`id: ${event.id}\nevent: ${event.type}\ndata: ${JSON.stringify(event.data)}\n\n`)
+}
+
+/**
+ * GET /events/stream: server-sent events, replaying what a reconnecting client missed after Last-Event-ID
+ */
+function streamEvents(req, res, server) {
+  const lastEventId = req.headers['last-event-id'] ?? null
+  server.stats.eventConnections.push({ lastEventId })
+
+  res.writeHead(200, { 'Content-Type': 'text/event-stream', 'Cache-Control': 'no-cache' })
+  res.write('retry: 1000\n\n')
+  if (lastEventId !== null) {
+    server.events.filter(event => event.id > Number(lastEventId)).forEach(event => writeEvent(res, event))
+  }
+
+  const heartbeat = setInterval(() => res.write(': heartbeat\n\n'), server.scenario.eventsHeartbeatMs)
+  server.eventClients.add(res)
+  res.on('close', () => {
+    clearInterval(heartbeat)
+    server.eventClients.delete(res)
+  })
+}
+
+function patientsInRange(scenario, from, to) {
+  const result = []
+  for (let i = from; i < Math.min(to, scenario.patients); i++) result.push(makePatient(i))
+  return result
+}
+
+/**
+ * Write one chunk, waiting for the socket to drain so a slow reader slows the stream down
+ */
+async function write(res, text) {
+  if (res.destroyed) return false
+  if (!res.write(text)) {
+    await new Promise(resolve => {
+      res.once('drain', resolve)
+      res.once('close', resolve)
+    })
+  }
+  return !res.destroyed
+}
+
+async function streamPatients(req, res, url, server) {
+  const { scenario, stats } = server
+  const riskLevel = url.searchParams.get('risk_level')
+  const batchSize = Math.max(1, Number(url.searchParams.get('batch_size')) || 20)
+
+  const patients = []
+  for (let i = 0; i < scenario.patients; i++) {
+    const patient = makePatient(i)
+    if (!riskLevel || patient.risk_level === riskLevel) patients.push(patient)
+  }
+
+  // Resume contract: skip past after_patient_id if it is known, else the first resume_from rows
+  let startIndex = 0
+  if (!scenario.streamIgnoreResume) {
+    const afterId = url.searchParams.get('after_patient_id')
+    const afterIndex = afterId === null ? -1 : patients.findIndex(patient => String(patient.patient_id) === afterId)
+    startIndex = afterIndex !== -1 ? afterIndex + 1 : Math.min(patients.length, Number(url.searchParams.get('resume_from')) || 0)
+  }
+
+  let dropAfterBatches = null
+  if (scenario.streamDisconnects > 0) {
+    scenario.streamDisconnects--
+    dropAfterBatches = scenario.streamDisconnectAfterBatches
+  }
+
+  let finished = false
+  res.on('close', () => {
+    if (!finished) stats.streamsAborted++
+  })
+  res.writeHead(200, { 'Content-Type': 'application/x-ndjson' })
+
+  const send = async line => {
+    const text = JSON.stringify(line) + '\n'
+    stats.streamBytes += Buffer.byteLength(text)
+    return write(res, text)
+  }
+
+  if (!await send({ type: 'metadata', total_patients: patients.length, batch_size: batchSize })) return
+
+  let batches = 0
+  for (let start = startIndex; start < patients.length; start += batchSize) {
+    if (batches === dropAfterBatches) {
+      // Abrupt close, as when a tablet roams between access points
+      finished = true
+      stats.streamsDropped++
+      res.destroy()
+      return
+    }
+    if (batches > 0 && scenario.streamBatchDelayMs > 0) await sleep(scenario.streamBatchDelayMs)
+    const batch = patients.slice(start, start + batchSize)
+    batches++
+    const sent = await send({
+      type: 'batch',
+      patients: batch,
+      processed_count: start + batch.length,
+      total_patients: patients.length
+    })
+    if (!sent) return
+  }
+
+  const distribution = { low: 0, medium: 0, high: 0 }
+  patients.forEach(patient => distribution[patient.risk_level]++)
+  await send({ type: 'summary', total_processed: patients.length, risk_distribution: distribution })
+  finished = true
+  res.end()
+}
+
+async function handle(req, res, server) {
+  const { scenario, stats } = server
+  const url = new URL(req.url, 'http://localhost')
+  const path = url.pathname.replace(/^\/api/, '')
+  stats.requests.push({ method: req.method, path: path + url.search })
+
+  if (req.method === 'OPTIONS') {
+    res.writeHead(204)
+    res.end()
+    return
+  }
+  if (scenario.latencyMs > 0) await sleep(scenario.latencyMs)
+
+  let match
+  if (req.method === 'GET' && path === '/risk-patients') {
+    sendJson(res, 200, { success: true, risk_patients: patientsInRange(scenario, 0, scenario.riskPatients) })
+  } else if (req.method === 'GET' && path === '/risk-patients/comprehensive' && scenario.comprehensiveBatch) {
+    // Unknown ids are reported per patient instead of failing the batch
+    const assessments = []
+    const errors = {}
+    for (const id of (url.searchParams.get('ids') || '').split(',').filter(Boolean)) {
+      const index = Number(id) - 1
+      if (index >= 0 && index < scenario.patients) assessments.push(makeComprehensive(makePatient(index)))
+      else errors[id] = 'Patient not found'
+    }
+    sendJson(res, 200, { success: true, comprehensive_assessments: assessments, errors })
+  } else if (req.method === 'GET' && (match = path.match(/^\/risk-patients\/([^/]+)\/comprehensive$/))) {
+    const index = Number(decodeURIComponent(match[1])) - 1
+    if (!(index >= 0 && index < scenario.patients)) {
+      sendJson(res, 404, { success: false, error: 'Patient not found' })
+      return
+    }
+    sendJson(res, 200, { success: true, comprehensive_assessment: makeComprehensive(makePatient(index)) })
+  } else if (req.method === 'GET' && path === '/patients') {
+    const page = Math.max(1, Number(url.searchParams.get('page')) || 1)
+    const perPage = Math.max(1, Number(url.searchParams.get('per_page')) || 10)
+    sendJson(res, 200, {
+      success: true,
+      patients: patientsInRange(scenario, (page - 1) * perPage, page * perPage),
+      total: scenario.patients,
+      pages: Math.ceil(scenario.patients / perPage),
+      current_page: page
+    })
+  } else if (req.method === 'GET' && path === '/patients/with-risks/stream') {
+    await streamPatients(req, res, url, server)
+  } else if (req.method === 'GET' && path === '/events/stream' && scenario.events) {
+    streamEvents(req, res, server)
+  } else if (req.method === 'POST' && path === '/call-requests/batch') {
+    await scheduleCallRequests(req, res, server)
+  } else if (req.method === 'GET' && path.startsWith('/weather-onecall/')) {
+    sendJson(res, 200, { success: true, weather: { current: { temp: 31.5, humidity: 64, feels_like: 35.2 } } })
+  } else if (req.method === 'GET' && path.startsWith('/weather-ai-analysis/')) {
+    sendJson(res, 200, { success: true, risk_level: 'medium', summary: 'Hot and humid afternoon' })
+  } else if (req.method === 'GET' && path === '/environment-metrics') {
+    sendJson(res, 200, { success: true, environment_metrics: { average_temperature: 31.5, patients_at_risk: 12 } })
+  } else {
+    sendJson(res, 404, { success: false, error: 'Not found' })
+  }
+}
+
+/**
+ * Start a mock backend. Port 0 picks a free port; `url` is the API base URL to configure.
+ */
+export function createMockServer({ port = 0, scenario = {} } = {}) {
+  const server = {
+    url: '',
+    scenario: createScenario(scenario),
+    stats: createStats(),
+    events: [],
+    eventClients: new Set(),
+    pushEvent: (type, data) => {
+      const event = { id: server.events.length + 1, type, data }
+      server.events.push(event)
+      server.eventClients.forEach(res => writeEvent(res, event))
+    },
+    // Cut off every event stream, as a dropped connection would
+    dropEventStreams: () => {
+      server.eventClients.forEach(res => res.destroy())
+      server.eventClients.clear()
+    },
+    close: () => new Promise(resolve => {
+      httpServer.closeAllConnections()
+      httpServer.close(() => resolve())
+    })
+  }
+
+  const httpServer = http.createServer((req, res) => {
+    res.setHeader('Access-Control-Allow-Origin', '*')
+    res.setHeader('Access-Control-Allow-Headers', '*')
+    handle(req, res, server).catch(error => {
+      console.error('Mock server error:', error)
+      if (!res.headersSent) sendJson(res, 500, { success: false, error: String(error) })
+      else res.destroy()
+    })
+  })
+
+  return new Promise((resolve, reject) => {
+    httpServer.once('error', reject)
+    httpServer.listen(port, '127.0.0.1', () => {
+      server.url = `http://127.0.0.1:${httpServer.address().port}/api`
+      resolve(server)
+    })
+  })
+}
+
+if (process.argv[1] === fileURLToPath(import.meta.url)) {
+  const port = Number(process.env.PORT) || DEFAULT_PORT
+  createMockServer({ port, scenario: { patients: Number(process.env.PATIENTS) || 5000 } }).then(server => {
+    console.log(`Mock API listening on ${server.url}`)
+  })
+}
@@ -1,8 +1,11 @@
-import React from 'react'
+import React, { useState } from 'react'
+import { requestCall } from '../data/adapter'
+import { useOutboxStatus } from '../hooks/useOutboxStatus'
 
 interface DoctorNotificationModalProps {
   isOpen: boolean
   onClose: () => void
+  messageId: string
   patientRisk: 'medium' | 'high'
   assessmentRating: number
 }
@@ -14,11 +17,33 @@ interface DoctorNotificationModalProps {
 const DoctorNotificationModal: React.FC<DoctorNotificationModalProps> = ({
   isOpen,
   onClose,
+  messageId,
   patientRisk,
   assessmentRating
 }) => {
+  const [callRequested, setCallRequested] = useState(false)
+  const outbox = useOutboxStatus()
+
   if (!isOpen) return null
 
+  const handleRequestCall = () => {
+    setCallRequested(true)
+    requestCall(messageId).catch(() => setCallRequested(false))
+  }
+
+  // What the outbox knows, rather than assuming the request went through
+  const getCallStatus = () => {
+    if (outbox.failed > 0) {
+      return `${outbox.failed} call request${outbox.failed === 1 ? ' was' : 's were'} rejected by the medical team's system`
+    }
+    if (outbox.pending > 0) {
+      const waiting = `${outbox.pending} call request${outbox.pending === 1 ? '' : 's'} waiting to be sent`
+      return outbox.lastError ? `${waiting} (will retry: ${outbox.lastError})` : waiting
+    }
+    return callRequested ? 'Call request delivered to the medical team' : null
+  }
+  const callStatus = getCallStatus()
+
   const getRiskMessage = () => {
     if (patientRisk === 'high') {
       return "Dr. Fitzpatrick's team has received your assessment and will review your information."
@@ -91,6 +116,12 @@ const DoctorNotificationModal: React.FC<DoctorNotificationModalProps> = ({
           </div>
         </div>
 
+        {callStatus && (
+          <p className={`text-sm mb-4 ${outbox.failed > 0 ? 'text-red-700' : 'text-gray-600'}`} role="status">
+            {callStatus}
+          </p>
+        )}
+
         {/* Actions */}
         <div className="flex gap-3">
           <button
@@ -100,13 +131,11 @@ const DoctorNotificationModal: React.FC<DoctorNotificationModalProps> = ({
             Understood
           </button>
           <button
-            onClick={() => {
-              // In a real app, this would request a call from the medical team
-              alert('Request for medical team call has been submitted')
-            }}
-            className="px-4 py-2 bg-blue-600 text-white rounded-lg hover:bg-blue-700 transition-colors focus:outline-none focus:ring-2 focus:ring-blue-500 focus:ring-offset-2"
+            onClick={handleRequestCall}
+            disabled={callRequested}
+            className="px-4 py-2 bg-blue-600 text-white rounded-lg hover:bg-blue-700 transition-colors focus:outline-none focus:ring-2 focus:ring-blue-500 focus:ring-offset-2 disabled:opacity-50 disabled:cursor-not-allowed"
           >
-            Request Call
+            {callRequested ? 'Call Requested' : 'Request Call'}
           </button>
         </div>
       </div>
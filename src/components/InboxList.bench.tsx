@@ -0,0 +1,82 @@
+// @vitest-environment jsdom
+import React from 'react'
+import { afterAll, bench, describe } from 'vitest'
+import { cleanup, render } from '@testing-library/react'
+import { Message } from '../types'
+import InboxList from './InboxList'
+import MessageRow from './MessageRow'
+
+const MESSAGE_COUNT = 50000
+// Mounting every row of 50k messages exhausts jsdom, so the unvirtualized baseline uses fewer
+const BASELINE_COUNT = 5000
+
+const makeMessages = (count: number): Message[] =>
+  Array.from({ length: count }, (_, index) => ({
+    id: String(index + 1),
+    patientName: `Patient ${index + 1}`,
+    risk: (['low', 'medium', 'high'] as const)[index % 3],
+    subject: 'Heat risk assessment',
+    preview: 'Monitor for heat stress and keep hydrated.',
+    createdAt: new Date(Date.UTC(2024, 6, 1) + index * 60 * 1000).toISOString(),
+    read: index % 4 === 0
+  }))
+
+const messages = makeMessages(MESSAGE_COUNT)
+const baselineMessages = messages.slice(0, BASELINE_COUNT)
+const handleOpen = () => {}
+const handleToggleRead = () => {}
+
+// jsdom does no layout, so there is nothing to observe
+globalThis.ResizeObserver ??= class {
+  observe() {}
+  unobserve() {}
+  disconnect() {}
+}
+
+// Rows in the DOM and heap growth after the last mount of each case
+const results: Record<string, { rows: number; heapMb: number }> = {}
+
+const measureMount = (name: string, element: React.ReactElement) => {
+  const heapBefore = process.memoryUsage().heapUsed
+  const { container } = render(element)
+  results[name] = {
+    // Virtualized rows carry their key; the baseline's rows are the children of its wrapper
+    rows: container.querySelectorAll('[data-virtual-key]').length || (container.firstElementChild?.childElementCount ?? 0),
+    heapMb: (process.memoryUsage().heapUsed - heapBefore) / 1024 / 1024
+  }
+}
+
+afterAll(() => {
+  Object.entries(results).forEach(([name, { rows, heapMb }]) => {
+    console.log(`${name}: ${rows} rows mounted, heap +${heapMb.toFixed(1)}MB`)
+  })
+})
+
+describe('InboxList mount', () => {
+  bench(`virtualized, ${MESSAGE_COUNT} messages`, () => {
+    measureMount('virtualized', (
+      <InboxList messages={messages} filter="all" onOpenMessage={handleOpen} onToggleRead={handleToggleRead} />
+    ))
+    cleanup()
+  }, { iterations: 10, time: 0 })
+
+  bench(`virtualized, ${MESSAGE_COUNT} messages, then switching to the unread filter`, () => {
+    const element = (filter: 'all' | 'unread') => (
+      <InboxList messages={messages} filter={filter} onOpenMessage={handleOpen} onToggleRead={handleToggleRead} />
+    )
+    const { rerender } = render(element('all'))
+    rerender(element('unread'))
+    cleanup()
+  }, { iterations: 10, time: 0 })
+
+  bench(`every row mounted, ${BASELINE_COUNT} messages`, () => {
+    measureMount('every row', (
+      <div className="divide-y divide-gray-200">
+        {baselineMessages.map(message => (
+          <MessageRow key={message.id} message={message} onOpen={handleOpen} onToggleRead={handleToggleRead} />
+        ))}
+      </div>
+    ))
+    cleanup()
+  }, { iterations: 3, time: 0 })
+})
@@ -1,26 +1,38 @@
-import React from 'react'
+import React, { useCallback, useMemo, useRef } from 'react'
 import { Message, FilterType } from '../types'
+import { prefetchMessage } from '../data/adapter'
 import MessageRow from './MessageRow'
+import VirtualList from './VirtualList'
 
 interface InboxListProps {
   messages: Message[]
   filter: FilterType
   onOpenMessage: (message: Message) => void
   onToggleRead: (messageId: string) => void
+  // Ids matching the current search, or null when not searching
+  searchResults?: Set<string> | null
 }
 
+const getMessageKey = (message: Message) => message.id
+
+const handlePrefetch = (message: Message) => prefetchMessage(message.id)
+
 /**
  * InboxList component displays the filtered list of messages
  * Shows empty state when no messages match the current filter
+ * Only the rows in view are mounted, so large inboxes stay responsive
  */
 const InboxList: React.FC<InboxListProps> = ({
   messages,
   filter,
   onOpenMessage,
-  onToggleRead
+  onToggleRead,
+  searchResults = null
 }) => {
   // Filter messages based on current filter
-  const filteredMessages = messages.filter((message) => {
+  const filteredMessages = useMemo(() => messages.filter((message) => {
+    if (searchResults && !searchResults.has(message.id)) return false
+    
     switch (filter) {
       case 'unread':
         return !message.read
@@ -31,7 +43,21 @@ const InboxList: React.FC<InboxListProps> = ({
       default:
         return true // 'all'
     }
-  })
+  }), [messages, filter, searchResults])
+
+  const filteredRef = useRef(filteredMessages)
+  filteredRef.current = filteredMessages
+
+  // Open a message and warm the details of its neighbours for next/previous navigation
+  const handleOpen = useCallback((message: Message) => {
+    onOpenMessage(message)
+
+    const list = filteredRef.current
+    const index = list.indexOf(message)
+    if (index === -1) return
+    if (index > 0) prefetchMessage(list[index - 1].id)
+    if (index < list.length - 1) prefetchMessage(list[index + 1].id)
+  }, [onOpenMessage])
 
   // Show empty state if no messages
   if (filteredMessages.length === 0) {
@@ -58,7 +84,9 @@ const InboxList: React.FC<InboxListProps> = ({
           <p className="text-gray-500 mb-4">
             {messages.length === 0 
               ? 'Connect your data source to start receiving health notifications.'
-              : `No messages found for "${filter}" filter. Try a different filter.`
+              : searchResults
+                ? 'No messages match your search. Try different search terms.'
+                : `No messages found for "${filter}" filter. Try a different filter.`
             }
           </p>
           {messages.length === 0 && (
@@ -78,16 +106,22 @@ const InboxList: React.FC<InboxListProps> = ({
 
   return (
     <div className="bg-white border border-gray-200 rounded-lg overflow-hidden">
-      <div className="divide-y divide-gray-200">
-        {filteredMessages.map((message) => (
+      <VirtualList
+        items={filteredMessages}
+        getKey={getMessageKey}
+        estimatedItemHeight={77}
+        className="max-h-[70vh] overflow-y-auto custom-scrollbar"
+        itemsClassName="divide-y divide-gray-200"
+        ariaLabel="Messages"
+        renderItem={(message) => (
           <MessageRow
-            key={message.id}
             message={message}
-            onOpen={onOpenMessage}
+            onOpen={handleOpen}
             onToggleRead={onToggleRead}
+            onPrefetch={handlePrefetch}
           />
-        ))}
-      </div>
+        )}
+      />
     </div>
   )
 }
@@ -6,6 +6,8 @@ interface InboxToolbarProps {
   onFilterChange: (filter: FilterType) => void
   onRefresh: () => void
   onLoadSampleData?: () => void
+  searchQuery?: string
+  onSearchChange?: (query: string) => void
 }
 
 /**
@@ -15,7 +17,9 @@ const InboxToolbar: React.FC<InboxToolbarProps> = ({
   currentFilter,
   onFilterChange,
   onRefresh,
-  onLoadSampleData
+  onLoadSampleData,
+  searchQuery,
+  onSearchChange
 }) => {
   const filters: { value: FilterType; label: string }[] = [
     { value: 'all', label: 'All' },
@@ -48,6 +52,18 @@ const InboxToolbar: React.FC<InboxToolbarProps> = ({
 
         {/* Action buttons */}
         <div className="flex items-center gap-2">
+          {/* Message search */}
+          {onSearchChange && (
+            <input
+              type="search"
+              placeholder="Search messages..."
+              value={searchQuery ?? ''}
+              onChange={(e) => onSearchChange(e.target.value)}
+              className="px-3 py-1.5 text-sm border border-gray-300 rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500 focus:border-transparent"
+              aria-label="Search messages"
+            />
+          )}
+
           {/* Development only: Load sample data button */}
           {onLoadSampleData && (
             <button
@@ -0,0 +1,76 @@
+// @vitest-environment jsdom
+import { afterEach, beforeAll, describe, expect, it, vi } from 'vitest'
+import { cleanup, render } from '@testing-library/react'
+import { Message } from '../types'
+import { readState, applyReadState } from '../data/readState'
+import { useMenu } from '../hooks/useMenu'
+import InboxList from './InboxList'
+
+// MessageRow calls useMenu exactly once per render, so its calls count row renders
+vi.mock('../hooks/useMenu', async importOriginal => {
+  const actual = await importOriginal<typeof import('../hooks/useMenu')>()
+  return { useMenu: vi.fn(actual.useMenu) }
+})
+
+const makeMessages = (count: number): Message[] =>
+  Array.from({ length: count }, (_, index) => ({
+    id: String(index + 1),
+    patientName: `Patient ${index + 1}`,
+    risk: 'medium',
+    subject: 'Moderate heat risk',
+    preview: 'Monitor for heat stress.',
+    createdAt: '2024-07-01T00:00:00.000Z',
+    read: false
+  }))
+
+// Stable callbacks, as Home passes them
+const handleOpen = () => {}
+const handleToggleRead = () => {}
+
+describe('MessageRow', () => {
+  beforeAll(() => {
+    // jsdom does no layout, so there is nothing to observe
+    globalThis.ResizeObserver ??= class {
+      observe() {}
+      unobserve() {}
+      disconnect() {}
+    }
+  })
+
+  afterEach(() => {
+    cleanup()
+    vi.mocked(useMenu).mockClear()
+  })
+
+  it('re-renders only the row whose read state was toggled', () => {
+    const messages = makeMessages(20)
+    const { container, rerender } = render(
+      <InboxList messages={messages} filter="all" onOpenMessage={handleOpen} onToggleRead={handleToggleRead} />
+    )
+    expect(container.querySelectorAll('[data-virtual-key]')).toHaveLength(20)
+    const rendersBefore = vi.mocked(useMenu).mock.calls.length
+
+    readState.setRead('5', true)
+    rerender(
+      <InboxList messages={applyReadState(messages)} filter="all" onOpenMessage={handleOpen} onToggleRead={handleToggleRead} />
+    )
+
+    expect(vi.mocked(useMenu).mock.calls.length - rendersBefore).toBe(1)
+    const toggledRow = container.querySelector('[data-virtual-key="5"] span.font-medium')
+    expect(toggledRow?.classList.contains('font-semibold')).toBe(false)
+  })
+
+  it('does not re-render any row when the list is refreshed with equal messages', () => {
+    const messages = makeMessages(20)
+    const { rerender } = render(
+      <InboxList messages={messages} filter="all" onOpenMessage={handleOpen} onToggleRead={handleToggleRead} />
+    )
+    const rendersBefore = vi.mocked(useMenu).mock.calls.length
+
+    rerender(
+      <InboxList messages={[...messages]} filter="all" onOpenMessage={handleOpen} onToggleRead={handleToggleRead} />
+    )
+
+    expect(vi.mocked(useMenu).mock.calls.length).toBe(rendersBefore)
+  })
+})
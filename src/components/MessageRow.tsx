@@ -1,35 +1,33 @@
-import React, { useState, useRef, useEffect } from 'react'
+import React from 'react'
 import { Message } from '../types'
+import { useMenu } from '../hooks/useMenu'
+import { useHoverIntent } from '../hooks/useHoverIntent'
+
+// How long the pointer has to rest on a row before its details are prefetched
+const PREFETCH_HOVER_DELAY = 120
 
 interface MessageRowProps {
   message: Message
   onOpen: (message: Message) => void
   onToggleRead: (messageId: string) => void
+  // Called after a short hover, or on focus, so details can load before the row is opened
+  onPrefetch?: (message: Message) => void
 }
 
 /**
  * MessageRow component displays a single message in the inbox list
  * Includes risk indicator, patient info, and action menu
+ * Memoized: with stable callbacks only rows whose message changed re-render
  */
 const MessageRow: React.FC<MessageRowProps> = ({
   message,
   onOpen,
-  onToggleRead
+  onToggleRead,
+  onPrefetch
 }) => {
-  const [showMenu, setShowMenu] = useState(false)
-  const menuRef = useRef<HTMLDivElement>(null)
-
-  // Close menu when clicking outside
-  useEffect(() => {
-    const handleClickOutside = (event: MouseEvent) => {
-      if (menuRef.current && !menuRef.current.contains(event.target as Node)) {
-        setShowMenu(false)
-      }
-    }
-
-    document.addEventListener('mousedown', handleClickOutside)
-    return () => document.removeEventListener('mousedown', handleClickOutside)
-  }, [])
+  // Closes on clicks outside the menu container
+  const menu = useMenu<HTMLDivElement>()
+  const hoverIntent = useHoverIntent(onPrefetch && (() => onPrefetch(message)), PREFETCH_HOVER_DELAY)
 
   const formatTimestamp = (timestamp: string) => {
     const date = new Date(timestamp)
@@ -67,6 +65,9 @@ const MessageRow: React.FC<MessageRowProps> = ({
       }`}
       onClick={handleRowClick}
       onKeyDown={handleKeyDown}
+      onMouseEnter={hoverIntent.onMouseEnter}
+      onMouseLeave={hoverIntent.onMouseLeave}
+      onFocus={onPrefetch && (() => onPrefetch(message))}
       tabIndex={0}
       role="button"
       aria-label={`Open message from ${message.patientName}`}
@@ -94,11 +95,11 @@ const MessageRow: React.FC<MessageRowProps> = ({
           </span>
           
           {/* More menu */}
-          <div className="relative" data-menu>
+          <div ref={menu.containerRef} className="relative" data-menu>
             <button
               onClick={(e) => {
                 e.stopPropagation()
-                setShowMenu(!showMenu)
+                menu.toggle()
               }}
               className="p-1 text-gray-400 hover:text-gray-600 focus:outline-none focus:text-gray-600"
               aria-label="Message options"
@@ -114,9 +115,8 @@ const MessageRow: React.FC<MessageRowProps> = ({
             </button>
 
             {/* Dropdown menu */}
-            {showMenu && (
+            {menu.isOpen && (
               <div
-                ref={menuRef}
                 className="absolute right-0 top-8 w-48 bg-white border border-gray-200 rounded-lg shadow-lg z-10"
                 role="menu"
               >
@@ -124,7 +124,7 @@ const MessageRow: React.FC<MessageRowProps> = ({
                   onClick={(e) => {
                     e.stopPropagation()
                     onToggleRead(message.id)
-                    setShowMenu(false)
+                    menu.close()
                   }}
                   className="w-full px-4 py-2 text-left text-sm text-gray-700 hover:bg-gray-100 focus:bg-gray-100 focus:outline-none"
                   role="menuitem"
@@ -147,4 +147,4 @@ const MessageRow: React.FC<MessageRowProps> = ({
   )
 }
 
-export default MessageRow
+export default React.memo(MessageRow)
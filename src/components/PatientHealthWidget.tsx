@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react'
 import { Message } from '../types'
-import { getEnvironmentMetrics } from '../data/adapter'
+import { getEnvironmentMetrics, isAbortError } from '../data/adapter'
 
 interface PatientHealthWidgetProps {
   messages: Message[]
@@ -22,14 +22,17 @@ const PatientHealthWidget: React.FC<PatientHealthWidgetProps> = ({
 
   // Load environment metrics on component mount
   useEffect(() => {
-    loadEnvironmentMetrics()
+    const controller = new AbortController()
+    loadEnvironmentMetrics(controller.signal)
+    return () => controller.abort()
   }, [])
 
-  const loadEnvironmentMetrics = async () => {
+  const loadEnvironmentMetrics = async (signal?: AbortSignal) => {
     try {
-      const data = await getEnvironmentMetrics()
+      const data = await getEnvironmentMetrics(signal)
       setEnvironmentMetrics(data)
     } catch (error) {
+      if (isAbortError(error)) return
       console.error('Error loading environment metrics:', error)
       setEnvironmentMetrics(null)
     }
@@ -0,0 +1,49 @@
+// @vitest-environment jsdom
+import React, { Profiler } from 'react'
+import { afterAll, bench, describe, vi } from 'vitest'
+import { cleanup, render, screen } from '@testing-library/react'
+import { createMockServer } from '../../mock/server.js'
+
+const PATIENT_COUNT = 50000
+const FRAME_BUDGET_MS = 1000 / 60
+
+// The transport reads its base URL when it loads, so point it at the mock first
+const server = await createMockServer({ scenario: { patients: PATIENT_COUNT } })
+vi.stubEnv('VITE_API_BASE_URL', server.url)
+
+// jsdom does no layout, so there is nothing to observe
+globalThis.ResizeObserver ??= class {
+  observe() {}
+  unobserve() {}
+  disconnect() {}
+}
+
+// Longest single commit of each run; anything above the frame budget drops a frame at 60fps
+const longestCommits: number[] = []
+
+afterAll(async () => {
+  await server.close()
+  const longest = Math.max(...longestCommits)
+  console.log(`Longest commit while streaming: ${longest.toFixed(1)}ms (60fps budget ${FRAME_BUDGET_MS.toFixed(1)}ms)`)
+})
+
+describe(`PatientInfoWidget streaming ${PATIENT_COUNT} patients`, () => {
+  bench('stream to completion with tuned batch sizes', async () => {
+    // A fresh stream manager every run, so nothing is replayed from the previous one
+    vi.resetModules()
+    const { default: PatientInfoWidget } = await import('./PatientInfoWidget')
+
+    let longest = 0
+    const onRender: React.ProfilerOnRenderCallback = (_id, _phase, actualDuration) => {
+      longest = Math.max(longest, actualDuration)
+    }
+    render(
+      <Profiler id="patients" onRender={onRender}>
+        <PatientInfoWidget loading={false} onRefresh={() => {}} />
+      </Profiler>
+    )
+    await screen.findByText('Stream Complete', undefined, { timeout: 120 * 1000 })
+    cleanup()
+    longestCommits.push(longest)
+  }, { iterations: 3, time: 0 })
+})
@@ -1,48 +1,143 @@
-import React, { useState, useEffect, useRef } from 'react'
-import { streamAllPatients } from '../data/adapter'
+import React, { useState, useEffect, useLayoutEffect, useRef, startTransition } from 'react'
+import { PatientInfo, getPatientSearchText } from '../data/patients'
+import { SearchIndex } from '../data/searchIndex'
+import { ChunkedList } from '../data/chunkedList'
+import { createPatientComparator, mergeSorted, PatientSortField, SortOrder } from '../data/sortedView'
+import { RISK_LEVEL_PARTITIONS } from '../data/adapter'
+import { subscribePatientStream, restartPatientStream, reportCommitTime, SharedStreamOptions } from '../data/streamManager'
+import VirtualList from './VirtualList'
+import { useDebouncedValue } from '../hooks/useDebouncedValue'
+import { usePatient } from '../hooks/usePatientStore'
 
 /**
  * Patient Information Widget - detailed patient list with filtering and sorting
  * Shows comprehensive patient data for medical professionals
  */
 
-interface PatientInfo {
-  id: string
-  name: string
-  age: number
-  gender: 'M' | 'F' | 'Other'
-  riskLevel: 'low' | 'medium' | 'high'
-  lastAssessment: string
-  conditions: string[]
-  medications: string[]
-  emergencyContact: string
-  lastUpdate: string
-  status: 'active' | 'monitoring' | 'critical'
-  // API-specific fields from /api/patients endpoint
-  patient_id?: number
-  zip_code?: string
-  phone_number?: string
-  email?: string
-  address?: string
-  pregnancy_weeks?: number
-  trimester?: number
-  pregnancy_description?: string
-  risk_score?: number
-  heat_wave_risk?: boolean
-  created_at?: string
-  updated_at?: string
-}
-
 interface PatientInfoWidgetProps {
   loading: boolean
   onRefresh: () => void
 }
 
+const getRiskColor = (risk: string) => {
+  switch (risk) {
+    case 'high':
+      return 'bg-red-100 text-red-800 border-red-200'
+    case 'medium':
+      return 'bg-yellow-100 text-yellow-800 border-yellow-200'
+    case 'low':
+      return 'bg-green-100 text-green-800 border-green-200'
+    default:
+      return 'bg-gray-100 text-gray-800 border-gray-200'
+  }
+}
+
+const getStatusColor = (status: string) => {
+  switch (status) {
+    case 'critical':
+      return 'bg-red-500'
+    case 'monitoring':
+      return 'bg-yellow-500'
+    case 'active':
+      return 'bg-green-500'
+    default:
+      return 'bg-gray-500'
+  }
+}
+
+const formatTimeAgo = (timestamp: string) => {
+  const now = new Date()
+  const time = new Date(timestamp)
+  const diffInMinutes = Math.floor((now.getTime() - time.getTime()) / (1000 * 60))
+  
+  if (diffInMinutes < 60) return `${diffInMinutes}m ago`
+  
+  const diffInHours = Math.floor(diffInMinutes / 60)
+  if (diffInHours < 24) return `${diffInHours}h ago`
+  
+  const diffInDays = Math.floor(diffInHours / 24)
+  return `${diffInDays}d ago`
+}
+
+interface PatientRowProps {
+  patient: PatientInfo
+  onSelect: (patient: PatientInfo) => void
+}
+
+/**
+ * Single patient row; memoized so appended batches don't re-render existing rows
+ */
+const PatientRow = React.memo<PatientRowProps>(({ patient, onSelect }) => (
+  <div
+    className="px-6 py-4 hover:bg-gray-50 transition-colors cursor-pointer"
+    onClick={() => onSelect(patient)}
+  >
+    <div className="flex items-center justify-between">
+      <div className="flex items-center gap-4">
+        {/* Status indicator */}
+        <div className={`w-3 h-3 rounded-full ${getStatusColor(patient.status)}`} />
+        
+        {/* Patient info */}
+        <div>
+          <div className="flex items-center gap-2">
+            <span className="font-medium text-gray-900">{patient.name}</span>
+            <span className="text-sm text-gray-500">({patient.age} years, {patient.gender})</span>
+            <span className={`inline-flex items-center px-2 py-0.5 rounded-full text-xs font-medium border ${getRiskColor(patient.riskLevel)}`}>
+              {patient.riskLevel}
+            </span>
+          </div>
+          <div className="text-sm text-gray-600">
+            Conditions: {patient.conditions.slice(0, 2).join(', ')}
+            {patient.conditions.length > 2 && ` +${patient.conditions.length - 2} more`}
+          </div>
+        </div>
+      </div>
+      
+      <div className="text-right">
+        <div className="text-sm text-gray-500">{patient.lastAssessment}</div>
+        <div className="text-xs text-gray-400">{formatTimeAgo(patient.lastUpdate)}</div>
+      </div>
+    </div>
+  </div>
+))
+
+const getPatientKey = (patient: PatientInfo) => patient.id
+
+// A streamed batch waiting for the next commit; resolving it lets the stream read on
+interface QueuedBatch {
+  patients: PatientInfo[]
+  processedCount: number
+  totalPatients: number
+  resolve: () => void
+}
+
+// Batches appended in one commit, acknowledged once React has rendered them
+interface PendingCommit {
+  patientCount: number
+  resolvers: Array<() => void>
+}
+
 const PatientInfoWidget: React.FC<PatientInfoWidgetProps> = ({
   loading,
   onRefresh
 }) => {
-  const [patients, setPatients] = useState<PatientInfo[]>([])
+  // Streamed patients live in an append-only chunked list; the version drives re-renders
+  const patientsRef = useRef(new ChunkedList<PatientInfo>())
+  const [patientsVersion, setPatientsVersion] = useState(0)
+  // Full-text index over loaded patients, updated as each batch arrives
+  const searchIndexRef = useRef(new SearchIndex())
+  // Batches received since the last frame are coalesced into one commit
+  const batchQueueRef = useRef<QueuedBatch[]>([])
+  const commitScheduledRef = useRef(false)
+  const pendingCommitsRef = useRef<PendingCommit[]>([])
+  // Main-thread time spent on pending commits so far: appending, filtering, rendering
+  const commitCostRef = useRef(0)
+  // Pending commits the filter effect has folded into the next filtered view
+  const filteredCommitsRef = useRef(0)
+  // When the current render began; a layout effect closes the measurement
+  const renderStartedAtRef = useRef(0)
+  renderStartedAtRef.current = performance.now()
+  const filterStateRef = useRef({ processed: 0, epoch: 0, filterCriteria: '', sortCriteria: '' })
   const [filteredPatients, setFilteredPatients] = useState<PatientInfo[]>([])
   const [apiLoading, setApiLoading] = useState(false)
   const [error, setError] = useState<string | null>(null)
@@ -54,200 +149,246 @@ const PatientInfoWidget: React.FC<PatientInfoWidgetProps> = ({
     summary: null as any
   })
   const [displayMode, setDisplayMode] = useState<'streaming' | 'pagination'>('streaming')
-  const abortControllerRef = useRef<AbortController | null>(null)
-  const [filters, setFilters] = useState({
+  const unsubscribeRef = useRef<(() => void) | null>(null)
+  // Server-side parameters restart the stream; client-side filters only re-filter loaded data
+  const [serverFilters, setServerFilters] = useState({
     riskLevel: 'all',
+    location: ''
+  })
+  const [clientFilters, setClientFilters] = useState({
     status: 'all',
     search: ''
   })
-  const [sortBy, setSortBy] = useState<'name' | 'risk' | 'lastUpdate'>('name')
-  const [sortOrder, setSortOrder] = useState<'asc' | 'desc'>('asc')
-  const [selectedPatient, setSelectedPatient] = useState<PatientInfo | null>(null)
+  const debouncedSearch = useDebouncedValue(clientFilters.search, 200)
+  const [sortBy, setSortBy] = useState<PatientSortField>('name')
+  const [sortOrder, setSortOrder] = useState<SortOrder>('asc')
+  const [selectedRow, setSelectedRow] = useState<PatientInfo | null>(null)
+  // Details are read from the shared store, so they stay current while the modal is open
+  const selectedPatient = usePatient(selectedRow?.id)?.info ?? selectedRow
+
+  // Start streaming on mount and restart only when server-side filters change
+  useEffect(() => {
+    if (displayMode === 'streaming') {
+      startStreamingPatients()
+    }
+  }, [serverFilters.riskLevel, serverFilters.location])
 
-  // Start streaming when component mounts
+  // Cleanup on unmount
   useEffect(() => {
-    startStreamingPatients()
-    
-    // Cleanup on unmount
     return () => {
       stopStreaming()
     }
-  }, []) // Empty dependency array for initial load only
-
-  // Restart streaming when filters change
-  useEffect(() => {
-    if (displayMode === 'streaming') {
-      startStreamingPatients()
+  }, [])
+
+  // Append every queued batch in one low-priority commit
+  const commitQueuedBatches = () => {
+    commitScheduledRef.current = false
+    const queued = batchQueueRef.current
+    batchQueueRef.current = []
+    if (queued.length === 0) return
+    
+    const startedAt = performance.now()
+    let patientCount = 0
+    for (const batch of queued) {
+      patientsRef.current.append(batch.patients)
+      for (const patient of batch.patients) {
+        searchIndexRef.current.add(patient.id, getPatientSearchText(patient))
+      }
+      patientCount += batch.patients.length
     }
-  }, [filters]) // Restart stream when filters change
-
-  // Transform patient data from API to PatientInfo format
-  const transformPatientData = (patient: any): PatientInfo => {
-    // Determine status based on risk score or heat wave risk
-    let status: 'active' | 'monitoring' | 'critical'
-    let riskLevel: 'low' | 'medium' | 'high'
     
-    if (patient.risk_score >= 8 || patient.heat_wave_risk) {
-      riskLevel = 'high'
-      status = 'critical'
-    } else if (patient.risk_score >= 5) {
-      riskLevel = 'medium'
-      status = 'monitoring'
+    const resolvers = queued.map(batch => batch.resolve)
+    if (patientCount === 0) {
+      // Nothing to render, so no commit will acknowledge these
+      resolvers.forEach(resolve => resolve())
     } else {
-      riskLevel = 'low'
-      status = 'active'
+      commitCostRef.current += performance.now() - startedAt
+      pendingCommitsRef.current.push({ patientCount, resolvers })
     }
     
-    return {
-      id: patient.patient_id?.toString() || patient.id?.toString() || 'unknown',
-      name: patient.name || 'Unknown Patient',
-      age: patient.age || 28,
-      gender: (patient.gender || 'F') as 'M' | 'F' | 'Other',
-      riskLevel,
-      lastAssessment: `Assessment completed ${new Date(patient.updated_at || patient.created_at || Date.now()).toLocaleDateString()}`,
-      conditions: patient.pregnancy_weeks ? [`Pregnancy - ${patient.pregnancy_weeks} weeks`] : ['No conditions listed'],
-      medications: patient.medications || ['Prenatal Vitamins'],
-      emergencyContact: patient.phone_number || '+1 (555) 123-4567',
-      lastUpdate: patient.updated_at || patient.created_at || new Date().toISOString(),
-      status,
-      // Store original API data
-      ...patient
+    const last = queued[queued.length - 1]
+    startTransition(() => {
+      setPatientsVersion(patientsRef.current.version)
+      setStreamingData(prev => ({
+        ...prev,
+        processedCount: last.processedCount,
+        totalPatients: last.totalPatients
+      }))
+    })
+  }
+
+  const scheduleCommit = () => {
+    if (commitScheduledRef.current) return
+    commitScheduledRef.current = true
+    // Animation frames don't run in background tabs; don't stall the stream there
+    if (document.hidden) {
+      setTimeout(commitQueuedBatches, 0)
+    } else {
+      requestAnimationFrame(commitQueuedBatches)
     }
   }
 
+  // Acknowledge everything still waiting on this widget, so a shared stream never stalls on it
+  const releasePendingBatches = () => {
+    batchQueueRef.current.forEach(batch => batch.resolve())
+    batchQueueRef.current = []
+    pendingCommitsRef.current.forEach(commit => commit.resolvers.forEach(resolve => resolve()))
+    pendingCommitsRef.current = []
+    filteredCommitsRef.current = 0
+    commitCostRef.current = 0
+  }
+
+  // Drop loaded patients before a new or restarted stream delivers
+  const resetPatients = () => {
+    releasePendingBatches()
+    patientsRef.current.clear()
+    searchIndexRef.current = new SearchIndex()
+    setPatientsVersion(patientsRef.current.version)
+    setStreamingData(prev => ({ ...prev, processedCount: 0, totalPatients: 0, summary: null }))
+  }
+
   // Start streaming patient data
-  const startStreamingPatients = async () => {
-    try {
-      // Cancel any existing stream
-      if (abortControllerRef.current) {
-        abortControllerRef.current.abort()
-      }
+  // The stream is shared: another widget (or this one before a remount) may already
+  // be receiving it, in which case its batches so far are replayed at once
+  const startStreamingPatients = (restart = false) => {
+    // Leave any existing stream
+    unsubscribeRef.current?.()
+    
+    setApiLoading(true)
+    setError(null)
+    resetPatients()
+    setStreamingData(prev => ({ ...prev, isStreaming: true }))
+    
+    // Prepare streaming options based on current filters
+    // The batch size is left to the stream manager, which tunes it to commit speed
+    const options: SharedStreamOptions = {
+      includeAiSuggestions: true,
+      includeNotifications: true,
+      resumable: true, // Reconnect and resume after dropped connections
+      ...(serverFilters.riskLevel !== 'all' && { riskLevel: serverFilters.riskLevel as 'low' | 'medium' | 'high' }),
+      // The whole cohort streams as one connection per risk level, high risk first
+      ...(serverFilters.riskLevel === 'all' && { partitions: RISK_LEVEL_PARTITIONS }),
+      ...(serverFilters.location && { location: serverFilters.location })
+    }
+    
+    // Refresh downloads everything again for every widget sharing the stream
+    if (restart) restartPatientStream(options)
+    
+    // Fetching, parsing and transformation run in a Web Worker
+    unsubscribeRef.current = subscribePatientStream(options, {
+      // Resolves once the batch has been rendered, which paces the stream to the UI
+      onBatch: (patients: PatientInfo[], processedCount: number, totalPatients: number) => new Promise<void>(resolve => {
+        batchQueueRef.current.push({ patients, processedCount, totalPatients, resolve })
+        scheduleCommit()
+      }),
       
-      setApiLoading(true)
-      setError(null)
-      setPatients([])
-      setStreamingData(prev => ({ ...prev, isStreaming: true, processedCount: 0, totalPatients: 0 }))
+      onMetadata: (metadata: any) => {
+        setStreamingData(prev => ({
+          ...prev,
+          metadata,
+          totalPatients: metadata.total_patients || 0
+        }))
+      },
       
-      // Create new abort controller
-      abortControllerRef.current = new AbortController()
+      onSummary: (summary: any) => {
+        setStreamingData(prev => ({
+          ...prev,
+          summary,
+          isStreaming: false
+        }))
+        setApiLoading(false)
+      },
       
-      // Prepare streaming options based on current filters
-      const options = {
-        batchSize: 20, // Process 20 patients per batch for smooth UI updates
-        includeAiSuggestions: true,
-        includeNotifications: true,
-        ...(filters.riskLevel !== 'all' && { riskLevel: filters.riskLevel as 'low' | 'medium' | 'high' })
-      }
+      onError: (errorMessage: string) => {
+        setError(errorMessage)
+        setStreamingData(prev => ({ ...prev, isStreaming: false }))
+        setApiLoading(false)
+      },
       
-      await streamAllPatients(
-        // onBatch callback
-        (newPatients: any[], processedCount: number, totalPatients: number) => {
-          const transformedPatients = newPatients.map(transformPatientData)
-          
-          setPatients(prev => [...prev, ...transformedPatients])
-          setStreamingData(prev => ({
-            ...prev,
-            processedCount,
-            totalPatients
-          }))
-        },
-        
-        // onMetadata callback
-        (metadata: any) => {
-          setStreamingData(prev => ({
-            ...prev,
-            metadata,
-            totalPatients: metadata.total_patients || 0
-          }))
-        },
-        
-        // onSummary callback
-        (summary: any) => {
-          setStreamingData(prev => ({
-            ...prev,
-            summary,
-            isStreaming: false
-          }))
-          setApiLoading(false)
-        },
-        
-        // onError callback
-        (errorMessage: string) => {
-          setError(errorMessage)
-          setStreamingData(prev => ({ ...prev, isStreaming: false }))
-          setApiLoading(false)
-        },
-        
-        options
-      )
-    } catch (error) {
-      console.error('Error starting patient stream:', error)
-      setError('Failed to start patient data stream. Please try again.')
-      setStreamingData(prev => ({ ...prev, isStreaming: false }))
-      setApiLoading(false)
-    }
+      // Another subscriber asked for a fresh download
+      onReset: () => {
+        resetPatients()
+        setError(null)
+        setApiLoading(true)
+        setStreamingData(prev => ({ ...prev, isStreaming: true }))
+      },
+      
+      onEnd: () => {
+        setStreamingData(prev => ({ ...prev, isStreaming: false }))
+        setApiLoading(false)
+      }
+    })
   }
 
-  // Stop streaming
+  // Stop streaming; the connection closes once no other widget is subscribed
   const stopStreaming = () => {
-    if (abortControllerRef.current) {
-      abortControllerRef.current.abort()
-    }
+    unsubscribeRef.current?.()
+    unsubscribeRef.current = null
+    releasePendingBatches()
     setStreamingData(prev => ({ ...prev, isStreaming: false }))
     setApiLoading(false)
   }
 
-  // Filter and sort patients
+  // Filter and sort patients, feeding only newly appended patients through the filters
   useEffect(() => {
-    let filtered = [...patients]
-
-    // Apply filters
-    if (filters.riskLevel !== 'all') {
-      filtered = filtered.filter(p => p.riskLevel === filters.riskLevel)
-    }
+    const startedAt = performance.now()
+    const list = patientsRef.current
+    const state = filterStateRef.current
+    const filterCriteria = JSON.stringify([serverFilters.riskLevel, clientFilters.status, debouncedSearch])
+    const sortCriteria = `${sortBy}-${sortOrder}`
+    const compare = createPatientComparator(sortBy, sortOrder)
     
-    if (filters.status !== 'all') {
-      filtered = filtered.filter(p => p.status === filters.status)
+    // Only the sort changed: re-sort the current view once
+    if (filterCriteria === state.filterCriteria && state.epoch === list.epoch &&
+        state.processed === list.length && sortCriteria !== state.sortCriteria) {
+      state.sortCriteria = sortCriteria
+      setFilteredPatients(prev => [...prev].sort(compare))
+      return
     }
     
-    if (filters.search) {
-      filtered = filtered.filter(p => 
-        p.name.toLowerCase().includes(filters.search.toLowerCase()) ||
-        p.conditions.some(c => c.toLowerCase().includes(filters.search.toLowerCase()))
-      )
-    }
-
-    // Apply sorting
-    filtered.sort((a, b) => {
-      let aValue: any, bValue: any
-      
-      switch (sortBy) {
-        case 'name':
-          aValue = a.name
-          bValue = b.name
-          break
-        case 'risk':
-          const riskOrder = { high: 3, medium: 2, low: 1 }
-          aValue = riskOrder[a.riskLevel]
-          bValue = riskOrder[b.riskLevel]
-          break
-        case 'lastUpdate':
-          aValue = new Date(a.lastUpdate)
-          bValue = new Date(b.lastUpdate)
-          break
-        default:
-          return 0
-      }
-      
-      if (sortOrder === 'asc') {
-        return aValue > bValue ? 1 : -1
-      } else {
-        return aValue < bValue ? 1 : -1
-      }
-    })
+    const incremental = filterCriteria === state.filterCriteria && sortCriteria === state.sortCriteria &&
+      state.epoch === list.epoch
+    // Prefix and fuzzy matches from the search index
+    const searchMatches = debouncedSearch.trim() ? searchIndexRef.current.search(debouncedSearch) : null
+    
+    // Apply filters in a single pass over the new patients
+    const matches = list.slice(incremental ? state.processed : 0).filter(p =>
+      (serverFilters.riskLevel === 'all' || p.riskLevel === serverFilters.riskLevel) &&
+      (clientFilters.status === 'all' || p.status === clientFilters.status) &&
+      (!searchMatches || searchMatches.has(p.id))
+    )
+    
+    state.processed = list.length
+    state.epoch = list.epoch
+    state.filterCriteria = filterCriteria
+    state.sortCriteria = sortCriteria
 
-    setFilteredPatients(filtered)
-  }, [patients, filters, sortBy, sortOrder])
+    // Sort the new batch on its own and merge it into the sorted view
+    setFilteredPatients(prev => mergeSorted(incremental ? prev : [], matches, compare))
+    
+    // The pending batches are acknowledged once this filtered view has rendered
+    if (pendingCommitsRef.current.length > 0) {
+      filteredCommitsRef.current = pendingCommitsRef.current.length
+      commitCostRef.current += performance.now() - startedAt
+    }
+  }, [patientsVersion, serverFilters.riskLevel, clientFilters.status, debouncedSearch, sortBy, sortOrder])
+
+  // Time each render and commit while batches are pending, and acknowledge the batches
+  // once the filtered view includes them. Only work on the main thread is counted, not
+  // the wait for a frame or for the transition to be scheduled, so the measured cost per
+  // patient tunes the batch size. (Profiler timings are not collected in production builds.)
+  useLayoutEffect(() => {
+    if (pendingCommitsRef.current.length === 0) return
+    commitCostRef.current += performance.now() - renderStartedAtRef.current
+    
+    const covered = filteredCommitsRef.current
+    if (covered === 0) return
+    filteredCommitsRef.current = 0
+    const commits = pendingCommitsRef.current.splice(0, covered)
+    reportCommitTime(commits.reduce((sum, commit) => sum + commit.patientCount, 0), commitCostRef.current)
+    commitCostRef.current = 0
+    commits.forEach(commit => commit.resolvers.forEach(resolve => resolve()))
+  }, [patientsVersion, filteredPatients])
 
   // Display logic for streaming vs pagination
   const currentPatients = filteredPatients
@@ -257,7 +398,7 @@ const PatientInfoWidget: React.FC<PatientInfoWidgetProps> = ({
 
   const handleRefresh = () => {
     if (displayMode === 'streaming') {
-      startStreamingPatients()
+      startStreamingPatients(true)
     }
     onRefresh()
   }
@@ -269,46 +410,6 @@ const PatientInfoWidget: React.FC<PatientInfoWidgetProps> = ({
     }
   }
 
-  const getRiskColor = (risk: string) => {
-    switch (risk) {
-      case 'high':
-        return 'bg-red-100 text-red-800 border-red-200'
-      case 'medium':
-        return 'bg-yellow-100 text-yellow-800 border-yellow-200'
-      case 'low':
-        return 'bg-green-100 text-green-800 border-green-200'
-      default:
-        return 'bg-gray-100 text-gray-800 border-gray-200'
-    }
-  }
-
-  const getStatusColor = (status: string) => {
-    switch (status) {
-      case 'critical':
-        return 'bg-red-500'
-      case 'monitoring':
-        return 'bg-yellow-500'
-      case 'active':
-        return 'bg-green-500'
-      default:
-        return 'bg-gray-500'
-    }
-  }
-
-  const formatTimeAgo = (timestamp: string) => {
-    const now = new Date()
-    const time = new Date(timestamp)
-    const diffInMinutes = Math.floor((now.getTime() - time.getTime()) / (1000 * 60))
-    
-    if (diffInMinutes < 60) return `${diffInMinutes}m ago`
-    
-    const diffInHours = Math.floor(diffInMinutes / 60)
-    if (diffInHours < 24) return `${diffInHours}h ago`
-    
-    const diffInDays = Math.floor(diffInHours / 24)
-    return `${diffInDays}d ago`
-  }
-
   return (
     <div className="bg-white rounded-lg shadow-sm border border-gray-200">
       {/* Header */}
@@ -391,16 +492,16 @@ const PatientInfoWidget: React.FC<PatientInfoWidgetProps> = ({
             <input
               type="text"
               placeholder="Search patients..."
-              value={filters.search}
-              onChange={(e) => setFilters(prev => ({ ...prev, search: e.target.value }))}
+              value={clientFilters.search}
+              onChange={(e) => setClientFilters(prev => ({ ...prev, search: e.target.value }))}
               className="w-full px-3 py-2 text-sm border border-gray-300 rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500 focus:border-transparent"
             />
           </div>
 
           {/* Risk Level Filter */}
           <select
-            value={filters.riskLevel}
-            onChange={(e) => setFilters(prev => ({ ...prev, riskLevel: e.target.value }))}
+            value={serverFilters.riskLevel}
+            onChange={(e) => setServerFilters(prev => ({ ...prev, riskLevel: e.target.value }))}
             className="px-3 py-2 text-sm border border-gray-300 rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500 focus:border-transparent"
           >
             <option value="all">All Risk Levels</option>
@@ -411,8 +512,8 @@ const PatientInfoWidget: React.FC<PatientInfoWidgetProps> = ({
 
           {/* Status Filter */}
           <select
-            value={filters.status}
-            onChange={(e) => setFilters(prev => ({ ...prev, status: e.target.value }))}
+            value={clientFilters.status}
+            onChange={(e) => setClientFilters(prev => ({ ...prev, status: e.target.value }))}
             className="px-3 py-2 text-sm border border-gray-300 rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500 focus:border-transparent"
           >
             <option value="all">All Status</option>
@@ -442,72 +543,54 @@ const PatientInfoWidget: React.FC<PatientInfoWidgetProps> = ({
       </div>
 
       {/* Patient List */}
-      <div className="divide-y divide-gray-200 max-h-96 overflow-y-auto">
-        {error ? (
-          <div className="px-6 py-8 text-center">
-            <svg className="w-12 h-12 text-red-300 mx-auto mb-4" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-              <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={1} d="M12 9v2m0 4h.01m-6.938 4h13.856c1.54 0 2.502-1.667 1.732-2.5L13.732 4c-.77-.833-1.964-.833-2.732 0L4.082 16.5c-.77.833.192 2.5 1.732 2.5z" />
-            </svg>
-            <h4 className="text-sm font-medium text-red-900 mb-1">Error loading patients</h4>
-            <p className="text-sm text-red-600 mb-4">{error}</p>
-            <button
-              onClick={handleRefresh}
-              className="px-4 py-2 text-sm font-medium text-white bg-red-600 border border-transparent rounded-md hover:bg-red-700 focus:outline-none focus:ring-2 focus:ring-red-500 focus:ring-offset-2"
-            >
-              Try Again
-            </button>
-          </div>
-        ) : apiLoading ? (
-          <div className="px-6 py-8 text-center">
-            <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-blue-600 mx-auto mb-4"></div>
-            <h4 className="text-sm font-medium text-gray-900 mb-1">Loading patients...</h4>
-            <p className="text-sm text-gray-500">Fetching patient data from API</p>
-          </div>
-        ) : currentPatients.length === 0 ? (
-          <div className="px-6 py-8 text-center">
-            <svg className="w-12 h-12 text-gray-300 mx-auto mb-4" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-              <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={1} d="M17 20h5v-2a3 3 0 00-5.356-1.857M17 20H7m10 0v-2c0-.656-.126-1.283-.356-1.857M7 20H2v-2a3 3 0 015.356-1.857M7 20v-2c0-.656.126-1.283.356-1.857m0 0a5.002 5.002 0 019.288 0M15 7a3 3 0 11-6 0 3 3 0 016 0zm6 3a2 2 0 11-4 0 2 2 0 014 0zM7 10a2 2 0 11-4 0 2 2 0 014 0z" />
-            </svg>
-            <h4 className="text-sm font-medium text-gray-900 mb-1">No patients found</h4>
-            <p className="text-sm text-gray-500">Try adjusting your filters or search terms</p>
-          </div>
-        ) : (
-          currentPatients.map((patient) => (
-            <div
-              key={patient.id}
-              className="px-6 py-4 hover:bg-gray-50 transition-colors cursor-pointer"
-              onClick={() => setSelectedPatient(patient)}
-            >
-              <div className="flex items-center justify-between">
-                <div className="flex items-center gap-4">
-                  {/* Status indicator */}
-                  <div className={`w-3 h-3 rounded-full ${getStatusColor(patient.status)}`} />
-                  
-                  {/* Patient info */}
-                  <div>
-                    <div className="flex items-center gap-2">
-                      <span className="font-medium text-gray-900">{patient.name}</span>
-                      <span className="text-sm text-gray-500">({patient.age} years, {patient.gender})</span>
-                      <span className={`inline-flex items-center px-2 py-0.5 rounded-full text-xs font-medium border ${getRiskColor(patient.riskLevel)}`}>
-                        {patient.riskLevel}
-                      </span>
-                    </div>
-                    <div className="text-sm text-gray-600">
-                      Conditions: {patient.conditions.slice(0, 2).join(', ')}
-                      {patient.conditions.length > 2 && ` +${patient.conditions.length - 2} more`}
-                    </div>
-                  </div>
-                </div>
-                
-                <div className="text-right">
-                  <div className="text-sm text-gray-500">{patient.lastAssessment}</div>
-                  <div className="text-xs text-gray-400">{formatTimeAgo(patient.lastUpdate)}</div>
-                </div>
-              </div>
+      {error ? (
+        <div className="px-6 py-8 text-center">
+          <svg className="w-12 h-12 text-red-300 mx-auto mb-4" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+            <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={1} d="M12 9v2m0 4h.01m-6.938 4h13.856c1.54 0 2.502-1.667 1.732-2.5L13.732 4c-.77-.833-1.964-.833-2.732 0L4.082 16.5c-.77.833.192 2.5 1.732 2.5z" />
+          </svg>
+          <h4 className="text-sm font-medium text-red-900 mb-1">Error loading patients</h4>
+          <p className="text-sm text-red-600 mb-4">{error}</p>
+          <button
+            onClick={handleRefresh}
+            className="px-4 py-2 text-sm font-medium text-white bg-red-600 border border-transparent rounded-md hover:bg-red-700 focus:outline-none focus:ring-2 focus:ring-red-500 focus:ring-offset-2"
+          >
+            Try Again
+          </button>
+        </div>
+      ) : apiLoading && currentPatients.length === 0 ? (
+        <div className="px-6 py-8 text-center">
+          <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-blue-600 mx-auto mb-4"></div>
+          <h4 className="text-sm font-medium text-gray-900 mb-1">Loading patients...</h4>
+          <p className="text-sm text-gray-500">Fetching patient data from API</p>
+        </div>
+      ) : currentPatients.length === 0 ? (
+        <div className="px-6 py-8 text-center">
+          <svg className="w-12 h-12 text-gray-300 mx-auto mb-4" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+            <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={1} d="M17 20h5v-2a3 3 0 00-5.356-1.857M17 20H7m10 0v-2c0-.656-.126-1.283-.356-1.857M7 20H2v-2a3 3 0 015.356-1.857M7 20v-2c0-.656.126-1.283.356-1.857m0 0a5.002 5.002 0 019.288 0M15 7a3 3 0 11-6 0 3 3 0 016 0zm6 3a2 2 0 11-4 0 2 2 0 014 0zM7 10a2 2 0 11-4 0 2 2 0 014 0z" />
+          </svg>
+          <h4 className="text-sm font-medium text-gray-900 mb-1">No patients found</h4>
+          <p className="text-sm text-gray-500">Try adjusting your filters or search terms</p>
+        </div>
+      ) : (
+        // Rows stay mounted only while in view, so the list keeps scrolling smoothly as batches append
+        <VirtualList
+          items={currentPatients}
+          getKey={getPatientKey}
+          estimatedItemHeight={73}
+          className="max-h-96 overflow-y-auto"
+          itemsClassName="divide-y divide-gray-200"
+          ariaLabel="Patients"
+          header={
+            <div className="flex items-center justify-between px-6 py-2 bg-gray-50 border-b border-gray-200 text-xs font-medium text-gray-500 uppercase tracking-wider">
+              <span>Patient</span>
+              <span>Last Assessment</span>
             </div>
-          ))
-        )}
-      </div>
+          }
+          renderItem={(patient) => (
+            <PatientRow patient={patient} onSelect={setSelectedRow} />
+          )}
+        />
+      )}
 
       {/* Footer Information */}
       <div className="px-6 py-4 border-t border-gray-200 bg-gray-50">
@@ -539,7 +622,7 @@ const PatientInfoWidget: React.FC<PatientInfoWidgetProps> = ({
                 </button>
               ) : (
                 <button
-                  onClick={startStreamingPatients}
+                  onClick={() => startStreamingPatients(true)}
                   className="px-3 py-1 text-sm font-medium text-blue-600 bg-white border border-blue-300 rounded-md hover:bg-blue-50"
                 >
                   Restart Stream
@@ -558,7 +641,7 @@ const PatientInfoWidget: React.FC<PatientInfoWidgetProps> = ({
               <div className="flex items-center justify-between">
                 <h3 className="text-lg font-semibold text-gray-900">Patient Details</h3>
                 <button
-                  onClick={() => setSelectedPatient(null)}
+                  onClick={() => setSelectedRow(null)}
                   className="p-2 text-gray-400 hover:text-gray-600"
                 >
                   <svg className="w-5 h-5" fill="none" stroke="currentColor" viewBox="0 0 24 24">
@@ -1,6 +1,7 @@
 import React, { useState, useEffect } from 'react'
 import { Message } from '../types'
-import { getPatientNotifications } from '../data/adapter'
+import { getPatientNotifications, isAbortError, selectRiskNotifications } from '../data/adapter'
+import { usePatientStore } from '../hooks/usePatientStore'
 
 interface PatientNotificationWidgetProps {
   messages: Message[]
@@ -17,22 +18,29 @@ const PatientNotificationWidget: React.FC<PatientNotificationWidgetProps> = ({
   onRefresh,
   loading
 }) => {
-  const [notifications, setNotifications] = useState<any[]>([])
+  // Notifications are read from the shared patient store, so pushed risk changes show up here too
+  const storeNotifications = usePatientStore(selectRiskNotifications)
+  // Shown instead when the records have no patient ids and can't go into the store
+  const [fetchedNotifications, setFetchedNotifications] = useState<any[]>([])
+  const notifications = storeNotifications.length > 0 ? storeNotifications : fetchedNotifications
   const [showAll, setShowAll] = useState(false)
 
-  // Load patient notifications from API
+  // Make sure the risk list is loaded, cancelling the previous load
   useEffect(() => {
-    loadNotifications()
+    const controller = new AbortController()
+    loadNotifications(controller.signal)
+    return () => controller.abort()
   }, [messages])
 
-  const loadNotifications = async () => {
+  const loadNotifications = async (signal?: AbortSignal) => {
     try {
-      const data = await getPatientNotifications()
-      setNotifications(data)
+      const data = await getPatientNotifications(signal)
+      setFetchedNotifications(data)
     } catch (error) {
+      if (isAbortError(error)) return
       console.error('Error loading notifications:', error)
       // Fallback to empty array on error
-      setNotifications([])
+      setFetchedNotifications([])
     }
   }
 
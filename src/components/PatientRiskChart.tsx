@@ -239,4 +239,5 @@ const PatientRiskChart: React.FC<PatientRiskChartProps> = ({ messages, loading }
   )
 }
 
-export default PatientRiskChart
\ No newline at end of file
+// Refreshes that leave the message list unchanged skip re-rendering the chart
+export default React.memo(PatientRiskChart)
\ No newline at end of file
@@ -1,5 +1,6 @@
-import React, { useEffect, useRef, useState } from 'react'
+import React, { useEffect, useMemo, useRef, useState } from 'react'
 import { Message } from '../types'
+import { getMessage, getMessageBody, isAbortError, peekMessage } from '../data/adapter'
 import PainScaleAssessment from './PainScaleAssessment'
 import DoctorNotificationModal from './DoctorNotificationModal'
 
@@ -26,6 +27,34 @@ const RightPanel: React.FC<RightPanelProps> = ({
   const [showDoctorNotification, setShowDoctorNotification] = useState(false)
   const [assessmentRating, setAssessmentRating] = useState<number>(0)
 
+  const [loadedDetail, setLoadedDetail] = useState<Message | null>(null)
+
+  // Comprehensive details: served from the detail cache when prefetched, otherwise loaded on open
+  const detail = message
+    ? (loadedDetail?.id === message.id ? loadedDetail : peekMessage(message.id)) ?? null
+    : null
+
+  useEffect(() => {
+    if (!message || peekMessage(message.id)) return
+
+    const controller = new AbortController()
+    getMessage(message.id, controller.signal)
+      .then(result => {
+        if (result) setLoadedDetail({ ...result, id: message.id })
+      })
+      .catch(error => {
+        if (!isAbortError(error)) console.error('Error loading message details:', error)
+      })
+    return () => controller.abort()
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [message?.id])
+
+  // Fall back to the list body, built lazily the first time a message is opened
+  const body = useMemo(
+    () => detail?.body ?? (message ? getMessageBody(message) : ''),
+    [detail, message]
+  )
+
   // Reset assessment state when message changes or panel opens
   useEffect(() => {
     setAssessmentCompleted(false)
@@ -206,7 +235,7 @@ const RightPanel: React.FC<RightPanelProps> = ({
           {/* Message Content */}
           <div className="prose prose-sm max-w-none mb-6">
             <p className="text-gray-700 leading-relaxed whitespace-pre-wrap">
-              {message.body}
+              {body}
             </p>
           </div>
 
@@ -242,6 +271,7 @@ const RightPanel: React.FC<RightPanelProps> = ({
       <DoctorNotificationModal
         isOpen={showDoctorNotification}
         onClose={() => setShowDoctorNotification(false)}
+        messageId={message.id}
         patientRisk={message.risk as 'medium' | 'high'}
         assessmentRating={assessmentRating}
       />
@@ -0,0 +1,238 @@
+import React, { useCallback, useEffect, useLayoutEffect, useMemo, useRef, useState } from 'react'
+
+interface VirtualListProps<T> {
+  items: T[]
+  getKey: (item: T) => string
+  renderItem: (item: T, index: number) => React.ReactNode
+  estimatedItemHeight: number
+  overscan?: number
+  className?: string
+  itemsClassName?: string
+  ariaLabel?: string
+  // Rendered above the rows and kept in view while scrolling
+  header?: React.ReactNode
+}
+
+interface ScrollAnchor {
+  key: string
+  delta: number
+}
+
+// Usable viewport height; a max-height container may not have grown yet
+const getViewportHeight = (element: HTMLElement) => {
+  const maxHeight = parseFloat(getComputedStyle(element).maxHeight)
+  if (Number.isFinite(maxHeight)) return Math.max(element.clientHeight, maxHeight)
+  return element.clientHeight || window.innerHeight
+}
+
+// Index of the row containing `offset` (largest i with offsets[i] <= offset)
+const findIndex = (offsets: Float64Array, count: number, offset: number) => {
+  let low = 0
+  let high = count - 1
+  while (low < high) {
+    const mid = (low + high + 1) >> 1
+    if (offsets[mid] <= offset) low = mid
+    else high = mid - 1
+  }
+  return Math.max(0, low)
+}
+
+/**
+ * VirtualList component renders only the rows inside the scroll viewport plus an overscan margin
+ * Row heights are measured after render, so rows may vary in height
+ */
+function VirtualList<T>({
+  items,
+  getKey,
+  renderItem,
+  estimatedItemHeight,
+  overscan = 5,
+  className = '',
+  itemsClassName = '',
+  ariaLabel,
+  header
+}: VirtualListProps<T>) {
+  const containerRef = useRef<HTMLDivElement>(null)
+  const headerRef = useRef<HTMLDivElement>(null)
+  const anchorRef = useRef<ScrollAnchor | null>(null)
+  const pendingFocusRef = useRef<number | null>(null)
+  // Measured row heights by key; replaced (not mutated) when a measurement changes
+  const [heights, setHeights] = useState(() => new Map<string, number>())
+  const [scrollTop, setScrollTop] = useState(0)
+  const [viewportHeight, setViewportHeight] = useState(0)
+  const [headerHeight, setHeaderHeight] = useState(0)
+
+  // Prefix sums of row heights, recomputed when items change or rows are measured
+  const offsets = useMemo(() => {
+    const result = new Float64Array(items.length + 1)
+    for (let i = 0; i < items.length; i++) {
+      result[i + 1] = result[i] + (heights.get(getKey(items[i])) ?? estimatedItemHeight)
+    }
+    return result
+  }, [items, getKey, estimatedItemHeight, heights])
+
+  const totalHeight = offsets[items.length]
+  // Scroll position relative to the first row, below the header
+  const rowsScrollTop = Math.max(0, scrollTop - headerHeight)
+  const firstVisible = findIndex(offsets, items.length, rowsScrollTop)
+  const lastVisible = findIndex(offsets, items.length, rowsScrollTop + viewportHeight)
+  const start = Math.max(0, firstVisible - overscan)
+  const end = Math.min(items.length, lastVisible + overscan + 1)
+
+  // Track the viewport size
+  useLayoutEffect(() => {
+    const container = containerRef.current
+    if (!container) return
+
+    setHeaderHeight(headerRef.current?.offsetHeight ?? 0)
+    setViewportHeight(getViewportHeight(container))
+    const observer = new ResizeObserver(() => setViewportHeight(getViewportHeight(container)))
+    observer.observe(container)
+    return () => observer.disconnect()
+  }, [])
+
+  // Measure rendered rows; re-render before paint if any height changed
+  useLayoutEffect(() => {
+    const container = containerRef.current
+    if (!container) return
+
+    let measured: Map<string, number> | null = null
+    for (const element of container.querySelectorAll<HTMLElement>('[data-virtual-key]')) {
+      const key = element.dataset.virtualKey as string
+      const height = element.offsetHeight
+      if (heights.get(key) !== height) {
+        measured ??= new Map(heights)
+        measured.set(key, height)
+      }
+    }
+    if (measured) setHeights(measured)
+
+    // Move focus to a row requested by keyboard navigation once it is mounted
+    if (pendingFocusRef.current !== null) {
+      const row = container.querySelector<HTMLElement>(`[data-virtual-index="${pendingFocusRef.current}"]`)
+      if (row) {
+        const focusable = row.querySelector<HTMLElement>('[tabindex], button, a, input') || row
+        focusable.focus({ preventScroll: true })
+        pendingFocusRef.current = null
+      }
+    }
+  })
+
+  // Keep the anchored row in place when the item list changes (filter switch or appended rows)
+  useLayoutEffect(() => {
+    const container = containerRef.current
+    const anchor = anchorRef.current
+    if (!container || !anchor) return
+
+    const index = items.findIndex(item => getKey(item) === anchor.key)
+    const target = index === -1 ? 0 : headerHeight + offsets[index] + anchor.delta
+    if (Math.abs(container.scrollTop - target) > 1) {
+      container.scrollTop = target
+      setScrollTop(container.scrollTop)
+    }
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [items])
+
+  // Remember the first visible row so scroll position survives list changes
+  useEffect(() => {
+    // At the very top there is nothing to preserve; new rows may appear above
+    if (items.length === 0 || scrollTop === 0) {
+      anchorRef.current = null
+      return
+    }
+    const index = Math.min(firstVisible, items.length - 1)
+    anchorRef.current = { key: getKey(items[index]), delta: rowsScrollTop - offsets[index] }
+  }, [items, getKey, offsets, firstVisible, scrollTop, rowsScrollTop])
+
+  const handleScroll = useCallback((e: React.UIEvent<HTMLDivElement>) => {
+    setScrollTop(e.currentTarget.scrollTop)
+  }, [])
+
+  // Arrow/Home/End move focus between rows, scrolling unmounted rows into view
+  const handleKeyDown = (e: React.KeyboardEvent<HTMLDivElement>) => {
+    const container = containerRef.current
+    const row = (e.target as HTMLElement).closest<HTMLElement>('[data-virtual-index]')
+    if (!container || !row || items.length === 0) return
+
+    const current = Number(row.dataset.virtualIndex)
+    let next: number
+    switch (e.key) {
+      case 'ArrowDown':
+        next = Math.min(items.length - 1, current + 1)
+        break
+      case 'ArrowUp':
+        next = Math.max(0, current - 1)
+        break
+      case 'Home':
+        next = 0
+        break
+      case 'End':
+        next = items.length - 1
+        break
+      default:
+        return
+    }
+    e.preventDefault()
+
+    // Row edges in container coordinates; the header covers the top of the viewport
+    const rowTop = headerHeight + offsets[next]
+    const rowBottom = headerHeight + offsets[next + 1]
+    if (rowTop < container.scrollTop + headerHeight) {
+      container.scrollTop = rowTop - headerHeight
+    } else if (rowBottom > container.scrollTop + viewportHeight) {
+      container.scrollTop = rowBottom - viewportHeight
+    }
+
+    const mounted = container.querySelector<HTMLElement>(`[data-virtual-index="${next}"]`)
+    if (mounted) {
+      const focusable = mounted.querySelector<HTMLElement>('[tabindex], button, a, input') || mounted
+      focusable.focus({ preventScroll: true })
+    } else {
+      pendingFocusRef.current = next
+    }
+    setScrollTop(container.scrollTop)
+  }
+
+  const visibleRows: React.ReactNode[] = []
+  for (let index = start; index < end; index++) {
+    const item = items[index]
+    const key = getKey(item)
+    visibleRows.push(
+      <div
+        key={key}
+        role="listitem"
+        aria-setsize={items.length}
+        aria-posinset={index + 1}
+        data-virtual-key={key}
+        data-virtual-index={index}
+      >
+        {renderItem(item, index)}
+      </div>
+    )
+  }
+
+  return (
+    <div
+      ref={containerRef}
+      className={className}
+      onScroll={handleScroll}
+      onKeyDown={handleKeyDown}
+    >
+      {header && (
+        <div ref={headerRef} className="sticky top-0 z-10">
+          {header}
+        </div>
+      )}
+      <div
+        role="list"
+        aria-label={ariaLabel}
+        className={itemsClassName}
+        style={{ paddingTop: offsets[start], paddingBottom: totalHeight - offsets[end] }}
+      >
+        {visibleRows}
+      </div>
+    </div>
+  )
+}
+
+export default VirtualList
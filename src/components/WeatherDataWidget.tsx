@@ -1,5 +1,24 @@
 import React, { useState, useEffect } from 'react'
-import { getWeatherData, getWeatherRiskAnalysis } from '../data/adapter'
+import {
+  getWeatherData,
+  getWeatherRiskAnalysis,
+  getSnapshotWeather,
+  subscribeLiveUpdates,
+  getLiveConnectionState,
+  subscribeLiveConnectionState,
+  LiveConnectionState,
+  isAbortError
+} from '../data/adapter'
+
+// Combine weather data with its AI risk analysis
+const combineWeatherData = (weatherResponse: any, riskAnalysisResponse: any) => ({
+  ...weatherResponse,
+  risk_level: riskAnalysisResponse?.ai_analysis?.risk_level || 'Unknown',
+  health_concerns: riskAnalysisResponse?.ai_analysis?.health_concerns || [],
+  recommendations: riskAnalysisResponse?.ai_analysis?.immediate_recommendations || [],
+  is_heat_wave: weatherResponse.temperature > 35 || weatherResponse.heat_index > 40,
+  timestamp: new Date()
+})
 
 /**
  * Weather Data Widget - displays current weather conditions and heat risk analysis
@@ -12,41 +31,62 @@ const WeatherDataWidget: React.FC = () => {
 
   // Simulate weather data fetch
   useEffect(() => {
-    loadWeatherData()
+    const controller = new AbortController()
+
+    // Show the last saved conditions until the first fetch completes
+    getSnapshotWeather('101000').then(saved => {
+      if (controller.signal.aborted || !saved?.weather) return
+      setWeatherData((current: any) => current ?? combineWeatherData(saved.weather, saved.analysis))
+    })
+    loadWeatherData(controller.signal)
+    
+    // Pushed weather updates refresh the query cache; re-read it when one arrives
+    const unsubscribe = subscribeLiveUpdates(update => {
+      if (update.type === 'weather' && update.locationCode === '101000') {
+        loadWeatherData(controller.signal)
+      }
+    })
     
-    // Refresh every 5 minutes
-    const interval = setInterval(loadWeatherData, 5 * 60 * 1000)
-    return () => clearInterval(interval)
+    // Poll every 5 minutes while the push connection is not open
+    let interval: ReturnType<typeof setInterval> | null = null
+    const updatePolling = (state: LiveConnectionState) => {
+      if (state === 'open') {
+        if (interval !== null) clearInterval(interval)
+        interval = null
+      } else if (interval === null) {
+        interval = setInterval(() => loadWeatherData(controller.signal), 5 * 60 * 1000)
+      }
+    }
+    updatePolling(getLiveConnectionState())
+    const unsubscribeState = subscribeLiveConnectionState(updatePolling)
+    
+    return () => {
+      unsubscribe()
+      unsubscribeState()
+      if (interval !== null) clearInterval(interval)
+      controller.abort()
+    }
   }, [])
 
-  const loadWeatherData = async () => {
+  const loadWeatherData = async (signal?: AbortSignal) => {
     try {
       setLoading(true)
       
       // Fetch weather data and risk analysis from API
       const [weatherResponse, riskAnalysisResponse] = await Promise.all([
-        getWeatherData('101000'), // Default location code
-        getWeatherRiskAnalysis('101000')
+        getWeatherData('101000', signal), // Default location code
+        getWeatherRiskAnalysis('101000', signal)
       ])
       
       if (weatherResponse) {
-        // Combine weather data with risk analysis
-        const combinedData = {
-          ...weatherResponse,
-          risk_level: riskAnalysisResponse?.ai_analysis?.risk_level || 'Unknown',
-          health_concerns: riskAnalysisResponse?.ai_analysis?.health_concerns || [],
-          recommendations: riskAnalysisResponse?.ai_analysis?.immediate_recommendations || [],
-          is_heat_wave: weatherResponse.temperature > 35 || weatherResponse.heat_index > 40,
-          timestamp: new Date()
-        }
-        
-        setWeatherData(combinedData)
+        setWeatherData(combineWeatherData(weatherResponse, riskAnalysisResponse))
         setLastUpdated(new Date())
       } else {
         // Fallback to default data if API fails
         setWeatherData(null)
       }
     } catch (error) {
+      if (isAbortError(error)) return
       console.error('Error loading weather data:', error)
       setWeatherData(null)
     } finally {
@@ -103,7 +143,7 @@ const WeatherDataWidget: React.FC = () => {
               </span>
             )}
             <button
-              onClick={loadWeatherData}
+              onClick={() => loadWeatherData()}
               disabled={loading}
               className="p-2 text-gray-400 hover:text-gray-600 focus:outline-none focus:text-gray-600 disabled:opacity-50"
             >
@@ -0,0 +1,203 @@
+import { afterAll, afterEach, describe, expect, it, vi } from 'vitest'
+import { createMockServer, MockScenario } from '../../mock/server.js'
+
+// The transport reads its base URL when it loads, so point it at the mock first
+const server = await createMockServer({ scenario: { patients: 5000, streamBatchDelayMs: 5 } })
+vi.stubEnv('VITE_API_BASE_URL', server.url)
+const { streamAllPatients, getMessage } = await import('./adapter')
+
+const initialScenario: MockScenario = { ...server.scenario }
+
+afterAll(() => server.close())
+
+const sleep = (ms: number) => new Promise(resolve => setTimeout(resolve, ms))
+const noop = () => {}
+
+describe('streamAllPatients', () => {
+  it('stops consuming bytes from a superseded stream', async () => {
+    const superseded = new AbortController()
+    let batchesAfterAbort = 0
+    let current: Promise<void> | null = null
+
+    const first = streamAllPatients(() => {
+      if (superseded.signal.aborted) {
+        batchesAfterAbort++
+        return
+      }
+      // A filter change replaces the stream after its first batch
+      superseded.abort()
+      current = streamAllPatients(noop, noop, noop, noop, { riskLevel: 'high', batchSize: 50 })
+    }, noop, noop, noop, { signal: superseded.signal, batchSize: 20 })
+
+    await first
+    expect(current).not.toBeNull()
+    await current
+
+    // Both streams are over: the byte count stops growing and only the superseded one was cut off
+    const bytes = server.stats.streamBytes
+    await sleep(200)
+    expect(server.stats.streamBytes).toBe(bytes)
+    expect(server.stats.streamsAborted).toBe(1)
+    expect(batchesAfterAbort).toBe(0)
+  })
+
+  it('resolves promptly when aborted mid-stream', async () => {
+    const controller = new AbortController()
+    const onSummary = vi.fn()
+    const streamed = streamAllPatients(() => controller.abort(), noop, onSummary, noop, {
+      signal: controller.signal,
+      batchSize: 20
+    })
+
+    const startedAt = performance.now()
+    await streamed
+    expect(performance.now() - startedAt).toBeLessThan(1000)
+    expect(onSummary).not.toHaveBeenCalled()
+  })
+})
+
+describe('streamAllPatients in resumable mode', () => {
+  afterEach(() => {
+    Object.assign(server.scenario, initialScenario)
+  })
+
+  const collect = () => {
+    const ids: string[] = []
+    const progress: number[] = []
+    const onBatch = (patients: any[], processedCount: number) => {
+      ids.push(...patients.map(patient => String(patient.patient_id)))
+      progress.push(processedCount)
+    }
+    return { ids, progress, onBatch }
+  }
+
+  const isNonDecreasing = (values: number[]) => values.every((value, index) => index === 0 || value >= values[index - 1])
+
+  it('resumes from the cursor after dropped connections without duplicating rows', async () => {
+    Object.assign(server.scenario, { patients: 300, streamBatchDelayMs: 0, streamDisconnects: 2, streamDisconnectAfterBatches: 3 })
+    const dropsBefore = server.stats.streamsDropped
+    const requestsBefore = server.stats.requests.length
+    const { ids, progress, onBatch } = collect()
+    const onReconnect = vi.fn()
+    const onSummary = vi.fn()
+
+    await streamAllPatients(onBatch, noop, onSummary, noop, { resumable: true, retryDelayMs: 10, batchSize: 20, onReconnect })
+
+    expect(server.stats.streamsDropped - dropsBefore).toBe(2)
+    expect(onReconnect).toHaveBeenCalledTimes(2)
+    expect(onSummary).toHaveBeenCalledTimes(1)
+    expect(ids).toHaveLength(300)
+    expect(new Set(ids).size).toBe(300)
+    expect(isNonDecreasing(progress)).toBe(true)
+    expect(progress[progress.length - 1]).toBe(300)
+
+    // Each reconnect asks to continue after the last patient received
+    const resumed = server.stats.requests.slice(requestsBefore).filter(request => request.path.includes('resume_from='))
+    expect(resumed.map(request => new URLSearchParams(request.path.split('?')[1]).get('after_patient_id'))).toEqual(['60', '120'])
+  })
+
+  it('drops repeated rows and holds progress when the server ignores the resume parameters', async () => {
+    Object.assign(server.scenario, {
+      patients: 300,
+      streamBatchDelayMs: 0,
+      streamDisconnects: 1,
+      streamDisconnectAfterBatches: 5,
+      streamIgnoreResume: true
+    })
+    const { ids, progress, onBatch } = collect()
+
+    await streamAllPatients(onBatch, noop, noop, noop, { resumable: true, retryDelayMs: 10, batchSize: 20 })
+
+    expect(ids).toHaveLength(300)
+    expect(new Set(ids).size).toBe(300)
+    // The restarted connection counts from zero again; reported progress must not
+    expect(isNonDecreasing(progress)).toBe(true)
+    expect(progress[progress.length - 1]).toBe(300)
+  })
+
+  it('resumes with a retuned batch size mid-stream', async () => {
+    Object.assign(server.scenario, { patients: 300, streamBatchDelayMs: 5 })
+    const requestsBefore = server.stats.requests.length
+    const { ids, progress, onBatch } = collect()
+    const onReconnect = vi.fn()
+    // The consumer turns out to be fast after a few batches and asks for three times as many rows
+    const getBatchSize = () => (ids.length >= 60 ? 60 : 20)
+
+    await streamAllPatients(onBatch, noop, noop, noop, { resumable: true, retryDelayMs: 10, getBatchSize, onReconnect })
+
+    expect(onReconnect).not.toHaveBeenCalled()
+    expect(ids).toHaveLength(300)
+    expect(new Set(ids).size).toBe(300)
+    expect(isNonDecreasing(progress)).toBe(true)
+
+    const streams = server.stats.requests.slice(requestsBefore).map(request => new URLSearchParams(request.path.split('?')[1]))
+    expect(streams.map(params => params.get('batch_size'))).toEqual(['20', '60'])
+    expect(streams[1].get('after_patient_id')).not.toBeNull()
+  })
+})
+
+describe('streamAllPatients over partitions', () => {
+  afterEach(() => {
+    Object.assign(server.scenario, initialScenario)
+  })
+
+  const partitions = [{ riskLevel: 'high' as const }, { riskLevel: 'medium' as const }, { riskLevel: 'low' as const }]
+
+  it('reports the combined total only once every partition has', async () => {
+    Object.assign(server.scenario, { patients: 300, streamBatchDelayMs: 0 })
+    const onMetadata = vi.fn()
+    const onSummary = vi.fn()
+    const totals: number[] = []
+
+    await streamAllPatients((_patients, _processed, total) => {
+      totals.push(total)
+    }, onMetadata, onSummary, noop, { partitions, batchSize: 20 })
+
+    expect(onMetadata).toHaveBeenCalledTimes(1)
+    expect(onMetadata.mock.calls[0][0].total_patients).toBe(300)
+    expect(totals.every(total => total === 0 || total === 300)).toBe(true)
+    expect(onSummary).toHaveBeenCalledTimes(1)
+    expect(onSummary.mock.calls[0][0].total_processed).toBe(300)
+  })
+
+  it('reports the failed partition instead of a summary', async () => {
+    // The first connection is cut off and, without resume, its partition ends there
+    Object.assign(server.scenario, { patients: 300, streamBatchDelayMs: 0, streamDisconnects: 1, streamDisconnectAfterBatches: 1 })
+    const onSummary = vi.fn()
+    const onError = vi.fn()
+
+    await streamAllPatients(noop, noop, onSummary, onError, { partitions, batchSize: 20 })
+
+    expect(onSummary).not.toHaveBeenCalled()
+    expect(onError).toHaveBeenCalledTimes(1)
+    expect(onError.mock.calls[0][0]).toMatch(/^(high|medium|low): /)
+  })
+})
+
+describe('getMessage', () => {
+  const requestsSince = (index: number, pattern: RegExp) =>
+    server.stats.requests.slice(index).filter(request => pattern.test(request.path))
+
+  it('loads messages requested together with one batch request', async () => {
+    const requestsBefore = server.stats.requests.length
+
+    const messages = await Promise.all(['11', '12', '13', '12', '999999'].map(id => getMessage(id)))
+
+    expect(messages.map(message => message?.id ?? null)).toEqual(['11', '12', '13', '12', null])
+    const batches = requestsSince(requestsBefore, /^\/risk-patients\/comprehensive\?/)
+    expect(batches).toHaveLength(1)
+    expect(decodeURIComponent(batches[0].path)).toContain('ids=11,12,13,999999')
+    expect(requestsSince(requestsBefore, /^\/risk-patients\/\d+\/comprehensive/)).toHaveLength(0)
+  })
+
+  it('falls back to per-patient requests when the batch endpoint is missing', async () => {
+    server.scenario.comprehensiveBatch = false
+    const requestsBefore = server.stats.requests.length
+
+    const messages = await Promise.all(['21', '22'].map(id => getMessage(id)))
+
+    expect(messages.map(message => message?.id)).toEqual(['21', '22'])
+    expect(requestsSince(requestsBefore, /^\/risk-patients\/\d+\/comprehensive/)).toHaveLength(2)
+    server.scenario.comprehensiveBatch = true
+  })
+})
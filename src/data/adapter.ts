@@ -1,133 +1,534 @@
 import { Message } from '../types';
+import { QueryCache, createAbortError } from './queryCache';
+import { NdjsonDecoder } from './ndjson';
+import { BatchLoader } from './batchLoader';
+import { CircuitOpenError, HttpError, delay, request, requestJson } from './transport';
+import { SnapshotData, WeatherSnapshot, compactPatientRecord, loadSnapshot, scheduleSnapshotSave } from './snapshot';
+import { patientStore, PatientEntity, getPatientRecordId } from './patientStore';
+import { readState, applyReadState } from './readState';
+import { enqueueCallRequest } from './outbox';
+import { LiveConnectionState, LiveEvent, LiveUpdatesClient } from './liveUpdates';
 
 /**
  * Data adapter for Health Notifier
  * 
  * This file contains API functions that connect to the backend health monitoring system.
- * Backend URL: http://10.57.1.173:5000/api
+ * Requests go through the transport layer, which resolves paths against the
+ * configured backend (VITE_API_BASE_URL, default http://10.57.1.173:5000/api)
+ * and handles timeouts, retries, fallback backends and the circuit breaker.
  */
 
-// Base URL for the backend API
-const API_BASE_URL = 'http://10.57.1.173:5000/api';
+// Cache lifetimes per endpoint (milliseconds)
+const QUERY_TTL = {
+  riskPatients: 60 * 1000,
+  comprehensive: 5 * 60 * 1000,
+  weather: 5 * 60 * 1000,
+  weatherAnalysis: 5 * 60 * 1000,
+  environmentMetrics: 2 * 60 * 1000,
+  patients: 60 * 1000
+};
+
+// Shared cache for all GET queries, keyed by request path
+const queryCache = new QueryCache(100);
+
+// Comprehensive message details, bounded by the approximate size of their text
+const DETAIL_CACHE_MAX_BYTES = 2 * 1024 * 1024;
+const detailCache = new QueryCache(500, QUERY_TTL.comprehensive, {
+  maxWeight: DETAIL_CACHE_MAX_BYTES,
+  weigh: value => estimateMessageBytes(value as Message)
+});
 
 /**
- * Fetch all messages for the inbox from risk-patients endpoint
- * Transforms patient risk data into message format
+ * Rough in-memory size of a message: UTF-16 text plus a fixed object overhead
  */
-export async function listMessages(): Promise<Message[]> {
-  try {
-    const response = await fetch(`${API_BASE_URL}/risk-patients?include_ai_suggestions=false`);
+function estimateMessageBytes(message: Message | null): number {
+  if (!message) return 64;
+  const text = message.patientName.length + message.subject.length + message.preview.length + (message.body?.length ?? 0);
+  return 2 * text + 256;
+}
+
+/**
+ * Invalidate cached queries whose path starts with `path` (e.g. '/risk-patients').
+ * With no argument every cached query is dropped.
+ */
+export function invalidateQueries(path?: string): void {
+  queryCache.invalidate(path);
+  detailCache.invalidate(path);
+}
+
+/**
+ * True for errors raised by an aborted fetch or adapter call
+ */
+export function isAbortError(error: unknown): boolean {
+  return error instanceof DOMException && error.name === 'AbortError';
+}
+
+// While the backend's circuit is open, cached data is served even if expired
+const staleWhileUnavailable = (error: unknown) => error instanceof CircuitOpenError;
+
+/**
+ * Fetch a JSON endpoint and check the backend `success` flag
+ */
+async function fetchJson(path: string, signal?: AbortSignal): Promise<any> {
+  const data = await requestJson(path, { signal });
+  
+  if (!data.success) {
+    throw new Error('API returned error');
+  }
+  
+  return data;
+}
+
+const RISK_PATIENTS_PATH = '/risk-patients?include_ai_suggestions=false';
+
+/**
+ * Transform a risk-patient record into the inbox Message format.
+ * Only the fields the inbox row shows are built; the body is generated on open.
+ */
+function toListMessage(patient: any, id: string): Message {
+  return {
+    id,
+    patientName: patient.name || patient.patient_name || 'Unknown Patient',
+    risk: mapRiskLevel(patient.risk_level || patient.basic_risk?.risk_level),
+    subject: generateSubject(patient),
+    preview: generatePreview(patient),
+    createdAt: patient.updated_at || patient.created_at || new Date().toISOString(),
+    read: readState.isRead(id)
+  };
+}
+
+// Messages and bodies derived from store entities, reused while the entity is unchanged
+const entityMessages = new WeakMap<PatientEntity, Message>();
+const entityBodies = new WeakMap<PatientEntity, string>();
+let riskMessagesCache: { entities: PatientEntity[]; readVersion: number; messages: Message[] } | null = null;
+
+function getEntityMessage(entity: PatientEntity): Message {
+  let message = entityMessages.get(entity);
+  if (!message) {
+    message = toListMessage(entity.record, entity.id);
+    entityMessages.set(entity, message);
+  } else if (message.read !== readState.isRead(entity.id)) {
+    message = { ...message, read: !message.read };
+    entityMessages.set(entity, message);
+  }
+  return message;
+}
+
+/**
+ * Body text of a message, generated from its patient record on first access.
+ * Cached per patient version: a changed patient record gets a fresh body.
+ */
+export function getMessageBody(message: Message): string {
+  if (message.body !== undefined) return message.body;
+  
+  const entity = patientStore.get(message.id);
+  if (!entity) return '';
+  
+  let body = entityBodies.get(entity);
+  if (body === undefined) {
+    body = generateMessageBody(entity.record);
+    entityBodies.set(entity, body);
+  }
+  return body;
+}
+
+/**
+ * Inbox messages for the latest risk list held in the patient store.
+ * Returns the same array until the risk list, one of its patients or a read flag changes.
+ */
+export function selectRiskMessages(): Message[] {
+  const entities = patientStore.getRiskPatients();
+  if (riskMessagesCache?.entities !== entities || riskMessagesCache.readVersion !== readState.version) {
+    const messages = entities.map(getEntityMessage);
+    const previous = riskMessagesCache?.messages;
     
-    if (!response.ok) {
-      throw new Error(`HTTP error! status: ${response.status}`);
+    // Other patients changing (e.g. a stream batch) must not produce a new list
+    const unchanged = previous !== undefined && previous.length === messages.length &&
+      messages.every((message, index) => message === previous[index]);
+    riskMessagesCache = { entities, readVersion: readState.version, messages: unchanged ? previous : messages };
+  }
+  return riskMessagesCache.messages;
+}
+
+// Latest weather responses by location code, persisted with the startup snapshot
+const latestWeather: Record<string, WeatherSnapshot> = {};
+// Set once fresh risk patients have loaded; a snapshot is never restored over them
+let riskPatientsLoaded = false;
+
+function collectSnapshot(): SnapshotData {
+  return {
+    patients: patientStore.getRiskPatients().map(entity => compactPatientRecord(entity.record)),
+    weather: latestWeather
+  };
+}
+
+function saveSnapshotSoon(): void {
+  scheduleSnapshotSave(collectSnapshot);
+}
+
+/**
+ * Restore the saved startup snapshot: risk patients go into the patient store
+ * as provisional records and weather seeds the cache as expired entries, so it
+ * is only served while the backend is unavailable. Resolves true if patients
+ * were restored, which never happens after fresh patients have loaded.
+ */
+export async function restoreSnapshot(): Promise<boolean> {
+  const snapshot = await loadSnapshot();
+  if (!snapshot) return false;
+  
+  for (const [locationCode, entry] of Object.entries(snapshot.weather)) {
+    latestWeather[locationCode] = { ...entry, ...latestWeather[locationCode] };
+    const weatherPath = `/weather-onecall/${locationCode}`;
+    if (entry.weather && queryCache.getStale(weatherPath) === undefined) {
+      queryCache.set(weatherPath, { success: true, weather: entry.weather }, 0);
     }
+    const analysisPath = `/weather-ai-analysis/${locationCode}`;
+    if (entry.analysis && queryCache.getStale(analysisPath) === undefined) {
+      queryCache.set(analysisPath, entry.analysis, 0);
+    }
+  }
+  
+  if (riskPatientsLoaded || snapshot.patients.length === 0) return false;
+  patientStore.setRiskPatients(snapshot.patients, { provisional: true });
+  return true;
+}
+
+/**
+ * Weather and AI analysis saved in the startup snapshot for a location
+ */
+export async function getSnapshotWeather(locationCode: string = '101000'): Promise<WeatherSnapshot | null> {
+  const snapshot = await loadSnapshot();
+  return snapshot?.weather[locationCode] ?? null;
+}
+
+/**
+ * The risk-patient list, shared by the inbox and the notifications panel.
+ * One request and one cache entry; each view is a projection of the result.
+ */
+function fetchRiskPatients(signal?: AbortSignal): Promise<any[]> {
+  return queryCache.fetch(RISK_PATIENTS_PATH, async (querySignal) => {
+    const data = await fetchJson(RISK_PATIENTS_PATH, querySignal);
+    const patients: any[] = data.risk_patients || [];
     
-    const data = await response.json();
+    // Normalize into the shared store; views read from there
+    riskPatientsLoaded = true;
+    patientStore.setRiskPatients(patients);
+    saveSnapshotSoon();
+    return patients;
+  }, { ttl: QUERY_TTL.riskPatients, signal, staleIfError: staleWhileUnavailable });
+}
+
+/**
+ * Fetch all messages for the inbox from risk-patients endpoint
+ * Transforms patient risk data into message format
+ */
+export async function listMessages(signal?: AbortSignal): Promise<Message[]> {
+  try {
+    const patients = await fetchRiskPatients(signal);
     
-    if (!data.success) {
-      throw new Error('API returned error');
+    // Read messages back from the store, which also holds live updates since the fetch
+    if (patients.every(patient => getPatientRecordId(patient) !== null)) {
+      return selectRiskMessages();
     }
     
-    // Transform patient risk data to Message format
-    const messages: Message[] = data.risk_patients?.map((patient: any, index: number) => ({
-      id: patient.patient_id?.toString() || index.toString(),
-      patientName: patient.name || patient.patient_name || 'Unknown Patient',
-      risk: mapRiskLevel(patient.risk_level || patient.basic_risk?.risk_level),
-      subject: generateSubject(patient),
-      preview: generatePreview(patient),
-      body: generateMessageBody(patient),
-      createdAt: patient.updated_at || patient.created_at || new Date().toISOString(),
-      read: false
-    })) || [];
-    
-    return messages;
+    // Records without an id can't be normalized; keep them in response order
+    return applyReadState(patients.map((patient: any, index: number) => {
+      const id = getPatientRecordId(patient);
+      const entity = id === null ? undefined : patientStore.get(id);
+      if (entity) return getEntityMessage(entity);
+      return { ...toListMessage(patient, index.toString()), body: generateMessageBody(patient) };
+    }));
   } catch (error) {
+    if (isAbortError(error)) throw error;
     console.error('Error fetching messages:', error);
     // Return empty array on error
     return [];
   }
 }
 
+// Cleared the first time the backend shows it has no multi-id comprehensive endpoint
+let comprehensiveBatchSupported = true;
+
 /**
- * Fetch a specific message by ID using comprehensive risk assessment
+ * Path of a patient's comprehensive assessment; also its detail cache key
  */
-export async function getMessage(id: string): Promise<Message | null> {
-  try {
-    const response = await fetch(`${API_BASE_URL}/risk-patients/${id}/comprehensive`);
+function comprehensivePath(id: string): string {
+  return `/risk-patients/${encodeURIComponent(id)}/comprehensive`;
+}
+
+/**
+ * Fetch the comprehensive assessment of a single patient
+ */
+async function fetchComprehensive(id: string): Promise<any> {
+  const data = await fetchJson(comprehensivePath(id));
+  return data.comprehensive_assessment;
+}
+
+/**
+ * Load comprehensive assessments for several patients with one request to the
+ * batch endpoint, falling back to one request per patient where it is missing.
+ * Failures are reported per patient.
+ */
+async function loadComprehensiveBatch(ids: string[]): Promise<Map<string, any>> {
+  const results = new Map<string, any>();
+  
+  if (ids.length > 1 && comprehensiveBatchSupported) {
+    const path = `/risk-patients/comprehensive?ids=${ids.map(encodeURIComponent).join(',')}`;
+    const response = await request(path);
     
-    if (!response.ok) {
-      throw new Error(`HTTP error! status: ${response.status}`);
+    if (response.status === 404 || response.status === 405) {
+      console.warn('Batch comprehensive endpoint unavailable, falling back to per-patient requests');
+      comprehensiveBatchSupported = false;
+    } else {
+      if (!response.ok) {
+        throw new HttpError(response.status);
+      }
+      const data = await response.json();
+      if (!data.success) {
+        throw new Error('API returned error');
+      }
+      
+      for (const assessment of data.comprehensive_assessments || []) {
+        const id = assessment?.patient_id?.toString();
+        if (id) results.set(id, assessment);
+      }
+      for (const [id, message] of Object.entries(data.errors || {})) {
+        results.set(id, new Error(String(message)));
+      }
+      return results;
     }
-    
-    const data = await response.json();
-    
-    if (!data.success) {
-      throw new Error('API returned error');
+  }
+  
+  const settled = await Promise.allSettled(ids.map(fetchComprehensive));
+  settled.forEach((outcome, index) => {
+    if (outcome.status === 'fulfilled') {
+      results.set(ids[index], outcome.value);
+    } else {
+      results.set(ids[index], outcome.reason instanceof Error ? outcome.reason : new Error(String(outcome.reason)));
     }
+  });
+  return results;
+}
+
+// getMessage calls made within a few milliseconds share one batch request
+const comprehensiveLoader = new BatchLoader<string, any>(loadComprehensiveBatch, {
+  maxBatchSize: 25,
+  batchWindowMs: 10,
+  maxConcurrency: 3
+});
+
+/**
+ * Fetch a specific message by ID using comprehensive risk assessment
+ * Requests are batched with other getMessage calls made at the same time.
+ */
+export async function getMessage(id: string, signal?: AbortSignal): Promise<Message | null> {
+  try {
+    const path = comprehensivePath(id);
     
-    const patient = data.comprehensive_assessment;
-    
-    return {
-      id: patient.patient_id?.toString() || id,
-      patientName: patient.patient_name || 'Unknown Patient',
-      risk: mapRiskLevel(patient.overall_assessment?.risk_level || patient.basic_risk?.risk_level),
-      subject: generateSubject(patient),
-      preview: generatePreview(patient),
-      body: generateDetailedMessageBody(patient),
-      createdAt: patient.updated_at || patient.created_at || new Date().toISOString(),
-      read: false
-    };
+    // Batched requests can't be cancelled per caller; aborting only detaches this caller
+    return await detailCache.fetch<Message>(path, async () => {
+      const patient = await comprehensiveLoader.load(id);
+      patientStore.mergeRecords([patient]);
+      
+      return {
+        id: patient.patient_id?.toString() || id,
+        patientName: patient.patient_name || 'Unknown Patient',
+        risk: mapRiskLevel(patient.overall_assessment?.risk_level || patient.basic_risk?.risk_level),
+        subject: generateSubject(patient),
+        preview: generatePreview(patient),
+        body: generateDetailedMessageBody(patient),
+        createdAt: patient.updated_at || patient.created_at || new Date().toISOString(),
+        read: readState.isRead(id)
+      };
+    }, { ttl: QUERY_TTL.comprehensive, signal, staleIfError: staleWhileUnavailable });
   } catch (error) {
+    if (isAbortError(error)) throw error;
     console.error(`Error fetching message ${id}:`, error);
     return null;
   }
 }
 
+/**
+ * Return the comprehensive message for `id` if it is already cached, without fetching
+ */
+export function peekMessage(id: string): Message | undefined {
+  return detailCache.get<Message>(comprehensivePath(id));
+}
+
+/**
+ * Load the comprehensive message for `id` into the detail cache in the background
+ */
+export function prefetchMessage(id: string): void {
+  if (peekMessage(id)) return;
+  getMessage(id).catch(() => {});
+}
+
 /**
  * Mark a message as read/unread
- * Note: This is a frontend-only operation since the backend doesn't have read status
+ * Note: This is a frontend-only operation since the backend doesn't have read status.
+ * The read state is kept in memory, persisted in the background and shared across tabs.
  */
-export async function markRead(id: string): Promise<void> {
-  // Since the backend doesn't track read status, we'll just log it
-  // In a real implementation, you might store this in localStorage or a separate service
-  console.log(`Marking message ${id} as read`);
-  
-  // Store read status in localStorage for persistence
-  const readMessages = JSON.parse(localStorage.getItem('readMessages') || '[]');
-  if (!readMessages.includes(id)) {
-    readMessages.push(id);
-    localStorage.setItem('readMessages', JSON.stringify(readMessages));
-  }
+export async function setMessageRead(id: string, read: boolean): Promise<void> {
+  readState.setRead(id, read);
+}
+
+/**
+ * Subscribe to read-state changes, including ones made in other tabs
+ */
+export function subscribeReadState(listener: () => void): () => void {
+  return readState.subscribe(listener);
 }
 
 /**
  * Request a call for a specific message
- * Note: This would integrate with a call scheduling system in a real implementation
+ * The request is stored in the outbox and delivered to the call-scheduling
+ * endpoint in the background, surviving reloads and offline periods.
  */
-export async function requestCall(messageId: string): Promise<void> {
+export async function requestCall(messageId: string, signal?: AbortSignal): Promise<void> {
+  if (signal?.aborted) throw createAbortError();
+  
   try {
-    // In a real implementation, this would call a call scheduling API
-    // For now, we'll simulate the request
-    console.log(`Requesting call for patient ${messageId}`);
-    
-    // Simulate API call delay
-    await new Promise(resolve => setTimeout(resolve, 500));
-    
-    // Store call request in localStorage for demo purposes
-    const callRequests = JSON.parse(localStorage.getItem('callRequests') || '[]');
-    callRequests.push({
-      messageId,
-      requestedAt: new Date().toISOString(),
-      status: 'pending'
-    });
-    localStorage.setItem('callRequests', JSON.stringify(callRequests));
-    
+    enqueueCallRequest(messageId);
   } catch (error) {
     console.error(`Error requesting call for ${messageId}:`, error);
     throw error;
   }
 }
 
+/**
+ * A change applied from the live update stream
+ */
+export type LiveUpdate =
+  | { type: 'patient-risk'; patientId: string; patientName: string; risk: 'low' | 'medium' | 'high'; added: boolean }
+  | { type: 'patient-removed'; patientId: string }
+  | { type: 'weather'; locationCode: string }
+  // The server could not resume from our last event; reload the full state
+  | { type: 'resync' };
+
+const LIVE_UPDATES_PATH = '/events/stream';
+// Keep the connection across quick unmount/remount cycles (StrictMode, route changes)
+const LIVE_UPDATES_GRACE_MS = 2000;
+
+const liveListeners = new Set<(update: LiveUpdate) => void>();
+const liveStateListeners = new Set<(state: LiveConnectionState) => void>();
+let liveStopTimer: ReturnType<typeof setTimeout> | null = null;
+let liveState: LiveConnectionState = 'closed';
+
+const liveClient = new LiveUpdatesClient({
+  path: LIVE_UPDATES_PATH,
+  onEvent: applyLiveEvent,
+  onStateChange: state => {
+    liveState = state;
+    liveStateListeners.forEach(listener => listener(state));
+  }
+});
+
+function emitLiveUpdate(update: LiveUpdate): void {
+  liveListeners.forEach(listener => listener(update));
+}
+
+/**
+ * Apply one pushed event to the patient store and query caches
+ */
+function applyLiveEvent(event: LiveEvent): void {
+  const data = event.data || {};
+  
+  switch (event.type) {
+    case 'patient-risk': {
+      const record = data.patient ?? data;
+      const id = getPatientRecordId(record);
+      if (id === null) return;
+      
+      if (data.removed) {
+        patientStore.removeRiskPatients([id]);
+        emitLiveUpdate({ type: 'patient-removed', patientId: id });
+        return;
+      }
+      
+      const added = patientStore.upsertRiskPatients([record]).includes(id);
+      // Deltas may carry only the changed fields; describe the merged patient
+      const patient = patientStore.get(id)?.record ?? record;
+      invalidateQueries(comprehensivePath(id));
+      emitLiveUpdate({
+        type: 'patient-risk',
+        patientId: id,
+        patientName: patient.name || patient.patient_name || 'Unknown Patient',
+        risk: mapRiskLevel(patient.risk_level || patient.basic_risk?.risk_level),
+        added
+      });
+      return;
+    }
+    
+    case 'weather': {
+      const locationCode = String(data.location_code ?? '101000');
+      if (data.weather) {
+        queryCache.set(`/weather-onecall/${locationCode}`, { success: true, weather: data.weather }, QUERY_TTL.weather);
+        latestWeather[locationCode] = { ...latestWeather[locationCode], weather: data.weather };
+      }
+      if (data.analysis) {
+        queryCache.set(`/weather-ai-analysis/${locationCode}`, data.analysis, QUERY_TTL.weatherAnalysis);
+        latestWeather[locationCode] = { ...latestWeather[locationCode], analysis: data.analysis };
+      }
+      saveSnapshotSoon();
+      emitLiveUpdate({ type: 'weather', locationCode });
+      return;
+    }
+    
+    case 'resync':
+      invalidateQueries('/risk-patients');
+      emitLiveUpdate({ type: 'resync' });
+      return;
+    
+    // Heartbeats only keep the connection alive
+    case 'heartbeat':
+      return;
+    
+    default:
+      console.warn('Unknown live update type:', event.type);
+  }
+}
+
+export type { LiveConnectionState };
+
+/**
+ * State of the push connection; anything but 'open' means updates may be missed
+ */
+export function getLiveConnectionState(): LiveConnectionState {
+  return liveState;
+}
+
+/**
+ * Follow the push connection state, e.g. to poll while it is down.
+ * This does not open the connection; subscribeLiveUpdates does.
+ */
+export function subscribeLiveConnectionState(listener: (state: LiveConnectionState) => void): () => void {
+  liveStateListeners.add(listener);
+  return () => {
+    liveStateListeners.delete(listener);
+  };
+}
+
+/**
+ * Receive live risk and weather updates. The push connection is opened for
+ * the first listener and closed shortly after the last one leaves.
+ */
+export function subscribeLiveUpdates(listener: (update: LiveUpdate) => void): () => void {
+  liveListeners.add(listener);
+  if (liveStopTimer !== null) {
+    clearTimeout(liveStopTimer);
+    liveStopTimer = null;
+  }
+  liveClient.start();
+  
+  return () => {
+    if (!liveListeners.delete(listener) || liveListeners.size > 0) return;
+    liveStopTimer = setTimeout(() => {
+      liveStopTimer = null;
+      if (liveListeners.size === 0) liveClient.stop();
+    }, LIVE_UPDATES_GRACE_MS);
+  };
+}
+
 // Helper functions to transform API data
 
 /**
@@ -317,22 +718,19 @@ function generateMessageBody(patient: any): string {
 /**
  * Fetch weather data for a specific location
  */
-export async function getWeatherData(locationCode: string = '101000'): Promise<any> {
+export async function getWeatherData(locationCode: string = '101000', signal?: AbortSignal): Promise<any> {
   try {
-    const response = await fetch(`${API_BASE_URL}/weather-onecall/${locationCode}`);
-    
-    if (!response.ok) {
-      throw new Error(`HTTP error! status: ${response.status}`);
-    }
-    
-    const data = await response.json();
-    
-    if (!data.success) {
-      throw new Error('API returned error');
-    }
+    const path = `/weather-onecall/${locationCode}`;
+    const data = await queryCache.fetch(path, async (querySignal) => {
+      const response = await fetchJson(path, querySignal);
+      latestWeather[locationCode] = { ...latestWeather[locationCode], weather: response.weather };
+      saveSnapshotSoon();
+      return response;
+    }, { ttl: QUERY_TTL.weather, signal, staleIfError: staleWhileUnavailable });
     
     return data.weather;
   } catch (error) {
+    if (isAbortError(error)) throw error;
     console.error('Error fetching weather data:', error);
     // Return null on error - components can handle fallback
     return null;
@@ -342,22 +740,19 @@ export async function getWeatherData(locationCode: string = '101000'): Promise<a
 /**
  * Fetch AI weather risk analysis
  */
-export async function getWeatherRiskAnalysis(locationCode: string = '101000'): Promise<any> {
+export async function getWeatherRiskAnalysis(locationCode: string = '101000', signal?: AbortSignal): Promise<any> {
   try {
-    const response = await fetch(`${API_BASE_URL}/weather-ai-analysis/${locationCode}`);
-    
-    if (!response.ok) {
-      throw new Error(`HTTP error! status: ${response.status}`);
-    }
-    
-    const data = await response.json();
-    
-    if (!data.success) {
-      throw new Error('API returned error');
-    }
+    const path = `/weather-ai-analysis/${locationCode}`;
+    const data = await queryCache.fetch(path, async (querySignal) => {
+      const response = await fetchJson(path, querySignal);
+      latestWeather[locationCode] = { ...latestWeather[locationCode], analysis: response };
+      saveSnapshotSoon();
+      return response;
+    }, { ttl: QUERY_TTL.weatherAnalysis, signal, staleIfError: staleWhileUnavailable });
     
     return data;
   } catch (error) {
+    if (isAbortError(error)) throw error;
     console.error('Error fetching weather risk analysis:', error);
     return null;
   }
@@ -366,22 +761,14 @@ export async function getWeatherRiskAnalysis(locationCode: string = '101000'): P
 /**
  * Fetch environment metrics for all patients
  */
-export async function getEnvironmentMetrics(): Promise<any> {
+export async function getEnvironmentMetrics(signal?: AbortSignal): Promise<any> {
   try {
-    const response = await fetch(`${API_BASE_URL}/environment-metrics`);
-    
-    if (!response.ok) {
-      throw new Error(`HTTP error! status: ${response.status}`);
-    }
-    
-    const data = await response.json();
-    
-    if (!data.success) {
-      throw new Error('API returned error');
-    }
+    const path = `/environment-metrics`;
+    const data = await queryCache.fetch(path, (querySignal) => fetchJson(path, querySignal), { ttl: QUERY_TTL.environmentMetrics, signal, staleIfError: staleWhileUnavailable });
     
     return data.environment_metrics;
   } catch (error) {
+    if (isAbortError(error)) throw error;
     console.error('Error fetching environment metrics:', error);
     return null;
   }
@@ -391,19 +778,11 @@ export async function getEnvironmentMetrics(): Promise<any> {
  * Fetch all patients with pagination
  * This is used for the Patient Information widget in the Doctor Dashboard
  */
-export async function getAllPatients(page: number = 1, perPage: number = 10): Promise<any> {
+export async function getAllPatients(page: number = 1, perPage: number = 10, signal?: AbortSignal): Promise<any> {
   try {
-    const response = await fetch(`${API_BASE_URL}/patients?page=${page}&per_page=${perPage}`);
-    
-    if (!response.ok) {
-      throw new Error(`HTTP error! status: ${response.status}`);
-    }
-    
-    const data = await response.json();
-    
-    if (!data.success) {
-      throw new Error('API returned error');
-    }
+    const path = `/patients?page=${page}&per_page=${perPage}`;
+    const data = await queryCache.fetch(path, (querySignal) => fetchJson(path, querySignal), { ttl: QUERY_TTL.patients, signal, staleIfError: staleWhileUnavailable });
+    patientStore.mergeRecords(data.patients || []);
     
     return {
       patients: data.patients || [],
@@ -412,6 +791,7 @@ export async function getAllPatients(page: number = 1, perPage: number = 10): Pr
       currentPage: data.current_page || page
     };
   } catch (error) {
+    if (isAbortError(error)) throw error;
     console.error('Error fetching all patients:', error);
     return {
       patients: [],
@@ -422,125 +802,519 @@ export async function getAllPatients(page: number = 1, perPage: number = 10): Pr
   }
 }
 
+export interface StreamPatientsOptions {
+  riskLevel?: 'low' | 'medium' | 'high';
+  location?: string;
+  batchSize?: number;
+  includeAiSuggestions?: boolean;
+  includeNotifications?: boolean;
+  signal?: AbortSignal;
+  // Reconnect after a dropped connection and resume from the last cursor
+  resumable?: boolean;
+  maxRetries?: number;
+  retryDelayMs?: number;
+  onReconnect?: (attempt: number, delayMs: number) => void;
+  // Consulted on every (re)connect and between batches; overrides batchSize. In resumable
+  // mode a size at least twice as large or small as the current one resumes the stream with it
+  getBatchSize?: () => number | undefined;
+  // Stop reading while this many batches returned by onBatch are still unresolved
+  maxPendingBatches?: number;
+  // Stream each filter set over its own connection and merge them in this order
+  partitions?: StreamPartition[];
+  maxConcurrentPartitions?: number;
+}
+
+/**
+ * Server-side filters for one connection of a partitioned stream
+ */
+export interface StreamPartition {
+  riskLevel?: 'low' | 'medium' | 'high';
+  location?: string;
+}
+
+// Whole cohort split by risk level, most urgent first
+export const RISK_LEVEL_PARTITIONS: StreamPartition[] = [
+  { riskLevel: 'high' },
+  { riskLevel: 'medium' },
+  { riskLevel: 'low' }
+];
+
+/**
+ * Batch callback of a patient stream. Returning a promise applies backpressure:
+ * reading pauses while too many returned promises are unresolved.
+ */
+export type StreamBatchHandler = (patients: any[], processedCount: number, totalPatients: number) => void | Promise<void>;
+
+/**
+ * Position reached in a patient stream, used to resume after a disconnect
+ */
+interface StreamCursor {
+  processedCount: number;
+  lastPatientId: string | null;
+}
+
+/**
+ * Thrown when the stream connection ends before the summary line arrives
+ */
+class StreamInterruptedError extends Error {
+  constructor(message: string) {
+    super(message);
+    this.name = 'StreamInterruptedError';
+  }
+}
+
+/**
+ * Thrown when a connection is closed on purpose to resume with a new batch size
+ */
+class StreamResizeError extends Error {
+  constructor(public batchSize: number) {
+    super(`Resuming patient stream with batch size ${batchSize}`);
+    this.name = 'StreamResizeError';
+  }
+}
+
+// A tuned batch size this many times larger or smaller than the connection's is worth a reconnect
+const BATCH_SIZE_SWITCH_RATIO = 2;
+// Batches a connection delivers before it may be resized, which limits the reconnect rate
+const MIN_BATCHES_BEFORE_RESIZE = 3;
+
 /**
  * Stream all patients with comprehensive risk data
  * This uses the streaming API for handling large datasets efficiently
+ * 
+ * In resumable mode a dropped connection is retried with exponential backoff,
+ * resuming after the last processed patient; rows already delivered are skipped.
+ * If onBatch returns promises, reading pauses while `maxPendingBatches` of them
+ * are unresolved, so a slow consumer holds the stream back instead of queueing.
  */
 export async function streamAllPatients(
-  onBatch: (patients: any[], processedCount: number, totalPatients: number) => void,
+  onBatch: StreamBatchHandler,
   onMetadata: (metadata: any) => void,
   onSummary: (summary: any) => void,
   onError: (error: string) => void,
-  options: {
-    riskLevel?: 'low' | 'medium' | 'high';
-    location?: string;
-    batchSize?: number;
-    includeAiSuggestions?: boolean;
-    includeNotifications?: boolean;
-  } = {}
+  options: StreamPatientsOptions = {}
 ): Promise<void> {
-  try {
-    const params = new URLSearchParams();
-    
-    if (options.riskLevel) params.append('risk_level', options.riskLevel);
-    if (options.location) params.append('location', options.location);
-    if (options.batchSize) params.append('batch_size', options.batchSize.toString());
-    if (options.includeAiSuggestions !== undefined) params.append('include_ai_suggestions', options.includeAiSuggestions.toString());
-    if (options.includeNotifications !== undefined) params.append('include_notifications', options.includeNotifications.toString());
-    
-    const url = `${API_BASE_URL}/patients/with-risks/stream${params.toString() ? '?' + params.toString() : ''}`;
-    
-    const response = await fetch(url);
+  if (options.partitions && options.partitions.length > 0) {
+    return streamPartitioned(onBatch, onMetadata, onSummary, onError, options);
+  }
+  
+  const { signal, resumable = false, maxRetries = 5, retryDelayMs = 1000 } = options;
+  const cursor: StreamCursor = { processedCount: 0, lastPatientId: null };
+  const seenIds = resumable ? new Set<string>() : null;
+  let attempt = 0;
+  
+  const handleBatch = (patients: any[], processedCount: number, totalPatients: number) => {
+    let freshPatients = patients;
     
-    if (!response.ok) {
-      throw new Error(`HTTP error! status: ${response.status}`);
+    if (seenIds) {
+      freshPatients = patients.filter(patient => {
+        const id = patient.patient_id ?? patient.id;
+        if (id === undefined || id === null) return true;
+        const key = id.toString();
+        if (seenIds.has(key)) return false;
+        seenIds.add(key);
+        return true;
+      });
     }
     
-    if (!response.body) {
-      throw new Error('Response body is null');
+    if (patients.length > 0) {
+      const last = patients[patients.length - 1];
+      const lastId = last.patient_id ?? last.id;
+      if (lastId !== undefined && lastId !== null) cursor.lastPatientId = lastId.toString();
     }
+    // A server that restarts from the top counts up from zero again; progress never goes back
+    cursor.processedCount = Math.max(cursor.processedCount, processedCount);
+    // A batch got through, so the connection is healthy again
+    attempt = 0;
     
-    const reader = response.body.getReader();
-    const decoder = new TextDecoder();
-    let buffer = '';
+    return onBatch(freshPatients, cursor.processedCount, totalPatients);
+  };
+  
+  while (true) {
+    try {
+      await readPatientStream(handleBatch, onMetadata, onSummary, onError, options, resumable ? cursor : null);
+      return;
+    } catch (error) {
+      // Aborting is a normal way to end the stream, not an error
+      if (signal?.aborted || isAbortError(error)) return;
+      // Closed on purpose; resume right away with the new size
+      if (error instanceof StreamResizeError) continue;
+      
+      if (resumable && attempt < maxRetries) {
+        attempt++;
+        const backoff = Math.min(retryDelayMs * 2 ** (attempt - 1), 30 * 1000);
+        console.warn(`Patient stream interrupted, reconnecting in ${backoff}ms (attempt ${attempt}/${maxRetries})`);
+        options.onReconnect?.(attempt, backoff);
+        
+        try {
+          await delay(backoff, signal);
+        } catch {
+          return;
+        }
+        continue;
+      }
+      
+      console.error('Error in streaming patients:', error);
+      onError(error instanceof Error ? error.message : 'Unknown streaming error');
+      return;
+    }
+  }
+}
+
+interface PartitionState {
+  label: string;
+  partition: StreamPartition;
+  // Batches received while an earlier partition is still streaming
+  queued: Array<{ patients: any[]; processedCount: number; resolve: () => void }>;
+  processedCount: number;
+  totalPatients: number;
+  metadata: any;
+  summary: any;
+  error: string | null;
+  done: boolean;
+}
+
+/**
+ * Stream several partitions over concurrent connections (at most
+ * `maxConcurrentPartitions` at once) and merge them into one stream ordered by
+ * partition: batches from a partition are passed on once every earlier
+ * partition has finished, and held until then. Held batches count as pending,
+ * so a waiting partition reads only a few batches ahead. Progress, metadata
+ * and the summary are combined across partitions. The combined total is only
+ * known once every partition has sent its metadata: until then batches report
+ * a total of 0 and the metadata is held back. The combined summary is only
+ * sent when every partition finished with one; otherwise the partitions that
+ * did not are reported through onError.
+ */
+async function streamPartitioned(
+  onBatch: StreamBatchHandler,
+  onMetadata: (metadata: any) => void,
+  onSummary: (summary: any) => void,
+  onError: (error: string) => void,
+  options: StreamPatientsOptions
+): Promise<void> {
+  const { partitions = [], maxConcurrentPartitions = 3, ...baseOptions } = options;
+  const { signal } = options;
+  const states: PartitionState[] = partitions.map(partition => ({
+    label: [partition.riskLevel, partition.location].filter(Boolean).join('/') || 'all',
+    partition,
+    queued: [],
+    processedCount: 0,
+    totalPatients: 0,
+    metadata: null,
+    summary: null,
+    error: null,
+    done: false
+  }));
+  // Index of the partition whose batches currently pass straight through
+  let head = 0;
+  let metadataReported = false;
+  
+  // A sum over only some partitions would understate the total, so it stays 0 until all have reported
+  const totalPatients = () => states.every(state => state.metadata)
+    ? states.reduce((sum, state) => sum + state.totalPatients, 0)
+    : 0;
+  
+  const deliver = (state: PartitionState, patients: any[], processedCount: number) => {
+    state.processedCount = processedCount;
+    const processed = states.reduce((sum, current) => sum + current.processedCount, 0);
+    return onBatch(patients, processed, totalPatients());
+  };
+  
+  // Pass on held batches of partitions that have reached the head
+  const advance = () => {
+    while (head < states.length) {
+      const state = states[head];
+      for (const batch of state.queued.splice(0)) {
+        const result = deliver(state, batch.patients, batch.processedCount);
+        Promise.resolve(result).then(batch.resolve, batch.resolve);
+      }
+      if (!state.done) return;
+      head++;
+    }
+  };
+  
+  const streamPartition = (index: number) => {
+    const state = states[index];
+    return streamAllPatients(
+      (patients, processedCount, partitionTotal) => {
+        state.totalPatients = partitionTotal || state.totalPatients;
+        if (index === head) return deliver(state, patients, processedCount);
+        return new Promise<void>(resolve => state.queued.push({ patients, processedCount, resolve }));
+      },
+      metadata => {
+        state.metadata = metadata;
+        state.totalPatients = metadata.total_patients || state.totalPatients;
+        // Reconnects send metadata again; the combined metadata goes out once
+        const total = totalPatients();
+        if (metadataReported || total === 0) return;
+        metadataReported = true;
+        onMetadata({ ...metadata, total_patients: total, partitions: states.map(current => current.label) });
+      },
+      summary => {
+        state.summary = summary;
+      },
+      error => {
+        state.error = error;
+        onError(`${state.label}: ${error}`);
+      },
+      { ...baseOptions, ...state.partition }
+    );
+  };
+  
+  // Partitions start in priority order, so the head partition is always running or done
+  let next = 0;
+  const runWorker = async () => {
+    while (next < states.length && !signal?.aborted) {
+      const index = next++;
+      await streamPartition(index);
+      states[index].done = true;
+      advance();
+    }
+  };
+  await Promise.all(Array.from({ length: Math.min(Math.max(1, maxConcurrentPartitions), states.length) }, runWorker));
+  
+  if (signal?.aborted) return;
+  
+  // A summary over some partitions would pass for the whole cohort; report what is missing instead
+  const incomplete = states.filter(state => !state.summary);
+  if (incomplete.length > 0) {
+    incomplete
+      .filter(state => state.error === null)
+      .forEach(state => onError(`${state.label}: stream ended without a summary`));
+    return;
+  }
+  
+  const riskDistribution: Record<string, number> = {};
+  states.forEach(state => {
+    Object.entries(state.summary.risk_distribution || {}).forEach(([level, count]) => {
+      riskDistribution[level] = (riskDistribution[level] || 0) + (Number(count) || 0);
+    });
+  });
+  onSummary({
+    type: 'summary',
+    total_processed: states.reduce((sum, state) => sum + (state.summary.total_processed || 0), 0),
+    risk_distribution: riskDistribution,
+    partitions: states.map(state => ({ partition: state.label, ...state.summary }))
+  });
+}
+
+/**
+ * Open one connection to the patient stream and dispatch its NDJSON lines.
+ * When a cursor is given the request resumes after it, and a connection that
+ * closes without a summary line is reported as interrupted. With a cursor the
+ * connection is also closed early, with StreamResizeError, once getBatchSize
+ * has moved far enough from the size it was opened with.
+ *
+ * Resume contract: `resume_from` is the processed_count already received and
+ * `after_patient_id` the last patient id seen. A server that supports them
+ * skips those rows and continues processed_count from `resume_from`. Both are
+ * optional for the server: one that ignores them streams from the start, and
+ * the caller drops the repeated rows by id and holds progress at the cursor.
+ */
+async function readPatientStream(
+  onBatch: StreamBatchHandler,
+  onMetadata: (metadata: any) => void,
+  onSummary: (summary: any) => void,
+  onError: (error: string) => void,
+  options: StreamPatientsOptions,
+  cursor: StreamCursor | null
+): Promise<void> {
+  const { signal, maxPendingBatches = 4 } = options;
+  const params = new URLSearchParams();
+  const batchSize = options.getBatchSize?.() ?? options.batchSize;
+  
+  if (options.riskLevel) params.append('risk_level', options.riskLevel);
+  if (options.location) params.append('location', options.location);
+  if (batchSize) params.append('batch_size', batchSize.toString());
+  if (options.includeAiSuggestions !== undefined) params.append('include_ai_suggestions', options.includeAiSuggestions.toString());
+  if (options.includeNotifications !== undefined) params.append('include_notifications', options.includeNotifications.toString());
+  if (cursor && cursor.processedCount > 0) {
+    params.append('resume_from', cursor.processedCount.toString());
+    if (cursor.lastPatientId) params.append('after_patient_id', cursor.lastPatientId);
+  }
+  
+  const path = `/patients/with-risks/stream${params.toString() ? '?' + params.toString() : ''}`;
+  
+  const response = await request(path, { signal });
+  
+  if (!response.ok) {
+    throw new HttpError(response.status);
+  }
+  
+  if (!response.body) {
+    throw new Error('Response body is null');
+  }
+  
+  const reader = response.body.getReader();
+  let finished = false;
+  let batchesRead = 0;
+  let totalPatients = 0;
+  
+  // The size to resume with, if it differs enough from this connection's to reconnect
+  const getResize = (): number | null => {
+    if (!cursor || !batchSize || batchesRead < MIN_BATCHES_BEFORE_RESIZE) return null;
+    const wanted = options.getBatchSize?.();
+    if (!wanted) return null;
+    const ratio = wanted / batchSize;
+    if (ratio < BATCH_SIZE_SWITCH_RATIO && ratio > 1 / BATCH_SIZE_SWITCH_RATIO) return null;
+    // Not worth a new connection this close to the end
+    return totalPatients - cursor.processedCount > wanted * BATCH_SIZE_SWITCH_RATIO ? wanted : null;
+  };
+  
+  // Batches handed to onBatch whose returned promise hasn't settled yet
+  let pendingBatches = 0;
+  let wakeReader: (() => void) | null = null;
+  const settleBatch = () => {
+    pendingBatches--;
+    wakeReader?.();
+  };
+  const trackBatch = (result: void | Promise<void>) => {
+    if (!result) return;
+    pendingBatches++;
+    result.then(settleBatch, settleBatch);
+  };
+  const waitForConsumer = () => new Promise<void>(resolve => {
+    wakeReader = () => {
+      if (pendingBatches >= maxPendingBatches && !signal?.aborted) return;
+      wakeReader = null;
+      signal?.removeEventListener('abort', wake);
+      resolve();
+    };
+    const wake = () => wakeReader?.();
+    signal?.addEventListener('abort', wake, { once: true });
+  });
+  
+  const decoder = new NdjsonDecoder((data: any) => {
+    // Stop delivering callbacks once aborted
+    if (signal?.aborted) return;
     
+    try {
+      switch (data.type) {
+        case 'metadata':
+          onMetadata(data);
+          break;
+        case 'batch':
+          batchesRead++;
+          totalPatients = data.total_patients || 0;
+          trackBatch(onBatch(data.patients || [], data.processed_count || 0, data.total_patients || 0));
+          break;
+        case 'summary':
+          finished = true;
+          onSummary(data);
+          break;
+        case 'error':
+          finished = true;
+          onError(data.error || 'Unknown streaming error');
+          break;
+        default:
+          console.warn('Unknown streaming message type:', data.type);
+      }
+    } catch (handlerError) {
+      console.error('Error handling streaming data:', handlerError);
+    }
+  });
+  
+  // Cancel the reader as soon as the caller aborts so no more bytes are pulled
+  const cancelReader = () => {
+    reader.cancel().catch(() => {});
+  };
+  signal?.addEventListener('abort', cancelReader, { once: true });
+  let resizeTo: number | null = null;
+  
+  try {
     while (true) {
       const { done, value } = await reader.read();
       
-      if (done) break;
+      if (signal?.aborted) break;
+      if (done) {
+        decoder.flush();
+        break;
+      }
       
-      buffer += decoder.decode(value, { stream: true });
-      const lines = buffer.split('\n');
-      buffer = lines.pop() || ''; // Keep incomplete line in buffer
+      decoder.push(value);
       
-      for (const line of lines) {
-        if (line.trim()) {
-          try {
-            const data = JSON.parse(line);
-            
-            switch (data.type) {
-              case 'metadata':
-                onMetadata(data);
-                break;
-              case 'batch':
-                onBatch(data.patients || [], data.processed_count || 0, data.total_patients || 0);
-                break;
-              case 'summary':
-                onSummary(data);
-                break;
-              case 'error':
-                onError(data.error || 'Unknown streaming error');
-                break;
-              default:
-                console.warn('Unknown streaming message type:', data.type);
-            }
-          } catch (parseError) {
-            console.error('Error parsing streaming data:', parseError, 'Line:', line);
-          }
-        }
+      // Backpressure: let the consumer catch up before pulling more bytes
+      if (pendingBatches >= maxPendingBatches) await waitForConsumer();
+      
+      resizeTo = finished ? null : getResize();
+      if (resizeTo !== null) {
+        cancelReader();
+        break;
       }
     }
-  } catch (error) {
-    console.error('Error in streaming patients:', error);
-    onError(error instanceof Error ? error.message : 'Unknown streaming error');
+  } finally {
+    signal?.removeEventListener('abort', cancelReader);
+    
+    // One summary warning instead of an error per bad line
+    if (decoder.malformedCount > 0) {
+      console.warn(`Skipped ${decoder.malformedCount} malformed line(s) in patient stream`);
+    }
+  }
+  
+  if (resizeTo !== null && !signal?.aborted) throw new StreamResizeError(resizeTo);
+  if (cursor && !finished && !signal?.aborted) {
+    throw new StreamInterruptedError('Patient stream closed before completion');
   }
 }
 
+/**
+ * Transform a risk-patient record into the notification format
+ */
+function toNotification(patient: any, id: string): any {
+  return {
+    id: `notification-${id}`,
+    patientId: id,
+    patientName: patient.name || patient.patient_name || 'Unknown Patient',
+    risk: mapRiskLevel(patient.risk_level || patient.basic_risk?.risk_level),
+    type: 'survey_completed',
+    message: `Pregnant patient completed condition assessment (${patient.pregnancy_weeks ? `${patient.pregnancy_weeks} weeks, ` : ''}Risk Level: ${patient.risk_level || patient.basic_risk?.risk_level || 'Unknown'})`,
+    timestamp: new Date(Date.now() - Math.random() * 60 * 60 * 1000), // Random time within last hour
+    priority: (patient.risk_level || patient.basic_risk?.risk_level || 'low').toLowerCase(),
+    status: Math.random() > 0.5 ? 'read' : 'unread' // Random read status
+  };
+}
+
+// Notifications derived from store entities, reused while the entity is unchanged
+const entityNotifications = new WeakMap<PatientEntity, any>();
+let riskNotificationsCache: { entities: PatientEntity[]; notifications: any[] } | null = null;
+
+function getEntityNotification(entity: PatientEntity): any {
+  let notification = entityNotifications.get(entity);
+  if (!notification) {
+    notification = toNotification(entity.record, entity.id);
+    entityNotifications.set(entity, notification);
+  }
+  return notification;
+}
+
+/**
+ * Notifications for the store's risk list; the same array while the list is unchanged
+ */
+export function selectRiskNotifications(): any[] {
+  const entities = patientStore.getRiskPatients();
+  if (riskNotificationsCache?.entities !== entities) {
+    riskNotificationsCache = { entities, notifications: entities.map(getEntityNotification) };
+  }
+  return riskNotificationsCache.notifications;
+}
+
 /**
  * Fetch patient survey completion notifications
  * This would be called when patients complete their condition assessments
  */
-export async function getPatientNotifications(): Promise<any[]> {
+export async function getPatientNotifications(signal?: AbortSignal): Promise<any[]> {
   try {
     // In a real implementation, this would be a dedicated notifications endpoint
-    // For now, we'll use the risk-patients endpoint and simulate notifications
-    const response = await fetch(`${API_BASE_URL}/risk-patients?include_ai_suggestions=true`);
+    // For now, notifications are simulated from the same risk-patient list as the inbox
+    const patients = await fetchRiskPatients(signal);
     
-    if (!response.ok) {
-      throw new Error(`HTTP error! status: ${response.status}`);
+    if (patients.every(patient => getPatientRecordId(patient) !== null)) {
+      return selectRiskNotifications();
     }
-    
-    const data = await response.json();
-    
-    if (!data.success) {
-      throw new Error('API returned error');
-    }
-    
-    // Transform patient data into notification format
-    const notifications = data.risk_patients?.map((patient: any, index: number) => ({
-      id: `notification-${patient.patient_id || index}`,
-      patientId: patient.patient_id?.toString() || index.toString(),
-      patientName: patient.name || patient.patient_name || 'Unknown Patient',
-      risk: mapRiskLevel(patient.risk_level || patient.basic_risk?.risk_level),
-      type: 'survey_completed',
-      message: `Pregnant patient completed condition assessment (${patient.pregnancy_weeks ? `${patient.pregnancy_weeks} weeks, ` : ''}Risk Level: ${patient.risk_level || patient.basic_risk?.risk_level || 'Unknown'})`,
-      timestamp: new Date(Date.now() - Math.random() * 60 * 60 * 1000), // Random time within last hour
-      priority: (patient.risk_level || patient.basic_risk?.risk_level || 'low').toLowerCase(),
-      status: Math.random() > 0.5 ? 'read' : 'unread' // Random read status
-    })) || [];
-    
-    return notifications;
+    return patients.map((patient: any, index: number) => toNotification(patient, index.toString()));
   } catch (error) {
+    if (isAbortError(error)) throw error;
     console.error('Error fetching patient notifications:', error);
     return [];
   }
@@ -0,0 +1,65 @@
+import { describe, expect, it, vi } from 'vitest'
+import { BatchLoader } from './batchLoader'
+
+const sleep = (ms: number) => new Promise(resolve => setTimeout(resolve, ms))
+
+// Resolves every key to its doubled value
+const double = async (keys: number[]) => new Map(keys.map(key => [key, key * 2]))
+
+describe('BatchLoader', () => {
+  it('collects loads made in the same window into one deduplicated batch', async () => {
+    const batchFn = vi.fn(double)
+    const loader = new BatchLoader(batchFn, { batchWindowMs: 5 })
+
+    const results = await Promise.all([loader.load(1), loader.load(2), loader.load(1), loader.load(3)])
+
+    expect(results).toEqual([2, 4, 2, 6])
+    expect(batchFn).toHaveBeenCalledTimes(1)
+    expect(batchFn).toHaveBeenCalledWith([1, 2, 3])
+  })
+
+  it('splits large batches and limits how many run at once', async () => {
+    let running = 0
+    let maxRunning = 0
+    const batchFn = vi.fn(async (keys: number[]) => {
+      running++
+      maxRunning = Math.max(maxRunning, running)
+      await sleep(10)
+      running--
+      return double(keys)
+    })
+    const loader = new BatchLoader(batchFn, { maxBatchSize: 10, maxConcurrency: 2 })
+
+    const keys = Array.from({ length: 45 }, (_, index) => index)
+    const results = await Promise.all(keys.map(key => loader.load(key)))
+
+    expect(results).toEqual(keys.map(key => key * 2))
+    expect(batchFn.mock.calls.map(([batch]) => batch.length)).toEqual([10, 10, 10, 10, 5])
+    expect(maxRunning).toBe(2)
+  })
+
+  it('rejects only the keys that failed or are missing from the result', async () => {
+    const loader = new BatchLoader(async (keys: number[]) => {
+      const results = new Map<number, number | Error>(keys.map(key => [key, key * 2]))
+      results.set(2, new Error('Patient not found'))
+      results.delete(3)
+      return results
+    })
+
+    const [one, two, three] = await Promise.allSettled([loader.load(1), loader.load(2), loader.load(3)])
+
+    expect(one).toEqual({ status: 'fulfilled', value: 2 })
+    expect(two).toMatchObject({ status: 'rejected', reason: new Error('Patient not found') })
+    expect(three.status).toBe('rejected')
+  })
+
+  it('rejects every caller in a batch whose request failed', async () => {
+    const loader = new BatchLoader<number, number>(async () => {
+      throw new Error('HTTP error! status: 503')
+    })
+
+    const settled = await Promise.allSettled([loader.load(1), loader.load(2)])
+
+    expect(settled.map(result => result.status)).toEqual(['rejected', 'rejected'])
+  })
+})
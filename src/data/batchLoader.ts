@@ -0,0 +1,117 @@
+/**
+ * DataLoader-style request batching
+ *
+ * Calls to `load(key)` made within a short window are collected, deduplicated
+ * and passed to a single batch function. Large batches are split into chunks
+ * of `maxBatchSize` and at most `maxConcurrency` chunks run at once. Each
+ * caller is resolved individually, so one failed key doesn't fail the rest
+ * of its batch.
+ */
+
+export interface BatchLoaderOptions {
+  // Largest number of keys passed to one batch function call
+  maxBatchSize?: number;
+  // How long to collect keys before dispatching; 0 dispatches after the current task
+  batchWindowMs?: number;
+  // Batch function calls allowed in flight at once
+  maxConcurrency?: number;
+}
+
+/**
+ * Loads values for many keys at once. The returned map may hold an Error for
+ * keys that failed; keys missing from the map are rejected as not found.
+ */
+export type BatchFunction<K, V> = (keys: K[]) => Promise<Map<K, V | Error>>;
+
+interface PendingLoad<V> {
+  resolve: (value: V) => void;
+  reject: (error: unknown) => void;
+}
+
+export class BatchLoader<K, V> {
+  // Keys waiting for the current window to close, with everyone waiting on each
+  private queue = new Map<K, PendingLoad<V>[]>();
+  private scheduled = false;
+  private running = 0;
+  private chunks: Array<Map<K, PendingLoad<V>[]>> = [];
+  private maxBatchSize: number;
+  private batchWindowMs: number;
+  private maxConcurrency: number;
+
+  constructor(private batchFn: BatchFunction<K, V>, options: BatchLoaderOptions = {}) {
+    this.maxBatchSize = Math.max(1, options.maxBatchSize ?? 50);
+    this.batchWindowMs = options.batchWindowMs ?? 0;
+    this.maxConcurrency = Math.max(1, options.maxConcurrency ?? 4);
+  }
+
+  load(key: K): Promise<V> {
+    return new Promise<V>((resolve, reject) => {
+      const waiting = this.queue.get(key);
+      if (waiting) {
+        waiting.push({ resolve, reject });
+      } else {
+        this.queue.set(key, [{ resolve, reject }]);
+      }
+      this.schedule();
+    });
+  }
+
+  private schedule(): void {
+    if (this.scheduled) return;
+    this.scheduled = true;
+    setTimeout(() => this.dispatch(), this.batchWindowMs);
+  }
+
+  private dispatch(): void {
+    this.scheduled = false;
+    const queue = this.queue;
+    this.queue = new Map();
+
+    let chunk = new Map<K, PendingLoad<V>[]>();
+    queue.forEach((waiting, key) => {
+      chunk.set(key, waiting);
+      if (chunk.size === this.maxBatchSize) {
+        this.chunks.push(chunk);
+        chunk = new Map();
+      }
+    });
+    if (chunk.size > 0) this.chunks.push(chunk);
+
+    this.drain();
+  }
+
+  // Start queued chunks while under the concurrency limit
+  private drain(): void {
+    while (this.running < this.maxConcurrency && this.chunks.length > 0) {
+      const chunk = this.chunks.shift() as Map<K, PendingLoad<V>[]>;
+      this.running++;
+      this.runChunk(chunk).finally(() => {
+        this.running--;
+        this.drain();
+      });
+    }
+  }
+
+  private async runChunk(chunk: Map<K, PendingLoad<V>[]>): Promise<void> {
+    let results: Map<K, V | Error>;
+    try {
+      results = await this.batchFn(Array.from(chunk.keys()));
+    } catch (error) {
+      // The whole request failed; every caller in the chunk sees the error
+      chunk.forEach(waiting => waiting.forEach(load => load.reject(error)));
+      return;
+    }
+
+    chunk.forEach((waiting, key) => {
+      const result = results.get(key);
+      if (result instanceof Error) {
+        waiting.forEach(load => load.reject(result));
+      } else if (result === undefined) {
+        const error = new Error(`No result for key ${String(key)}`);
+        waiting.forEach(load => load.reject(error));
+      } else {
+        waiting.forEach(load => load.resolve(result));
+      }
+    });
+  }
+}
@@ -0,0 +1,72 @@
+/**
+ * Append-only list stored in fixed-size chunks
+ * 
+ * Appending never copies earlier items, so streaming n records costs O(n) in
+ * total instead of O(n²) for repeated array spreads. `version` increases on
+ * every change so React state can track the list without copying it, and
+ * consumers can process only the items added since their last read.
+ */
+export class ChunkedList<T> {
+  // Incremented on every append or clear
+  version = 0;
+  // Incremented on every clear, so cursors into an older generation can be detected
+  epoch = 0;
+
+  private chunks: T[][] = [];
+  private size = 0;
+
+  constructor(private chunkSize: number = 1024) {}
+
+  get length(): number {
+    return this.size;
+  }
+
+  /**
+   * Append items, filling the last chunk before starting new ones
+   */
+  append(items: readonly T[]): void {
+    if (items.length === 0) return;
+
+    let offset = 0;
+    while (offset < items.length) {
+      let chunk = this.chunks[this.chunks.length - 1];
+      if (!chunk || chunk.length >= this.chunkSize) {
+        chunk = [];
+        this.chunks.push(chunk);
+      }
+
+      const count = Math.min(this.chunkSize - chunk.length, items.length - offset);
+      for (let i = 0; i < count; i++) {
+        chunk.push(items[offset + i]);
+      }
+      offset += count;
+    }
+
+    this.size += items.length;
+    this.version++;
+  }
+
+  at(index: number): T | undefined {
+    if (index < 0 || index >= this.size) return undefined;
+    return this.chunks[Math.floor(index / this.chunkSize)][index % this.chunkSize];
+  }
+
+  /**
+   * Copy items in [from, to) into a new array, e.g. the items added since a cursor
+   */
+  slice(from: number = 0, to: number = this.size): T[] {
+    const end = Math.min(to, this.size);
+    const result: T[] = [];
+    for (let index = Math.max(0, from); index < end; index++) {
+      result.push(this.chunks[Math.floor(index / this.chunkSize)][index % this.chunkSize]);
+    }
+    return result;
+  }
+
+  clear(): void {
+    this.chunks = [];
+    this.size = 0;
+    this.version++;
+    this.epoch++;
+  }
+}
@@ -0,0 +1,63 @@
+// @vitest-environment jsdom
+import { afterAll, afterEach, describe, expect, it, vi } from 'vitest'
+import { createMockServer } from '../../mock/server.js'
+import type { LiveConnectionState, LiveEvent } from './liveUpdates'
+
+// The transport reads its base URL when it loads, so point it at the mock first
+const server = await createMockServer()
+vi.stubEnv('VITE_API_BASE_URL', server.url)
+const { LiveUpdatesClient } = await import('./liveUpdates')
+
+afterAll(() => server.close())
+
+const sleep = (ms: number) => new Promise(resolve => setTimeout(resolve, ms))
+const streamRequests = () => server.stats.requests.filter(request => request.path === '/events/stream').length
+
+describe('LiveUpdatesClient', () => {
+  afterEach(() => {
+    server.scenario.events = true
+  })
+
+  it('delivers pushed events and resumes after a dropped connection', async () => {
+    const events: LiveEvent[] = []
+    const states: LiveConnectionState[] = []
+    const client = new LiveUpdatesClient({
+      path: '/events/stream',
+      onEvent: event => events.push(event),
+      onStateChange: state => states.push(state),
+      retryDelayMs: 10
+    })
+
+    client.start()
+    await vi.waitFor(() => expect(states).toContain('open'))
+    server.pushEvent('weather', { location_code: '101000' })
+    await vi.waitFor(() => expect(events).toHaveLength(1))
+
+    // An event sent while the connection is down is replayed after Last-Event-ID
+    server.dropEventStreams()
+    server.pushEvent('patient-risk', { patient_id: 7 })
+    await vi.waitFor(() => expect(events).toHaveLength(2), { timeout: 5000 })
+    client.stop()
+
+    expect(events.map(event => [event.id, event.type])).toEqual([['1', 'weather'], ['2', 'patient-risk']])
+    const connections = server.stats.eventConnections
+    expect(connections[connections.length - 1].lastEventId).toBe('1')
+    expect(states).toContain('reconnecting')
+    expect(states[states.length - 1]).toBe('closed')
+  })
+
+  it('retries a missing endpoint only at the maximum delay', async () => {
+    server.scenario.events = false
+    const requestsBefore = streamRequests()
+    const client = new LiveUpdatesClient({ path: '/events/stream', onEvent: () => {}, retryDelayMs: 10, maxRetryDelayMs: 500 })
+
+    client.start()
+    await sleep(300)
+    expect(streamRequests() - requestsBefore).toBe(1)
+
+    // Stopping ends the wait; no attempt follows
+    client.stop()
+    await sleep(400)
+    expect(streamRequests() - requestsBefore).toBe(1)
+  })
+})
@@ -0,0 +1,248 @@
+import { request, HttpError } from './transport';
+
+/**
+ * Server-sent events client for live updates
+ *
+ * Holds one connection to the backend's event stream and hands each event to
+ * a handler. The id of the last event seen is sent as Last-Event-ID when
+ * reconnecting, so the server can resume where the connection dropped. The
+ * connection is considered dead when nothing (not even a heartbeat comment)
+ * arrives within the heartbeat timeout, and it is reopened with jittered
+ * backoff after any failure and as soon as the browser comes back online.
+ * A client error such as 404 (no push endpoint on this backend) or 401 won't
+ * go away by itself, so it is retried only every `maxRetryDelayMs`.
+ */
+
+export interface LiveEvent {
+  id: string | null;
+  type: string;
+  data: any;
+}
+
+export type LiveConnectionState = 'connecting' | 'open' | 'reconnecting' | 'closed';
+
+export interface LiveUpdatesOptions {
+  path: string;
+  onEvent: (event: LiveEvent) => void;
+  onStateChange?: (state: LiveConnectionState) => void;
+  // Reconnect when no bytes arrive for this long
+  heartbeatTimeoutMs?: number;
+  retryDelayMs?: number;
+  maxRetryDelayMs?: number;
+}
+
+const DEFAULT_HEARTBEAT_TIMEOUT_MS = 45 * 1000;
+
+// Statuses that a quick retry won't change
+function isClientError(error: unknown): boolean {
+  return error instanceof HttpError && error.status >= 400 && error.status < 500 &&
+    error.status !== 408 && error.status !== 429;
+}
+
+/**
+ * Incremental parser for the text/event-stream format
+ */
+class EventStreamParser {
+  private buffer = '';
+  private eventType = '';
+  private data: string[] = [];
+  // Sticky across events, as in the SSE spec
+  lastEventId: string | null = null;
+  retryMs: number | null = null;
+
+  constructor(private onEvent: (event: LiveEvent) => void) {}
+
+  push(text: string): void {
+    this.buffer += text;
+    let newline = this.buffer.search(/\r\n|\r|\n/);
+
+    while (newline !== -1) {
+      // A trailing CR may be the first half of a CRLF split across chunks
+      if (newline === this.buffer.length - 1 && this.buffer[newline] === '\r') break;
+      const line = this.buffer.slice(0, newline);
+      const length = this.buffer.startsWith('\r\n', newline) ? 2 : 1;
+      this.buffer = this.buffer.slice(newline + length);
+      this.processLine(line);
+      newline = this.buffer.search(/\r\n|\r|\n/);
+    }
+  }
+
+  private processLine(line: string): void {
+    if (line === '') {
+      this.dispatch();
+      return;
+    }
+    // Comment lines are used as heartbeats
+    if (line.startsWith(':')) return;
+
+    const colon = line.indexOf(':');
+    const field = colon === -1 ? line : line.slice(0, colon);
+    let value = colon === -1 ? '' : line.slice(colon + 1);
+    if (value.startsWith(' ')) value = value.slice(1);
+
+    switch (field) {
+      case 'event':
+        this.eventType = value;
+        break;
+      case 'data':
+        this.data.push(value);
+        break;
+      case 'id':
+        if (!value.includes('\0')) this.lastEventId = value;
+        break;
+      case 'retry':
+        if (/^\d+$/.test(value)) this.retryMs = Number(value);
+        break;
+    }
+  }
+
+  private dispatch(): void {
+    const type = this.eventType || 'message';
+    const text = this.data.join('\n');
+    this.eventType = '';
+    this.data = [];
+    if (text === '') return;
+
+    let data: any = text;
+    try {
+      data = JSON.parse(text);
+    } catch {
+      // Non-JSON payloads are passed on as text
+    }
+    this.onEvent({ id: this.lastEventId, type, data });
+  }
+}
+
+export class LiveUpdatesClient {
+  private controller: AbortController | null = null;
+  private lastEventId: string | null = null;
+  private serverRetryMs: number | null = null;
+  private attempt = 0;
+  private wakeUp: (() => void) | null = null;
+
+  constructor(private options: LiveUpdatesOptions) {}
+
+  start(): void {
+    if (this.controller) return;
+    this.controller = new AbortController();
+    window.addEventListener('online', this.handleOnline);
+    this.run(this.controller.signal);
+  }
+
+  stop(): void {
+    if (!this.controller) return;
+    this.controller.abort();
+    this.controller = null;
+    window.removeEventListener('online', this.handleOnline);
+    this.options.onStateChange?.('closed');
+  }
+
+  // Skip the remaining backoff once connectivity returns
+  private handleOnline = () => {
+    this.attempt = 0;
+    this.wakeUp?.();
+  };
+
+  private async run(signal: AbortSignal): Promise<void> {
+    const { retryDelayMs = 1000, maxRetryDelayMs = 30 * 1000 } = this.options;
+
+    while (!signal.aborted) {
+      this.options.onStateChange?.(this.attempt === 0 ? 'connecting' : 'reconnecting');
+      let refused = false;
+      try {
+        await this.connect(signal);
+      } catch (error) {
+        if (signal.aborted) return;
+        refused = isClientError(error);
+        console.warn('Live updates connection lost:', error);
+      }
+      if (signal.aborted) return;
+
+      // Full jitter backoff; a retry hint from the server sets the floor
+      const ceiling = Math.min(maxRetryDelayMs, retryDelayMs * 2 ** this.attempt);
+      const wait = refused ? maxRetryDelayMs : Math.max(this.serverRetryMs ?? 0, Math.random() * ceiling);
+      this.attempt++;
+      await this.sleep(wait, signal);
+    }
+  }
+
+  /**
+   * Wait before the next attempt; resolves early when woken or aborted, and the run loop checks the signal
+   */
+  private sleep(ms: number, signal: AbortSignal): Promise<void> {
+    return new Promise<void>(resolve => {
+      const finish = () => {
+        clearTimeout(timer);
+        signal.removeEventListener('abort', finish);
+        this.wakeUp = null;
+        resolve();
+      };
+      const timer = setTimeout(finish, ms);
+      signal.addEventListener('abort', finish, { once: true });
+      this.wakeUp = finish;
+    });
+  }
+
+  /**
+   * One connection; resolves when the server closes it, throws on failure
+   */
+  private async connect(signal: AbortSignal): Promise<void> {
+    const { heartbeatTimeoutMs = DEFAULT_HEARTBEAT_TIMEOUT_MS } = this.options;
+    const headers: Record<string, string> = { Accept: 'text/event-stream' };
+    if (this.lastEventId !== null) headers['Last-Event-ID'] = this.lastEventId;
+
+    // Aborting this controller tears down just this connection
+    const connection = new AbortController();
+    const abortConnection = () => connection.abort();
+    signal.addEventListener('abort', abortConnection, { once: true });
+
+    let heartbeatTimer: ReturnType<typeof setTimeout> | null = null;
+    let heartbeatMissed = false;
+    const resetHeartbeat = () => {
+      if (heartbeatTimer !== null) clearTimeout(heartbeatTimer);
+      heartbeatTimer = setTimeout(() => {
+        heartbeatMissed = true;
+        connection.abort();
+      }, heartbeatTimeoutMs);
+    };
+
+    try {
+      const response = await request(this.options.path, { headers, signal: connection.signal });
+      if (!response.ok) throw new HttpError(response.status);
+      if (!response.body) throw new Error('Response body is null');
+
+      this.options.onStateChange?.('open');
+      resetHeartbeat();
+
+      const parser = new EventStreamParser(event => {
+        this.lastEventId = event.id;
+        this.attempt = 0;
+        try {
+          this.options.onEvent(event);
+        } catch (error) {
+          console.error('Error handling live update:', error);
+        }
+      });
+      parser.lastEventId = this.lastEventId;
+
+      const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+      try {
+        while (true) {
+          const { done, value } = await reader.read();
+          if (done) return;
+          resetHeartbeat();
+          parser.push(value);
+          this.serverRetryMs = parser.retryMs ?? this.serverRetryMs;
+        }
+      } finally {
+        reader.cancel().catch(() => {});
+      }
+    } catch (error) {
+      if (heartbeatMissed) throw new Error(`No live update or heartbeat for ${heartbeatTimeoutMs}ms`);
+      throw error;
+    } finally {
+      if (heartbeatTimer !== null) clearTimeout(heartbeatTimer);
+      signal.removeEventListener('abort', abortConnection);
+    }
+  }
+}
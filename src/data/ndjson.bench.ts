@@ -0,0 +1,51 @@
+import { bench, describe } from 'vitest'
+import { makePatient } from '../../mock/server.js'
+import { NdjsonDecoder } from './ndjson'
+
+const RECORD_COUNT = 100000
+
+const encoded = new TextEncoder().encode(
+  Array.from({ length: RECORD_COUNT }, (_, index) => JSON.stringify(makePatient(index))).join('\n') + '\n'
+)
+
+const toChunks = (bytes: Uint8Array, size: number) => {
+  const chunks: Uint8Array[] = []
+  for (let offset = 0; offset < bytes.length; offset += size) chunks.push(bytes.subarray(offset, offset + size))
+  return chunks
+}
+
+// The loop streamAllPatients used before NdjsonDecoder: decode, append and re-split the buffer per chunk
+const decodeWithSplit = (chunks: Uint8Array[], onRecord: (record: any) => void) => {
+  const decoder = new TextDecoder()
+  let buffer = ''
+  for (const chunk of chunks) {
+    buffer += decoder.decode(chunk, { stream: true })
+    const lines = buffer.split('\n')
+    buffer = lines.pop() || ''
+    for (const line of lines) {
+      if (line.trim()) onRecord(JSON.parse(line))
+    }
+  }
+}
+
+const decodeWithNdjsonDecoder = (chunks: Uint8Array[], onRecord: (record: any) => void) => {
+  const decoder = new NdjsonDecoder(onRecord)
+  chunks.forEach(chunk => decoder.push(chunk))
+  decoder.flush()
+}
+
+// Typical network reads, and the small reads of a slow mobile connection
+for (const chunkSize of [64 * 1024, 512]) {
+  describe(`${RECORD_COUNT} records in ${chunkSize}-byte chunks`, () => {
+    const chunks = toChunks(encoded, chunkSize)
+    const onRecord = () => {}
+
+    bench('split loop', () => {
+      decodeWithSplit(chunks, onRecord)
+    }, { iterations: 5, time: 0 })
+
+    bench('NdjsonDecoder', () => {
+      decodeWithNdjsonDecoder(chunks, onRecord)
+    }, { iterations: 5, time: 0 })
+  })
+}
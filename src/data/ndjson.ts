@@ -0,0 +1,78 @@
+/**
+ * Incremental NDJSON decoder
+ *
+ * Works on the raw bytes of a streamed response: each chunk is scanned once for
+ * newline bytes and complete lines are sliced out with `subarray`, so partial
+ * lines are never re-concatenated or re-split as more data arrives. Only the
+ * bytes of a line that spans several chunks are copied, once, when it completes.
+ */
+
+const NEWLINE = 0x0a;
+
+export class NdjsonDecoder {
+  // Number of non-empty lines that failed to parse as JSON
+  malformedCount = 0;
+
+  private pending: Uint8Array[] = [];
+  private pendingLength = 0;
+  private textDecoder = new TextDecoder();
+
+  constructor(private onRecord: (record: any) => void) {}
+
+  /**
+   * Feed the next chunk of the byte stream
+   */
+  push(chunk: Uint8Array): void {
+    let start = 0;
+    let newline = chunk.indexOf(NEWLINE);
+
+    while (newline !== -1) {
+      this.emitLine(chunk.subarray(start, newline));
+      start = newline + 1;
+      newline = chunk.indexOf(NEWLINE, start);
+    }
+
+    if (start < chunk.length) {
+      this.pending.push(chunk.subarray(start));
+      this.pendingLength += chunk.length - start;
+    }
+  }
+
+  /**
+   * Parse a trailing line that was not terminated by a newline
+   */
+  flush(): void {
+    if (this.pendingLength > 0) {
+      this.emitLine(new Uint8Array(0));
+    }
+  }
+
+  private emitLine(tail: Uint8Array): void {
+    let bytes = tail;
+
+    if (this.pending.length > 0) {
+      bytes = new Uint8Array(this.pendingLength + tail.length);
+      let offset = 0;
+      for (const part of this.pending) {
+        bytes.set(part, offset);
+        offset += part.length;
+      }
+      bytes.set(tail, offset);
+      this.pending = [];
+      this.pendingLength = 0;
+    }
+
+    // Newlines never occur inside a UTF-8 sequence, so each line decodes on its own
+    const line = this.textDecoder.decode(bytes);
+    if (!line.trim()) return;
+
+    let record: any;
+    try {
+      record = JSON.parse(line);
+    } catch {
+      this.malformedCount++;
+      return;
+    }
+    this.onRecord(record);
+  }
+}
@@ -0,0 +1,56 @@
+// @vitest-environment jsdom
+import { afterAll, beforeEach, describe, expect, it, vi } from 'vitest'
+import { createMockServer } from '../../mock/server.js'
+
+// The transport reads its base URL when it loads, so point it at the mock first
+const server = await createMockServer()
+vi.stubEnv('VITE_API_BASE_URL', server.url)
+const { enqueueCallRequest, flushOutbox, getOutboxStatus } = await import('./outbox')
+
+afterAll(() => server.close())
+
+beforeEach(() => {
+  localStorage.clear()
+  server.stats.callRequests = []
+  server.scenario.callRequestsStatus = 200
+  server.scenario.callRequestsRejected = []
+})
+
+describe('call request outbox', () => {
+  it('delivers queued requests in one batch and empties the queue', async () => {
+    const first = enqueueCallRequest('3')
+    const second = enqueueCallRequest('4')
+    expect(getOutboxStatus()).toMatchObject({ pending: 2, failed: 0 })
+
+    await flushOutbox()
+
+    expect(server.stats.callRequests.map(item => item.idempotency_key)).toEqual([first.id, second.id])
+    expect(getOutboxStatus()).toMatchObject({ pending: 0, failed: 0, lastError: null })
+  })
+
+  it('keeps requests queued when the batch is refused as a whole', async () => {
+    server.scenario.callRequestsStatus = 401
+    const entry = enqueueCallRequest('3')
+
+    await flushOutbox()
+    expect(getOutboxStatus()).toMatchObject({ pending: 1, failed: 0 })
+    expect(getOutboxStatus().lastError).toContain('401')
+
+    // Once the session is back the same request goes through, under the same key
+    server.scenario.callRequestsStatus = 200
+    await flushOutbox()
+    expect(server.stats.callRequests.map(item => item.idempotency_key)).toEqual([entry.id])
+    expect(getOutboxStatus()).toMatchObject({ pending: 0, failed: 0, lastError: null })
+  })
+
+  it('marks only the rejected requests as failed', async () => {
+    server.scenario.callRequestsRejected = ['4']
+    enqueueCallRequest('3')
+    enqueueCallRequest('4')
+
+    await flushOutbox()
+
+    expect(server.stats.callRequests.map(item => item.patient_id)).toEqual(['3'])
+    expect(getOutboxStatus()).toMatchObject({ pending: 0, failed: 1 })
+  })
+})
@@ -0,0 +1,309 @@
+import { HttpError, request } from './transport';
+
+/**
+ * Durable outbox for call requests
+ *
+ * Requests are written to localStorage before anything is sent, so they
+ * survive reloads and offline periods. Pending entries are delivered in
+ * batches to the call-scheduling endpoint. Every entry carries an idempotency
+ * key that stays the same across retries, so a batch that reached the server
+ * but whose response was lost is not scheduled twice. Failed deliveries are
+ * retried with backoff and as soon as the browser comes back online, and
+ * delivered entries are removed from storage. Where Web Locks are available
+ * only one tab delivers at a time.
+ *
+ * Only the server's per-request verdicts are final. A batch answered with an
+ * error status (missing endpoint, expired session, validation failure) stays
+ * queued and is retried, and the error is reported through getOutboxStatus.
+ *
+ * Endpoint contract: POST /call-requests/batch with
+ * `{ requests: [{ idempotency_key, patient_id, requested_at }] }`, answered
+ * with `{ results: [{ idempotency_key, status, error? }] }` where status is
+ * 'scheduled', 'duplicate' or 'rejected'; 409 means the whole batch was
+ * already processed. mock/server.js implements it.
+ */
+
+const STORAGE_KEY = 'callRequestOutbox';
+// Unbounded array written by the original requestCall; migrated once
+const LEGACY_STORAGE_KEY = 'callRequests';
+const DELIVERY_PATH = '/call-requests/batch';
+const LOCK_NAME = 'call-request-outbox';
+const MAX_BATCH_SIZE = 50;
+// Collect requests made in quick succession into one delivery
+const FLUSH_DELAY_MS = 200;
+const RETRY_BASE_DELAY_MS = 2000;
+const RETRY_MAX_DELAY_MS = 60 * 1000;
+
+export interface OutboxEntry {
+  // Idempotency key, unique per call request and reused for every attempt
+  id: string;
+  messageId: string;
+  requestedAt: string;
+  attempts: number;
+  // Set when the server rejected the request; such entries are not retried
+  error?: string;
+}
+
+export interface OutboxStatus {
+  pending: number;
+  failed: number;
+  delivering: boolean;
+  // Why the last delivery attempt failed; cleared once a batch gets through
+  lastError: string | null;
+}
+
+// FNV-1a; a short, stable key for a batch built from its entries' keys
+function hashKeys(keys: string[]): string {
+  let hash = 0x811c9dc5;
+  const text = keys.join(',');
+  for (let i = 0; i < text.length; i++) {
+    hash ^= text.charCodeAt(i);
+    hash = Math.imul(hash, 0x01000193);
+  }
+  return `batch-${(hash >>> 0).toString(16)}-${keys.length}`;
+}
+
+function createIdempotencyKey(): string {
+  if (typeof crypto !== 'undefined' && typeof crypto.randomUUID === 'function') {
+    return crypto.randomUUID();
+  }
+  return `${Date.now().toString(36)}-${Math.random().toString(36).slice(2, 12)}`;
+}
+
+/**
+ * Read the queue from storage; storage is the source of truth, so entries
+ * added by other tabs are picked up too
+ */
+function readEntries(): OutboxEntry[] {
+  try {
+    const stored = JSON.parse(localStorage.getItem(STORAGE_KEY) || '[]');
+    return Array.isArray(stored) ? stored : [];
+  } catch {
+    return [];
+  }
+}
+
+function writeEntries(entries: OutboxEntry[]): void {
+  if (entries.length === 0) {
+    localStorage.removeItem(STORAGE_KEY);
+  } else {
+    localStorage.setItem(STORAGE_KEY, JSON.stringify(entries));
+  }
+}
+
+function migrateLegacyRequests(): void {
+  try {
+    const legacy = JSON.parse(localStorage.getItem(LEGACY_STORAGE_KEY) || 'null');
+    if (!Array.isArray(legacy)) return;
+
+    const migrated = legacy
+      .filter(item => item?.messageId && item.status === 'pending')
+      .map((item): OutboxEntry => ({
+        id: createIdempotencyKey(),
+        messageId: String(item.messageId),
+        requestedAt: item.requestedAt || new Date().toISOString(),
+        attempts: 0
+      }));
+    writeEntries([...readEntries(), ...migrated]);
+    localStorage.removeItem(LEGACY_STORAGE_KEY);
+  } catch (error) {
+    console.warn('Could not migrate stored call requests:', error);
+  }
+}
+
+let flushTimer: ReturnType<typeof setTimeout> | null = null;
+let delivering = false;
+let retryRound = 0;
+let lastError: string | null = null;
+// Rebuilt after every change, so subscribers can compare snapshots by identity
+let statusSnapshot: OutboxStatus | null = null;
+type OutboxListener = () => void;
+const listeners = new Set<OutboxListener>();
+
+function emitChange(): void {
+  statusSnapshot = null;
+  listeners.forEach(listener => listener());
+}
+
+function scheduleFlush(delayMs: number): void {
+  if (flushTimer !== null) clearTimeout(flushTimer);
+  flushTimer = setTimeout(() => {
+    flushTimer = null;
+    flushOutbox();
+  }, delayMs);
+}
+
+function scheduleRetry(): void {
+  // Full jitter, so many clients coming back at once don't retry in lockstep
+  const ceiling = Math.min(RETRY_MAX_DELAY_MS, RETRY_BASE_DELAY_MS * 2 ** retryRound);
+  retryRound++;
+  scheduleFlush(Math.random() * ceiling);
+}
+
+/**
+ * Remove delivered entries and record rejected ones; entries added meanwhile
+ * (by this or another tab) are kept
+ */
+function settleEntries(delivered: Set<string>, rejected: Map<string, string>): void {
+  const remaining = readEntries()
+    .filter(entry => !delivered.has(entry.id))
+    .map(entry => {
+      const error = rejected.get(entry.id);
+      return error ? { ...entry, error } : entry;
+    });
+  writeEntries(remaining);
+}
+
+function recordAttempt(batch: OutboxEntry[]): void {
+  const ids = new Set(batch.map(entry => entry.id));
+  writeEntries(readEntries().map(entry => (ids.has(entry.id) ? { ...entry, attempts: entry.attempts + 1 } : entry)));
+}
+
+/**
+ * Send one batch. Resolves to the per-entry outcome; throws if the batch
+ * should be retried as a whole, which is the case for every error status.
+ */
+async function deliverBatch(batch: OutboxEntry[]): Promise<{ delivered: Set<string>; rejected: Map<string, string> }> {
+  const response = await request(DELIVERY_PATH, {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+      // The same batch retried gets the same key; per-request keys are in the body
+      'Idempotency-Key': hashKeys(batch.map(entry => entry.id))
+    },
+    body: JSON.stringify({
+      requests: batch.map(entry => ({
+        idempotency_key: entry.id,
+        patient_id: entry.messageId,
+        requested_at: entry.requestedAt
+      }))
+    })
+  });
+
+  const delivered = new Set<string>();
+  const rejected = new Map<string, string>();
+
+  // Already processed under these keys
+  if (response.status === 409) {
+    batch.forEach(entry => delivered.add(entry.id));
+    return { delivered, rejected };
+  }
+  // Says nothing about the individual requests (e.g. 401 or 404); keep them queued
+  if (!response.ok) throw new HttpError(response.status);
+
+  // The server may report per-request results; anything not rejected counts as delivered
+  const data = await response.json().catch(() => null);
+  const results: any[] = Array.isArray(data?.results) ? data.results : [];
+  const errors = new Map<string, string>(
+    results
+      .filter(result => result?.status === 'rejected')
+      .map(result => [String(result.idempotency_key), String(result.error || 'rejected')])
+  );
+  batch.forEach(entry => {
+    const error = errors.get(entry.id);
+    if (error) rejected.set(entry.id, error);
+    else delivered.add(entry.id);
+  });
+  return { delivered, rejected };
+}
+
+/**
+ * Deliver all pending call requests now, batch by batch
+ */
+export async function flushOutbox(): Promise<void> {
+  if (delivering) return;
+  if (typeof navigator !== 'undefined' && navigator.onLine === false) return;
+
+  if (typeof navigator !== 'undefined' && navigator.locks) {
+    // Another tab holding the lock is already delivering the shared queue
+    await navigator.locks.request(LOCK_NAME, { ifAvailable: true }, async lock => {
+      if (lock) {
+        await deliverPending();
+      } else if (readEntries().some(entry => !entry.error)) {
+        // Check again later in case that tab finished before seeing our entries
+        scheduleRetry();
+      }
+    });
+  } else {
+    await deliverPending();
+  }
+}
+
+async function deliverPending(): Promise<void> {
+  if (delivering) return;
+  delivering = true;
+  emitChange();
+  try {
+    for (;;) {
+      const batch = readEntries().filter(entry => !entry.error).slice(0, MAX_BATCH_SIZE);
+      if (batch.length === 0) break;
+
+      recordAttempt(batch);
+      const { delivered, rejected } = await deliverBatch(batch);
+      settleEntries(delivered, rejected);
+      rejected.forEach((error, id) => console.error(`Call request ${id} was rejected: ${error}`));
+      retryRound = 0;
+      lastError = null;
+      emitChange();
+    }
+  } catch (error) {
+    console.warn('Call request delivery failed, will retry:', error);
+    lastError = error instanceof Error ? error.message : String(error);
+    scheduleRetry();
+  } finally {
+    delivering = false;
+    emitChange();
+  }
+}
+
+/**
+ * Queue a call request for delivery. The entry is stored before this returns.
+ */
+export function enqueueCallRequest(messageId: string): OutboxEntry {
+  const entry: OutboxEntry = {
+    id: createIdempotencyKey(),
+    messageId,
+    requestedAt: new Date().toISOString(),
+    attempts: 0
+  };
+  writeEntries([...readEntries(), entry]);
+  emitChange();
+
+  if (!delivering) scheduleFlush(FLUSH_DELAY_MS);
+  return entry;
+}
+
+/**
+ * Counts of queued and rejected call requests; the same object until the queue changes
+ */
+export function getOutboxStatus(): OutboxStatus {
+  if (!statusSnapshot) {
+    const entries = readEntries();
+    const failed = entries.filter(entry => entry.error).length;
+    statusSnapshot = { pending: entries.length - failed, failed, delivering, lastError };
+  }
+  return statusSnapshot;
+}
+
+/**
+ * Subscribe to queue changes, including ones made in other tabs
+ */
+export function subscribeOutbox(listener: OutboxListener): () => void {
+  listeners.add(listener);
+  return () => {
+    listeners.delete(listener);
+  };
+}
+
+// Deliver anything left over from a previous session, and retry whenever connectivity returns
+if (typeof window !== 'undefined') {
+  migrateLegacyRequests();
+  window.addEventListener('online', () => {
+    retryRound = 0;
+    scheduleFlush(0);
+  });
+  window.addEventListener('storage', event => {
+    if (event.key === STORAGE_KEY) emitChange();
+  });
+  if (readEntries().length > 0) scheduleFlush(FLUSH_DELAY_MS);
+}
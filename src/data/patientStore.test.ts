@@ -0,0 +1,50 @@
+import { describe, expect, it, vi } from 'vitest'
+import { makePatient } from '../../mock/server.js'
+import { PatientStore } from './patientStore'
+import { transformPatientData } from './patients'
+
+describe('PatientStore.mergePatientInfo', () => {
+  it('keeps entities and stays quiet when streamed patients are unchanged', () => {
+    const store = new PatientStore()
+    store.setRiskPatients([makePatient(0), makePatient(1)])
+    store.mergePatientInfo([0, 1, 2].map(index => transformPatientData(makePatient(index))))
+    const riskPatients = store.getRiskPatients()
+    const listener = vi.fn()
+    store.subscribe(listener)
+
+    // The same patients streamed again, as fresh objects
+    store.mergePatientInfo([0, 1, 2].map(index => transformPatientData(makePatient(index))))
+
+    expect(listener).not.toHaveBeenCalled()
+    expect(store.getRiskPatients()).toBe(riskPatients)
+  })
+
+  it('replaces only the changed entity and keeps its record and provisional flag', () => {
+    const store = new PatientStore()
+    store.setRiskPatients([makePatient(0), makePatient(1)], { provisional: true })
+    store.mergePatientInfo([0, 1].map(index => transformPatientData(makePatient(index))))
+    const [first, second] = store.getRiskPatients()
+    const listener = vi.fn()
+    store.subscribe(listener)
+
+    store.mergePatientInfo([transformPatientData({ ...makePatient(1), risk_score: 9 })])
+
+    expect(listener).toHaveBeenCalledTimes(1)
+    const [firstAfter, secondAfter] = store.getRiskPatients()
+    expect(firstAfter).toBe(first)
+    expect(secondAfter).not.toBe(second)
+    expect(secondAfter.info?.riskLevel).toBe('high')
+    expect(secondAfter.record).toBe(second.record)
+    expect(secondAfter.provisional).toBe(true)
+  })
+
+  it('keeps the risk list when only patients outside it change', () => {
+    const store = new PatientStore()
+    store.setRiskPatients([makePatient(0)])
+    const riskPatients = store.getRiskPatients()
+
+    store.mergePatientInfo([transformPatientData(makePatient(5))])
+
+    expect(store.getRiskPatients()).toBe(riskPatients)
+  })
+})
@@ -0,0 +1,221 @@
+import { PatientInfo } from './patients';
+
+/**
+ * Normalized patient store
+ *
+ * Holds one entity per patient, keyed by patient_id, shared by every page and
+ * widget. Responses from the risk list, comprehensive assessments,
+ * notifications, the paginated patient list and the patient stream all merge
+ * into the same entities. An entity is replaced only when a merge actually
+ * changes one of its fields, so selectors can compare by identity.
+ */
+
+export interface PatientEntity {
+  id: string;
+  // Raw API fields, shallow-merged from every endpoint that returned this patient
+  record: Record<string, any>;
+  // Transformed record from the patient stream, if it has been streamed
+  info?: PatientInfo;
+  // Restored from a saved snapshot; the first fresh record replaces it instead of merging
+  provisional?: boolean;
+}
+
+type Listener = () => void;
+
+/**
+ * Stable string id for a raw API patient record, or null if it has none
+ */
+export function getPatientRecordId(record: any): string | null {
+  const id = record?.patient_id ?? record?.id;
+  return id === undefined || id === null ? null : id.toString();
+}
+
+/**
+ * Structural equality for JSON values
+ */
+function jsonEqual(a: any, b: any): boolean {
+  if (a === b) return true;
+  if (typeof a !== 'object' || typeof b !== 'object' || a === null || b === null) return false;
+  if (Array.isArray(a) !== Array.isArray(b)) return false;
+
+  const keys = Object.keys(a);
+  if (keys.length !== Object.keys(b).length) return false;
+  return keys.every(key => jsonEqual(a[key], b[key]));
+}
+
+// True if merging `record` would not change any field of `current`
+function isSubsetOf(record: Record<string, any>, current: Record<string, any>): boolean {
+  for (const key in record) {
+    if (!jsonEqual(current[key], record[key])) return false;
+  }
+  return true;
+}
+
+export class PatientStore {
+  private entities = new Map<string, PatientEntity>();
+  private listeners = new Set<Listener>();
+  // Ids in the order of the latest /risk-patients response
+  private riskPatientIds: string[] = [];
+  private version = 0;
+  private riskPatientsCache: { version: number; entities: PatientEntity[] } | null = null;
+
+  /**
+   * Register a change listener; returns the unsubscribe function
+   */
+  subscribe = (listener: Listener): (() => void) => {
+    this.listeners.add(listener);
+    return () => {
+      this.listeners.delete(listener);
+    };
+  };
+
+  /**
+   * Counter bumped on every change, usable as a useSyncExternalStore snapshot
+   */
+  getVersion = (): number => this.version;
+
+  get(id: string): PatientEntity | undefined {
+    return this.entities.get(id);
+  }
+
+  /**
+   * Entities of the latest risk list, in response order.
+   * Returns the same array until one of those entities or the list changes.
+   */
+  getRiskPatients(): PatientEntity[] {
+    const cache = this.riskPatientsCache;
+    if (cache?.version !== this.version) {
+      const entities: PatientEntity[] = [];
+      for (const id of this.riskPatientIds) {
+        const entity = this.entities.get(id);
+        if (entity) entities.push(entity);
+      }
+      // Changes to patients outside the risk list leave it as it was
+      const unchanged = cache !== null && cache.entities.length === entities.length &&
+        entities.every((entity, index) => entity === cache.entities[index]);
+      this.riskPatientsCache = { version: this.version, entities: unchanged ? cache.entities : entities };
+    }
+    return this.riskPatientsCache.entities;
+  }
+
+  /**
+   * Merge raw API records into their entities. Records without an id are ignored.
+   */
+  mergeRecords(records: any[]): void {
+    if (this.mergeInto(records)) this.emitChange();
+  }
+
+  /**
+   * Replace the risk list with `records`, merging them into their entities.
+   * Provisional records (e.g. from a saved snapshot) only fill in patients
+   * that have no fresh data yet, and are replaced wholesale once fresh data arrives.
+   */
+  setRiskPatients(records: any[], options: { provisional?: boolean } = {}): void {
+    const ids: string[] = [];
+    for (const record of records) {
+      const id = getPatientRecordId(record);
+      if (id !== null) ids.push(id);
+    }
+
+    let changed = ids.length !== this.riskPatientIds.length ||
+      ids.some((id, index) => id !== this.riskPatientIds[index]);
+    if (changed) this.riskPatientIds = ids;
+
+    if (this.mergeInto(records, options.provisional === true)) changed = true;
+    if (changed) this.emitChange();
+  }
+
+  /**
+   * Apply pushed risk updates: merge `records` and add patients not yet in the
+   * risk list to its front. Returns the ids that were added.
+   */
+  upsertRiskPatients(records: any[]): string[] {
+    const listed = new Set(this.riskPatientIds);
+    const added: string[] = [];
+    for (const record of records) {
+      const id = getPatientRecordId(record);
+      if (id !== null && !listed.has(id)) {
+        listed.add(id);
+        added.push(id);
+      }
+    }
+
+    let changed = this.mergeInto(records);
+    if (added.length > 0) {
+      this.riskPatientIds = [...added, ...this.riskPatientIds];
+      changed = true;
+    }
+    if (changed) this.emitChange();
+    return added;
+  }
+
+  /**
+   * Drop patients from the risk list; their entities are kept
+   */
+  removeRiskPatients(ids: string[]): void {
+    const removed = new Set(ids);
+    const remaining = this.riskPatientIds.filter(id => !removed.has(id));
+    if (remaining.length === this.riskPatientIds.length) return;
+
+    this.riskPatientIds = remaining;
+    this.emitChange();
+  }
+
+  // Merge records without notifying; returns whether any entity changed
+  private mergeInto(records: any[], provisional = false): boolean {
+    let changed = false;
+
+    for (const record of records) {
+      const id = getPatientRecordId(record);
+      if (id === null) continue;
+
+      const existing = this.entities.get(id);
+      if (existing && provisional) continue;
+      if (existing && !existing.provisional && isSubsetOf(record, existing.record)) continue;
+
+      const replace = !existing || existing.provisional;
+      this.entities.set(id, {
+        id,
+        record: replace ? { ...record } : { ...existing.record, ...record },
+        info: existing?.info,
+        provisional: provisional || undefined
+      });
+      changed = true;
+    }
+
+    return changed;
+  }
+
+  /**
+   * Attach streamed PatientInfo records to their entities. Patients whose
+   * info is unchanged keep their entity, and listeners are notified only if
+   * at least one entity changed.
+   */
+  mergePatientInfo(patients: PatientInfo[]): void {
+    let changed = false;
+
+    for (const info of patients) {
+      const existing = this.entities.get(info.id);
+      // Re-streamed patients arrive as new objects with equal contents
+      if (existing?.info && jsonEqual(existing.info, info)) continue;
+
+      this.entities.set(info.id, {
+        id: info.id,
+        record: existing?.record ?? {},
+        info,
+        provisional: existing?.provisional
+      });
+      changed = true;
+    }
+
+    if (changed) this.emitChange();
+  }
+
+  private emitChange(): void {
+    this.version++;
+    this.listeners.forEach(listener => listener());
+  }
+}
+
+// Single store shared across pages
+export const patientStore = new PatientStore();
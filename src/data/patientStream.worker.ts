@@ -0,0 +1,60 @@
+import { streamAllPatients } from './adapter';
+import { transformPatientData } from './patients';
+import type { PatientStreamRequest, PatientStreamEvent } from './patientStreamClient';
+
+/**
+ * Patient stream worker
+ * 
+ * Owns the streaming fetch, NDJSON parsing and transformation for one stream
+ * and posts transformed batches back to the main thread. Each batch waits for
+ * an acknowledgement from the main thread, so the stream stops reading while
+ * the UI is behind. The client terminates the worker to cancel the stream.
+ */
+
+const post = (event: PatientStreamEvent) => {
+  self.postMessage(event);
+};
+
+// Resolvers for posted batches the main thread hasn't acknowledged yet
+const pendingAcks = new Map<number, () => void>();
+let nextBatchId = 0;
+// Latest batch size requested by the main thread; the stream resumes with it once it diverges enough
+let batchSize: number | undefined;
+
+const startStream = async (options: Extract<PatientStreamRequest, { type: 'start' }>['options']) => {
+  batchSize = options.batchSize;
+  
+  await streamAllPatients(
+    (patients, processedCount, totalPatients) => {
+      const id = nextBatchId++;
+      post({ type: 'batch', id, patients: patients.map(transformPatientData), processedCount, totalPatients });
+      return new Promise<void>(resolve => pendingAcks.set(id, resolve));
+    },
+    metadata => post({ type: 'metadata', metadata }),
+    summary => post({ type: 'summary', summary }),
+    error => post({ type: 'error', error }),
+    {
+      ...options,
+      getBatchSize: () => batchSize,
+      onReconnect: (attempt, delayMs) => post({ type: 'reconnect', attempt, delayMs })
+    }
+  );
+  
+  post({ type: 'done' });
+};
+
+self.addEventListener('message', (event: MessageEvent<PatientStreamRequest>) => {
+  const request = event.data;
+  switch (request.type) {
+    case 'start':
+      startStream(request.options);
+      break;
+    case 'ack':
+      pendingAcks.get(request.id)?.();
+      pendingAcks.delete(request.id);
+      break;
+    case 'batchSize':
+      batchSize = request.batchSize;
+      break;
+  }
+});
@@ -0,0 +1,74 @@
+import { afterAll, bench, describe, vi } from 'vitest'
+import { createMockServer, makePatient } from '../../mock/server.js'
+import { transformPatientData } from './patients'
+
+/**
+ * Main-thread cost of a 50k-patient stream, before and after the worker pipeline.
+ * Before, fetching, NDJSON parsing and transformation all ran on the main thread.
+ * After, the worker does that and the main thread only receives transformed
+ * batches (structured clone) and merges them into the store. A task longer than
+ * 50ms blocks input, so the number of such gaps is reported for each path.
+ */
+
+const PATIENT_COUNT = 50000
+const BATCH_SIZE = 100
+const LONG_TASK_MS = 50
+
+const server = await createMockServer({ scenario: { patients: PATIENT_COUNT } })
+vi.stubEnv('VITE_API_BASE_URL', server.url)
+const { streamAllPatients } = await import('./adapter')
+const { patientStore } = await import('./patientStore')
+
+// What the worker posts, transformed ahead of time as it would be off the main thread
+const workerBatches = Array.from({ length: PATIENT_COUNT / BATCH_SIZE }, (_, batch) =>
+  Array.from({ length: BATCH_SIZE }, (_, offset) => transformPatientData(makePatient(batch * BATCH_SIZE + offset)))
+)
+
+const longTasks: Record<string, number[]> = { 'main thread': [], worker: [] }
+
+afterAll(async () => {
+  await server.close()
+  Object.entries(longTasks).forEach(([path, counts]) => {
+    console.log(`${path}: ${Math.max(...counts)} main-thread tasks over ${LONG_TASK_MS}ms per run`)
+  })
+})
+
+/**
+ * Count gaps of more than LONG_TASK_MS between timer ticks until the returned function is called
+ */
+const watchLongTasks = () => {
+  let count = 0
+  let last = performance.now()
+  let timer = setTimeout(function tick() {
+    const now = performance.now()
+    if (now - last > LONG_TASK_MS) count++
+    last = now
+    timer = setTimeout(tick, 0)
+  }, 0)
+  return () => {
+    clearTimeout(timer)
+    return count
+  }
+}
+
+const noop = () => {}
+
+describe(`main-thread work for a ${PATIENT_COUNT}-patient stream`, () => {
+  bench('fetch, parse and transform on the main thread', async () => {
+    const stop = watchLongTasks()
+    await streamAllPatients(patients => {
+      patientStore.mergePatientInfo(patients.map(transformPatientData))
+    }, noop, noop, noop, { batchSize: BATCH_SIZE })
+    longTasks['main thread'].push(stop())
+  }, { iterations: 3, time: 0 })
+
+  bench('receive transformed batches from the worker', async () => {
+    const stop = watchLongTasks()
+    for (const batch of workerBatches) {
+      // Each batch arrives as its own message event
+      await new Promise(resolve => setTimeout(resolve, 0))
+      patientStore.mergePatientInfo(structuredClone(batch))
+    }
+    longTasks.worker.push(stop())
+  }, { iterations: 3, time: 0 })
+})
@@ -0,0 +1,127 @@
+import { streamAllPatients, StreamPatientsOptions } from './adapter';
+import { PatientInfo, transformPatientData } from './patients';
+import { patientStore } from './patientStore';
+
+/**
+ * Patient stream client
+ * 
+ * Runs the patient stream in a Web Worker so fetching, NDJSON parsing and
+ * transformation to PatientInfo happen off the main thread. The main thread
+ * only receives transformed batches. Falls back to streaming on the main
+ * thread where workers are unavailable. Every batch is also merged into the
+ * shared patient store.
+ * 
+ * Each batch is acknowledged once the consumer's onBatch (or the promise it
+ * returns) completes; the worker stops reading while too many batches are
+ * unacknowledged. `getBatchSize` is forwarded to the worker as it changes.
+ */
+
+export type WorkerStreamOptions = Omit<StreamPatientsOptions, 'signal' | 'onReconnect' | 'getBatchSize'>;
+
+export type PatientStreamRequest =
+  | { type: 'start'; options: WorkerStreamOptions }
+  | { type: 'ack'; id: number }
+  | { type: 'batchSize'; batchSize: number };
+
+export type PatientStreamEvent =
+  | { type: 'batch'; id: number; patients: PatientInfo[]; processedCount: number; totalPatients: number }
+  | { type: 'metadata'; metadata: any }
+  | { type: 'summary'; summary: any }
+  | { type: 'error'; error: string }
+  | { type: 'reconnect'; attempt: number; delayMs: number }
+  | { type: 'done' };
+
+/**
+ * Stream transformed patients, resolving when the stream ends or is aborted
+ */
+export function streamPatientsInWorker(
+  onBatch: (patients: PatientInfo[], processedCount: number, totalPatients: number) => void | Promise<void>,
+  onMetadata: (metadata: any) => void,
+  onSummary: (summary: any) => void,
+  onError: (error: string) => void,
+  options: StreamPatientsOptions = {}
+): Promise<void> {
+  const { signal, onReconnect, getBatchSize, ...workerOptions } = options;
+  const deliverBatch = (patients: PatientInfo[], processedCount: number, totalPatients: number) => {
+    patientStore.mergePatientInfo(patients);
+    return onBatch(patients, processedCount, totalPatients);
+  };
+  
+  if (typeof Worker === 'undefined') {
+    return streamAllPatients(
+      (patients, processedCount, totalPatients) =>
+        deliverBatch(patients.map(transformPatientData), processedCount, totalPatients),
+      onMetadata,
+      onSummary,
+      onError,
+      options
+    );
+  }
+  
+  return new Promise<void>(resolve => {
+    if (signal?.aborted) {
+      resolve();
+      return;
+    }
+    
+    const worker = new Worker(new URL('./patientStream.worker.ts', import.meta.url), { type: 'module' });
+    const send = (message: PatientStreamRequest) => worker.postMessage(message);
+    
+    // The worker checks batchSize between batches, so polling on each acknowledged batch is enough
+    let sentBatchSize = getBatchSize?.() ?? workerOptions.batchSize;
+    const syncBatchSize = () => {
+      const batchSize = getBatchSize?.();
+      if (batchSize && batchSize !== sentBatchSize) {
+        sentBatchSize = batchSize;
+        send({ type: 'batchSize', batchSize });
+      }
+    };
+    
+    // Terminating the worker also cancels its in-flight fetch
+    const finish = () => {
+      worker.terminate();
+      signal?.removeEventListener('abort', finish);
+      resolve();
+    };
+    signal?.addEventListener('abort', finish, { once: true });
+    
+    worker.onmessage = (event: MessageEvent<PatientStreamEvent>) => {
+      if (signal?.aborted) return;
+      
+      const data = event.data;
+      switch (data.type) {
+        case 'batch': {
+          const ack = () => {
+            if (!signal?.aborted) send({ type: 'ack', id: data.id });
+            syncBatchSize();
+          };
+          Promise.resolve(deliverBatch(data.patients, data.processedCount, data.totalPatients)).then(ack, ack);
+          break;
+        }
+        case 'metadata':
+          onMetadata(data.metadata);
+          break;
+        case 'summary':
+          onSummary(data.summary);
+          break;
+        case 'error':
+          onError(data.error);
+          break;
+        case 'reconnect':
+          onReconnect?.(data.attempt, data.delayMs);
+          break;
+        case 'done':
+          finish();
+          break;
+      }
+    };
+    
+    worker.onerror = (event: ErrorEvent) => {
+      console.error('Patient stream worker failed:', event.message);
+      onError(event.message || 'Patient stream worker failed');
+      finish();
+    };
+    
+    send({ type: 'start', options: { ...workerOptions, batchSize: sentBatchSize } });
+  });
+}
@@ -0,0 +1,102 @@
+/**
+ * Patient records for the Doctor Dashboard patient list
+ * 
+ * Shared by the patient stream worker and the main thread, so this module must
+ * stay free of DOM and React dependencies.
+ */
+
+export interface PatientInfo {
+  id: string;
+  name: string;
+  age: number;
+  gender: 'M' | 'F' | 'Other';
+  riskLevel: 'low' | 'medium' | 'high';
+  lastAssessment: string;
+  conditions: string[];
+  medications: string[];
+  emergencyContact: string;
+  lastUpdate: string;
+  status: 'active' | 'monitoring' | 'critical';
+  // API-specific fields from /api/patients endpoint
+  patient_id?: number;
+  zip_code?: string;
+  phone_number?: string;
+  email?: string;
+  address?: string;
+  pregnancy_weeks?: number;
+  trimester?: number;
+  pregnancy_description?: string;
+  risk_score?: number;
+  heat_wave_risk?: boolean;
+  created_at?: string;
+  updated_at?: string;
+  // Precomputed once per patient so sorting never re-derives them
+  sortKeys: PatientSortKeys;
+}
+
+export interface PatientSortKeys {
+  risk: number;
+  timestamp: number;
+  name: string;
+}
+
+const RISK_ORDINAL = { high: 3, medium: 2, low: 1 };
+
+/**
+ * Derive sort keys: risk ordinal, parsed update time and a collation key for the name
+ */
+export function computeSortKeys(riskLevel: 'low' | 'medium' | 'high', lastUpdate: string, name: string): PatientSortKeys {
+  return {
+    risk: RISK_ORDINAL[riskLevel],
+    timestamp: Date.parse(lastUpdate) || 0,
+    // Case- and accent-insensitive, so plain string comparison matches a base collation
+    name: name.normalize('NFD').replace(/[\u0300-\u036f]/g, '').toLowerCase()
+  };
+}
+
+/**
+ * Text indexed for patient search: name, conditions and medications
+ */
+export function getPatientSearchText(patient: PatientInfo): string {
+  return [patient.name, ...(patient.conditions || []), ...(patient.medications || [])].join(' ');
+}
+
+/**
+ * Transform patient data from API to PatientInfo format
+ */
+export function transformPatientData(patient: any): PatientInfo {
+  // Determine status based on risk score or heat wave risk
+  let status: 'active' | 'monitoring' | 'critical';
+  let riskLevel: 'low' | 'medium' | 'high';
+  
+  if (patient.risk_score >= 8 || patient.heat_wave_risk) {
+    riskLevel = 'high';
+    status = 'critical';
+  } else if (patient.risk_score >= 5) {
+    riskLevel = 'medium';
+    status = 'monitoring';
+  } else {
+    riskLevel = 'low';
+    status = 'active';
+  }
+  
+  const transformed: Omit<PatientInfo, 'sortKeys'> = {
+    id: patient.patient_id?.toString() || patient.id?.toString() || 'unknown',
+    name: patient.name || 'Unknown Patient',
+    age: patient.age || 28,
+    gender: (patient.gender || 'F') as 'M' | 'F' | 'Other',
+    riskLevel,
+    lastAssessment: `Assessment completed ${new Date(patient.updated_at || patient.created_at || Date.now()).toLocaleDateString()}`,
+    conditions: patient.pregnancy_weeks ? [`Pregnancy - ${patient.pregnancy_weeks} weeks`] : ['No conditions listed'],
+    medications: patient.medications || ['Prenatal Vitamins'],
+    emergencyContact: patient.phone_number || '+1 (555) 123-4567',
+    lastUpdate: patient.updated_at || patient.created_at || new Date().toISOString(),
+    status,
+    // Store original API data
+    ...patient
+  };
+  
+  return Object.assign(transformed, {
+    sortKeys: computeSortKeys(transformed.riskLevel, transformed.lastUpdate, transformed.name || '')
+  });
+}
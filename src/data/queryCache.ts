@@ -0,0 +1,207 @@
+/**
+ * Query cache for the data adapter
+ *
+ * Caches resolved query results keyed by request URL, shares a single in-flight
+ * request between concurrent callers, expires entries after a per-query TTL and
+ * evicts the least recently used entries once the cache is full. Expired
+ * entries are kept until evicted so they can be served as a stale fallback
+ * when a refetch fails. A cache can
+ * also be bounded by total weight (e.g. estimated bytes) instead of only by
+ * entry count.
+ */
+
+interface CacheEntry {
+  value: unknown;
+  expiresAt: number;
+  weight: number;
+}
+
+interface InFlightQuery {
+  promise: Promise<unknown>;
+  controller: AbortController;
+  // Callers still waiting on the shared request
+  subscribers: number;
+}
+
+export interface QueryOptions {
+  // Time-to-live in milliseconds for the resolved value
+  ttl?: number;
+  // Abort this caller's wait; the shared request is aborted once every caller has left
+  signal?: AbortSignal;
+  // Resolve with an expired value instead of rejecting when this returns true for the error
+  staleIfError?: (error: unknown) => boolean;
+}
+
+export interface QueryCacheLimits {
+  // Upper bound on the summed weight of all entries
+  maxWeight?: number;
+  // Weight of a value, e.g. its approximate size in bytes
+  weigh?: (value: unknown) => number;
+}
+
+export function createAbortError(): DOMException {
+  return new DOMException('The operation was aborted.', 'AbortError');
+}
+
+export class QueryCache {
+  // Map iteration order doubles as the LRU order (oldest first)
+  private entries = new Map<string, CacheEntry>();
+  private inFlight = new Map<string, InFlightQuery>();
+  private totalWeight = 0;
+
+  constructor(
+    private maxEntries: number = 100,
+    private defaultTtl: number = 30 * 1000,
+    private limits: QueryCacheLimits = {}
+  ) {}
+
+  /**
+   * Summed weight of the cached entries
+   */
+  get weight(): number {
+    return this.totalWeight;
+  }
+
+  /**
+   * Return the cached value for `key`, joining an in-flight request or
+   * calling `fetcher` when there is neither. Rejections are never cached.
+   */
+  fetch<T>(
+    key: string,
+    fetcher: (signal: AbortSignal) => Promise<T>,
+    options: QueryOptions = {}
+  ): Promise<T> {
+    const { signal } = options;
+    if (signal?.aborted) {
+      return Promise.reject(createAbortError());
+    }
+
+    const cached = this.get<T>(key);
+    if (cached !== undefined) {
+      return Promise.resolve(cached);
+    }
+
+    let query = this.inFlight.get(key);
+    if (!query) {
+      const controller = new AbortController();
+      const promise: Promise<T> = fetcher(controller.signal)
+        .then(value => {
+          // Only store the result if the query wasn't invalidated meanwhile
+          if (this.inFlight.get(key) === query) {
+            this.set(key, value, options.ttl);
+          }
+          return value;
+        })
+        .catch(error => {
+          const stale = options.staleIfError?.(error) ? this.getStale<T>(key) : undefined;
+          if (stale === undefined) throw error;
+          return stale;
+        })
+        .finally(() => {
+          if (this.inFlight.get(key) === query) {
+            this.inFlight.delete(key);
+          }
+        });
+      query = { promise, controller, subscribers: 0 };
+      this.inFlight.set(key, query);
+    }
+
+    const shared = query;
+    shared.subscribers++;
+    if (!signal) {
+      // Callers without a signal keep the shared request alive until it settles
+      return shared.promise as Promise<T>;
+    }
+
+    return new Promise<T>((resolve, reject) => {
+      const onAbort = () => {
+        reject(createAbortError());
+        shared.subscribers--;
+        if (shared.subscribers === 0) {
+          shared.controller.abort();
+          if (this.inFlight.get(key) === shared) {
+            this.inFlight.delete(key);
+          }
+        }
+      };
+      signal.addEventListener('abort', onAbort, { once: true });
+
+      (shared.promise as Promise<T>).then(
+        value => {
+          signal.removeEventListener('abort', onAbort);
+          resolve(value);
+        },
+        error => {
+          signal.removeEventListener('abort', onAbort);
+          reject(error);
+        }
+      );
+    });
+  }
+
+  /**
+   * Get a fresh cached value, or undefined if missing or expired
+   */
+  get<T>(key: string): T | undefined {
+    const entry = this.entries.get(key);
+    if (!entry) return undefined;
+
+    // Expired entries stay around for getStale until evicted
+    if (entry.expiresAt <= Date.now()) return undefined;
+
+    // Move to the most recently used position
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    return entry.value as T;
+  }
+
+  /**
+   * Get a cached value even if it has expired
+   */
+  getStale<T>(key: string): T | undefined {
+    return this.entries.get(key)?.value as T | undefined;
+  }
+
+  /**
+   * Store a value, evicting the least recently used entries if needed
+   */
+  set<T>(key: string, value: T, ttl: number = this.defaultTtl): void {
+    const { maxWeight = Infinity, weigh } = this.limits;
+    const weight = weigh ? weigh(value) : 0;
+
+    this.delete(key);
+    this.entries.set(key, { value, expiresAt: Date.now() + ttl, weight });
+    this.totalWeight += weight;
+
+    // The newest entry is always kept, even if it alone exceeds maxWeight
+    while (this.entries.size > this.maxEntries || (this.totalWeight > maxWeight && this.entries.size > 1)) {
+      const oldestKey = this.entries.keys().next().value as string;
+      this.delete(oldestKey);
+    }
+  }
+
+  /**
+   * Expire cached values and detach in-flight requests. Expired values are only
+   * served again through getStale. Accepts a key prefix or a predicate; with no
+   * argument everything is invalidated.
+   */
+  invalidate(match?: string | ((key: string) => boolean)): void {
+    const matches = typeof match === 'function'
+      ? match
+      : (key: string) => match === undefined || key.startsWith(match);
+
+    this.entries.forEach((entry, key) => {
+      if (matches(key)) entry.expiresAt = 0;
+    });
+    for (const key of Array.from(this.inFlight.keys())) {
+      if (matches(key)) this.inFlight.delete(key);
+    }
+  }
+
+  private delete(key: string): void {
+    const entry = this.entries.get(key);
+    if (!entry) return;
+    this.totalWeight -= entry.weight;
+    this.entries.delete(key);
+  }
+}
@@ -0,0 +1,160 @@
+import { Message } from '../types';
+
+/**
+ * Read/unread state for inbox messages
+ *
+ * Read ids live in an in-memory Set for O(1) lookups. Changes are written to
+ * localStorage in one debounced, compacted write (and flushed when the page is
+ * hidden), and are shared with other open tabs through a BroadcastChannel,
+ * falling back to storage events where BroadcastChannel is unavailable.
+ */
+
+// Same key as the original array of read ids, so existing state carries over
+const STORAGE_KEY = 'readMessages';
+const CHANNEL_NAME = 'health-notifier-read-state';
+const PERSIST_DELAY_MS = 500;
+// Oldest entries are dropped beyond this many read ids
+const MAX_READ_IDS = 10000;
+
+type ReadStateListener = () => void;
+
+interface ReadStateMessage {
+  id: string;
+  read: boolean;
+}
+
+function loadReadIds(): Set<string> {
+  try {
+    const stored = JSON.parse(localStorage.getItem(STORAGE_KEY) || '[]');
+    return new Set(Array.isArray(stored) ? stored.map(String) : []);
+  } catch {
+    return new Set();
+  }
+}
+
+class ReadState {
+  private ids: Set<string> | null = null;
+  private listeners = new Set<ReadStateListener>();
+  private persistTimer: ReturnType<typeof setTimeout> | null = null;
+  private channel: BroadcastChannel | null = null;
+  // Bumped on every change so derived lists can tell when to re-apply flags
+  version = 0;
+
+  isRead(id: string): boolean {
+    return this.getIds().has(id);
+  }
+
+  /**
+   * Mark a message read or unread, persist it and tell other tabs
+   */
+  setRead(id: string, read: boolean): void {
+    if (!this.apply(id, read)) return;
+    this.schedulePersist();
+    const message: ReadStateMessage = { id, read };
+    this.channel?.postMessage(message);
+  }
+
+  subscribe(listener: ReadStateListener): () => void {
+    this.listeners.add(listener);
+    return () => {
+      this.listeners.delete(listener);
+    };
+  }
+
+  /**
+   * Write pending changes now instead of waiting for the debounce
+   */
+  flush(): void {
+    if (this.persistTimer === null) return;
+    clearTimeout(this.persistTimer);
+    this.persistTimer = null;
+    this.persist();
+  }
+
+  private getIds(): Set<string> {
+    if (!this.ids) {
+      this.ids = loadReadIds();
+      this.connect();
+    }
+    return this.ids;
+  }
+
+  // Update the set; returns whether anything changed
+  private apply(id: string, read: boolean): boolean {
+    const ids = this.getIds();
+    if (ids.has(id) === read) return false;
+
+    if (read) ids.add(id);
+    else ids.delete(id);
+    this.emitChange();
+    return true;
+  }
+
+  private emitChange(): void {
+    this.version++;
+    this.listeners.forEach(listener => listener());
+  }
+
+  private schedulePersist(): void {
+    if (this.persistTimer !== null) return;
+    this.persistTimer = setTimeout(() => {
+      this.persistTimer = null;
+      this.persist();
+    }, PERSIST_DELAY_MS);
+  }
+
+  private persist(): void {
+    const ids = this.getIds();
+
+    // Sets iterate in insertion order, so the oldest read ids are dropped first
+    while (ids.size > MAX_READ_IDS) {
+      ids.delete(ids.values().next().value as string);
+    }
+
+    try {
+      localStorage.setItem(STORAGE_KEY, JSON.stringify(Array.from(ids)));
+    } catch (error) {
+      console.warn('Could not persist read state:', error);
+    }
+  }
+
+  private connect(): void {
+    if (typeof window === 'undefined') return;
+
+    if (typeof BroadcastChannel !== 'undefined') {
+      this.channel = new BroadcastChannel(CHANNEL_NAME);
+      this.channel.onmessage = (event: MessageEvent<ReadStateMessage>) => {
+        this.apply(event.data.id, event.data.read);
+      };
+    } else {
+      // Another tab persisted its changes; reload the whole set
+      window.addEventListener('storage', event => {
+        if (event.key !== STORAGE_KEY) return;
+        this.ids = loadReadIds();
+        this.emitChange();
+      });
+    }
+
+    window.addEventListener('pagehide', () => this.flush());
+    document.addEventListener('visibilitychange', () => {
+      if (document.visibilityState === 'hidden') this.flush();
+    });
+  }
+}
+
+export const readState = new ReadState();
+
+/**
+ * Return `messages` with read flags from the read state; unchanged messages
+ * (and the array itself, if nothing changed) are returned as-is
+ */
+export function applyReadState(messages: Message[]): Message[] {
+  let changed = false;
+  const result = messages.map(message => {
+    const read = readState.isRead(message.id);
+    if (message.read === read) return message;
+    changed = true;
+    return { ...message, read };
+  });
+  return changed ? result : messages;
+}
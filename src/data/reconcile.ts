@@ -0,0 +1,69 @@
+import { Message } from '../types';
+
+/**
+ * Structural sharing for refreshed message lists
+ *
+ * A refresh returns fresh objects for every message. Reconciling against the
+ * previous list keeps the previous object for every message whose fields are
+ * unchanged, so memoized rows and widgets can skip them by identity. When
+ * nothing changed at all the previous array itself is returned.
+ */
+
+export interface MessageDiff {
+  messages: Message[];
+  added: string[];
+  changed: string[];
+  removed: string[];
+}
+
+function messagesEqual(a: Message, b: Message): boolean {
+  return a.id === b.id &&
+    a.patientName === b.patientName &&
+    a.risk === b.risk &&
+    a.subject === b.subject &&
+    a.preview === b.preview &&
+    a.body === b.body &&
+    a.createdAt === b.createdAt &&
+    a.read === b.read;
+}
+
+/**
+ * Reconcile `next` against `prev`, reusing unchanged message objects
+ */
+export function reconcileMessages(prev: Message[], next: Message[]): MessageDiff {
+  const previousById = new Map<string, Message>();
+  for (const message of prev) {
+    previousById.set(message.id, message);
+  }
+
+  const added: string[] = [];
+  const changed: string[] = [];
+  let sameOrder = prev.length === next.length;
+
+  const messages = next.map((message, index) => {
+    const previous = previousById.get(message.id);
+    let result = message;
+
+    if (!previous) {
+      added.push(message.id);
+    } else if (previous === message || messagesEqual(previous, message)) {
+      result = previous;
+    } else {
+      changed.push(message.id);
+    }
+
+    if (sameOrder && prev[index] !== result) sameOrder = false;
+    previousById.delete(message.id);
+    return result;
+  });
+
+  // Whatever was not matched by the new list has been removed
+  const removed = Array.from(previousById.keys());
+
+  return {
+    messages: sameOrder ? prev : messages,
+    added,
+    changed,
+    removed
+  };
+}
@@ -0,0 +1,194 @@
+/**
+ * In-memory full-text search index
+ *
+ * An inverted index from tokens to document ids, plus a trigram index over the
+ * token vocabulary for fuzzy matching. Documents can be added one batch at a
+ * time while a stream is loading. A query matches documents containing every
+ * query term, either as a token prefix or, for longer terms, as a close
+ * misspelling of a token.
+ */
+
+export interface SearchOptions {
+  // Also match tokens that share most trigrams with a term (typo tolerance)
+  fuzzy?: boolean;
+}
+
+// Minimum term length for fuzzy matching and the trigram similarity it requires
+const FUZZY_MIN_LENGTH = 4;
+const FUZZY_THRESHOLD = 0.5;
+
+/**
+ * Split text into lowercased, accent-folded alphanumeric tokens
+ */
+export function tokenize(text: string): string[] {
+  return text
+    .normalize('NFD')
+    .replace(/[\u0300-\u036f]/g, '')
+    .toLowerCase()
+    .split(/[^a-z0-9]+/)
+    .filter(Boolean);
+}
+
+function trigramsOf(token: string): string[] {
+  const padded = ` ${token} `;
+  const result: string[] = [];
+  for (let i = 0; i + 3 <= padded.length; i++) {
+    result.push(padded.slice(i, i + 3));
+  }
+  return result;
+}
+
+export class SearchIndex {
+  private postings = new Map<string, Set<string>>();
+  private trigrams = new Map<string, Set<string>>();
+  private documents = new Map<string, string[]>();
+  // Sorted vocabulary for prefix lookups. Tokens added or removed since the
+  // last lookup are merged in on the next one instead of re-sorting it all.
+  private sortedTokens: string[] = [];
+  private addedTokens: string[] = [];
+  private removedTokens = new Set<string>();
+
+  get size(): number {
+    return this.documents.size;
+  }
+
+  /**
+   * Index a document, replacing any previous text for the same id
+   */
+  add(id: string, text: string): void {
+    if (this.documents.has(id)) this.remove(id);
+
+    const tokens = Array.from(new Set(tokenize(text)));
+    this.documents.set(id, tokens);
+
+    for (const token of tokens) {
+      let ids = this.postings.get(token);
+      if (!ids) {
+        ids = new Set();
+        this.postings.set(token, ids);
+        // A token removed since the last merge is still in the sorted list
+        if (!this.removedTokens.delete(token)) this.addedTokens.push(token);
+
+        for (const trigram of trigramsOf(token)) {
+          let vocabulary = this.trigrams.get(trigram);
+          if (!vocabulary) {
+            vocabulary = new Set();
+            this.trigrams.set(trigram, vocabulary);
+          }
+          vocabulary.add(token);
+        }
+      }
+      ids.add(id);
+    }
+  }
+
+  remove(id: string): void {
+    const tokens = this.documents.get(id);
+    if (!tokens) return;
+
+    this.documents.delete(id);
+    for (const token of tokens) {
+      const ids = this.postings.get(token);
+      if (!ids) continue;
+      ids.delete(id);
+
+      if (ids.size === 0) {
+        this.postings.delete(token);
+        this.removedTokens.add(token);
+        for (const trigram of trigramsOf(token)) {
+          this.trigrams.get(trigram)?.delete(token);
+        }
+      }
+    }
+  }
+
+  /**
+   * Return ids of documents matching every term in `query`
+   */
+  search(query: string, options: SearchOptions = {}): Set<string> {
+    const { fuzzy = true } = options;
+    const terms = tokenize(query);
+    let result: Set<string> | null = null;
+
+    for (const term of terms) {
+      const matches = new Set<string>();
+      const tokens = this.prefixTokens(term);
+      if (fuzzy && term.length >= FUZZY_MIN_LENGTH) {
+        tokens.push(...this.fuzzyTokens(term));
+      }
+
+      for (const token of tokens) {
+        this.postings.get(token)?.forEach(id => {
+          if (!result || result.has(id)) matches.add(id);
+        });
+      }
+
+      result = matches;
+      if (result.size === 0) break;
+    }
+
+    return result ?? new Set();
+  }
+
+  /**
+   * Bring the sorted vocabulary up to date: sort only the new tokens and
+   * merge them in, dropping removed ones
+   */
+  private mergeTokens(): string[] {
+    if (this.addedTokens.length === 0 && this.removedTokens.size === 0) return this.sortedTokens;
+
+    const sorted = this.sortedTokens;
+    const added = this.addedTokens.sort();
+    const removed = this.removedTokens;
+    const merged: string[] = [];
+    let i = 0;
+    let j = 0;
+    while (i < sorted.length || j < added.length) {
+      const token = j >= added.length || (i < sorted.length && sorted[i] < added[j]) ? sorted[i++] : added[j++];
+      if (!removed.has(token)) merged.push(token);
+    }
+
+    this.sortedTokens = merged;
+    this.addedTokens = [];
+    this.removedTokens = new Set();
+    return merged;
+  }
+
+  private prefixTokens(prefix: string): string[] {
+    const tokens = this.mergeTokens();
+
+    // Binary search for the first token >= prefix
+    let low = 0;
+    let high = tokens.length;
+    while (low < high) {
+      const mid = (low + high) >> 1;
+      if (tokens[mid] < prefix) low = mid + 1;
+      else high = mid;
+    }
+
+    const result: string[] = [];
+    for (let i = low; i < tokens.length && tokens[i].startsWith(prefix); i++) {
+      result.push(tokens[i]);
+    }
+    return result;
+  }
+
+  private fuzzyTokens(term: string): string[] {
+    const termTrigrams = trigramsOf(term);
+    const shared = new Map<string, number>();
+
+    for (const trigram of termTrigrams) {
+      this.trigrams.get(trigram)?.forEach(token => {
+        shared.set(token, (shared.get(token) ?? 0) + 1);
+      });
+    }
+
+    // Dice coefficient over trigram sets
+    const result: string[] = [];
+    shared.forEach((count, token) => {
+      const similarity = (2 * count) / (termTrigrams.length + token.length);
+      if (similarity >= FUZZY_THRESHOLD) result.push(token);
+    });
+    return result;
+  }
+}
@@ -0,0 +1,36 @@
+import 'fake-indexeddb/auto'
+import { afterAll, beforeAll, bench, describe, expect, vi } from 'vitest'
+import { createMockServer } from '../../mock/server.js'
+
+// A risk list fetched over a clinic connection with noticeable latency
+const server = await createMockServer({ scenario: { riskPatients: 500, latencyMs: 150 } })
+vi.stubEnv('VITE_API_BASE_URL', server.url)
+
+afterAll(() => server.close())
+
+// Each run is a fresh page load: new module instances, same IndexedDB
+const loadAdapter = async () => {
+  vi.resetModules()
+  return import('./adapter')
+}
+
+describe('time to first inbox', () => {
+  beforeAll(async () => {
+    // A previous session loads the list and saves the snapshot after its write delay
+    const adapter = await loadAdapter()
+    await adapter.listMessages()
+    await new Promise(resolve => setTimeout(resolve, 2500))
+  })
+
+  bench('from the network', async () => {
+    const adapter = await loadAdapter()
+    const messages = await adapter.listMessages()
+    expect(messages).toHaveLength(500)
+  }, { iterations: 10, time: 0 })
+
+  bench('from the startup snapshot', async () => {
+    const adapter = await loadAdapter()
+    expect(await adapter.restoreSnapshot()).toBe(true)
+    expect(adapter.selectRiskMessages()).toHaveLength(500)
+  }, { iterations: 10, time: 0 })
+})
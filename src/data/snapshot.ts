@@ -0,0 +1,180 @@
+/**
+ * Persistent startup snapshot
+ *
+ * Keeps the last known risk-patient list and weather in IndexedDB so the app
+ * can render them immediately on the next start while fresh data loads in the
+ * background. Patients are stored in a compact form holding only the fields
+ * the inbox needs, the snapshot is capped in size and age, and a snapshot
+ * written by an older format version is discarded.
+ */
+
+const DB_NAME = 'health-notifier';
+const STORE_NAME = 'snapshot';
+const SNAPSHOT_KEY = 'latest';
+
+// Bump when the stored shape changes; older snapshots are ignored and deleted
+const SNAPSHOT_VERSION = 1;
+const MAX_SNAPSHOT_PATIENTS = 5000;
+// Approximate serialized size budget (characters of JSON)
+const MAX_SNAPSHOT_SIZE = 2 * 1024 * 1024;
+const MAX_SNAPSHOT_AGE_MS = 24 * 60 * 60 * 1000;
+const SAVE_DELAY_MS = 2000;
+
+export interface WeatherSnapshot {
+  weather?: any;
+  analysis?: any;
+}
+
+export interface SnapshotData {
+  // Compact risk-patient records, in risk-list order
+  patients: any[];
+  // Weather and AI analysis by location code
+  weather: Record<string, WeatherSnapshot>;
+}
+
+export interface Snapshot extends SnapshotData {
+  version: number;
+  savedAt: number;
+}
+
+/**
+ * Keep only the fields used to build inbox messages
+ */
+export function compactPatientRecord(record: any): any {
+  const compact: any = {
+    patient_id: record.patient_id,
+    name: record.name,
+    patient_name: record.patient_name,
+    risk_level: record.risk_level,
+    pregnancy_weeks: record.pregnancy_weeks,
+    trimester: record.trimester,
+    updated_at: record.updated_at,
+    created_at: record.created_at
+  };
+  if (record.basic_risk?.risk_level) {
+    compact.basic_risk = { risk_level: record.basic_risk.risk_level };
+  }
+  if (record.overall_assessment) {
+    compact.overall_assessment = {
+      risk_level: record.overall_assessment.risk_level,
+      // The inbox preview shows at most two concerns
+      immediate_concerns: (record.overall_assessment.immediate_concerns || []).slice(0, 2)
+    };
+  }
+
+  // Drop fields the record didn't have
+  for (const key of Object.keys(compact)) {
+    if (compact[key] === undefined) delete compact[key];
+  }
+  return compact;
+}
+
+let dbPromise: Promise<IDBDatabase> | null = null;
+
+function openDatabase(): Promise<IDBDatabase> {
+  if (!dbPromise) {
+    dbPromise = new Promise<IDBDatabase>((resolve, reject) => {
+      const openRequest = indexedDB.open(DB_NAME, 1);
+      openRequest.onupgradeneeded = () => {
+        openRequest.result.createObjectStore(STORE_NAME);
+      };
+      openRequest.onsuccess = () => resolve(openRequest.result);
+      openRequest.onerror = () => reject(openRequest.error);
+    });
+    // Allow a later retry if opening failed
+    dbPromise.catch(() => {
+      dbPromise = null;
+    });
+  }
+  return dbPromise;
+}
+
+async function runRequest<T>(mode: IDBTransactionMode, operation: (store: IDBObjectStore) => IDBRequest): Promise<T> {
+  const db = await openDatabase();
+  return new Promise<T>((resolve, reject) => {
+    const request = operation(db.transaction(STORE_NAME, mode).objectStore(STORE_NAME));
+    request.onsuccess = () => resolve(request.result as T);
+    request.onerror = () => reject(request.error);
+  });
+}
+
+let loadPromise: Promise<Snapshot | null> | null = null;
+
+/**
+ * Read the stored snapshot once per page load; null if missing, stale or unreadable
+ */
+export function loadSnapshot(): Promise<Snapshot | null> {
+  if (!loadPromise) {
+    loadPromise = readSnapshot();
+  }
+  return loadPromise;
+}
+
+async function readSnapshot(): Promise<Snapshot | null> {
+  if (typeof indexedDB === 'undefined') return null;
+
+  try {
+    const snapshot = await runRequest<Snapshot | undefined>('readonly', store => store.get(SNAPSHOT_KEY));
+    if (!snapshot) return null;
+
+    if (snapshot.version !== SNAPSHOT_VERSION || Date.now() - snapshot.savedAt > MAX_SNAPSHOT_AGE_MS) {
+      await clearSnapshot();
+      return null;
+    }
+    return snapshot;
+  } catch (error) {
+    console.warn('Could not read startup snapshot:', error);
+    return null;
+  }
+}
+
+/**
+ * Trim a snapshot to the size budget, dropping the tail of the patient list first
+ */
+function boundSnapshot(snapshot: Snapshot): Snapshot {
+  let patients = snapshot.patients.slice(0, MAX_SNAPSHOT_PATIENTS);
+  let size = JSON.stringify({ ...snapshot, patients }).length;
+
+  while (size > MAX_SNAPSHOT_SIZE && patients.length > 0) {
+    // Shrink proportionally to the overshoot rather than one record at a time
+    const keep = Math.floor(patients.length * (MAX_SNAPSHOT_SIZE / size) * 0.95);
+    patients = patients.slice(0, keep);
+    size = JSON.stringify({ ...snapshot, patients }).length;
+  }
+
+  return size > MAX_SNAPSHOT_SIZE ? { ...snapshot, patients: [], weather: {} } : { ...snapshot, patients };
+}
+
+let saveTimer: ReturnType<typeof setTimeout> | null = null;
+let pendingCollect: (() => SnapshotData) | null = null;
+
+/**
+ * Save a snapshot after a short delay; repeated calls within the delay write once.
+ * `collect` is called when the write happens, so it sees the latest state.
+ */
+export function scheduleSnapshotSave(collect: () => SnapshotData): void {
+  if (typeof indexedDB === 'undefined') return;
+
+  pendingCollect = collect;
+  if (saveTimer !== null) return;
+
+  saveTimer = setTimeout(() => {
+    saveTimer = null;
+    const collectData = pendingCollect;
+    pendingCollect = null;
+    if (!collectData) return;
+
+    const snapshot = boundSnapshot({ ...collectData(), version: SNAPSHOT_VERSION, savedAt: Date.now() });
+    runRequest('readwrite', store => store.put(snapshot, SNAPSHOT_KEY)).catch(error => {
+      console.warn('Could not save startup snapshot:', error);
+    });
+  }, SAVE_DELAY_MS);
+}
+
+/**
+ * Delete the stored snapshot
+ */
+export async function clearSnapshot(): Promise<void> {
+  if (typeof indexedDB === 'undefined') return;
+  await runRequest('readwrite', store => store.delete(SNAPSHOT_KEY));
+}
@@ -0,0 +1,47 @@
+import { bench, describe, expect } from 'vitest'
+import { makePatient } from '../../mock/server.js'
+import { PatientInfo, transformPatientData } from './patients'
+import { createPatientComparator, mergeSorted } from './sortedView'
+
+const PATIENT_COUNT = 50000
+// The largest batch the stream manager asks for; smaller batches make the full re-sort slower still
+const BATCH_SIZE = 500
+
+const batches: PatientInfo[][] = Array.from({ length: PATIENT_COUNT / BATCH_SIZE }, (_, batch) =>
+  Array.from({ length: BATCH_SIZE }, (_, offset) => transformPatientData(makePatient(batch * BATCH_SIZE + offset)))
+)
+
+const matchesFilters = (patient: PatientInfo) => patient.riskLevel !== 'low' && patient.status !== 'active'
+const expectedLength = batches.flat().filter(matchesFilters).length
+
+// The filter/sort step PatientInfoWidget ran per batch before: copy, filter and re-sort the whole view
+const compareBefore = (a: PatientInfo, b: PatientInfo) => {
+  const aValue = new Date(a.lastUpdate)
+  const bValue = new Date(b.lastUpdate)
+  return aValue > bValue ? 1 : -1
+}
+
+describe(`sorting a ${PATIENT_COUNT}-patient stream by last update`, () => {
+  bench('full re-sort per batch', () => {
+    let loaded: PatientInfo[] = []
+    let view: PatientInfo[] = []
+    for (const batch of batches) {
+      loaded = [...loaded, ...batch]
+      view = loaded
+        .filter(patient => patient.riskLevel !== 'low')
+        .filter(patient => patient.status !== 'active')
+        .filter(patient => patient.name.toLowerCase().includes(''))
+        .sort(compareBefore)
+    }
+    expect(view).toHaveLength(expectedLength)
+  }, { iterations: 3, time: 0 })
+
+  bench('merge each sorted batch into the view', () => {
+    const compare = createPatientComparator('lastUpdate', 'asc')
+    let view: PatientInfo[] = []
+    for (const batch of batches) {
+      view = mergeSorted(view, batch.filter(matchesFilters), compare)
+    }
+    expect(view).toHaveLength(expectedLength)
+  }, { iterations: 3, time: 0 })
+})
@@ -0,0 +1,54 @@
+import { PatientInfo } from './patients';
+
+/**
+ * Incrementally maintained sorted view over streamed patients
+ * 
+ * Comparators read the sort keys precomputed on each patient, and new batches
+ * are sorted on their own and merged into the existing sorted array in linear
+ * time instead of re-sorting everything per batch.
+ */
+
+export type PatientSortField = 'name' | 'risk' | 'lastUpdate';
+export type SortOrder = 'asc' | 'desc';
+
+/**
+ * Build a stable comparator for the given field and direction
+ */
+export function createPatientComparator(field: PatientSortField, order: SortOrder) {
+  const direction = order === 'asc' ? 1 : -1;
+  
+  switch (field) {
+    case 'risk':
+      return (a: PatientInfo, b: PatientInfo) => (a.sortKeys.risk - b.sortKeys.risk) * direction;
+    case 'lastUpdate':
+      return (a: PatientInfo, b: PatientInfo) => (a.sortKeys.timestamp - b.sortKeys.timestamp) * direction;
+    case 'name':
+    default:
+      return (a: PatientInfo, b: PatientInfo) => {
+        const aName = a.sortKeys.name;
+        const bName = b.sortKeys.name;
+        return (aName < bName ? -1 : aName > bName ? 1 : 0) * direction;
+      };
+  }
+}
+
+/**
+ * Sort `batch` in place and merge it into the already sorted `sorted` array.
+ * Returns a new array; on ties existing items stay ahead of new ones.
+ */
+export function mergeSorted<T>(sorted: T[], batch: T[], compare: (a: T, b: T) => number): T[] {
+  batch.sort(compare);
+  
+  const result: T[] = new Array(sorted.length + batch.length);
+  let i = 0;
+  let j = 0;
+  let k = 0;
+  
+  while (i < sorted.length && j < batch.length) {
+    result[k++] = compare(batch[j], sorted[i]) < 0 ? batch[j++] : sorted[i++];
+  }
+  while (i < sorted.length) result[k++] = sorted[i++];
+  while (j < batch.length) result[k++] = batch[j++];
+  
+  return result;
+}
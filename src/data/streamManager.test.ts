@@ -0,0 +1,51 @@
+import { afterAll, describe, expect, it, vi } from 'vitest'
+import { createMockServer } from '../../mock/server.js'
+
+// The transport reads its base URL when it loads, so point it at the mock first
+const server = await createMockServer({ scenario: { patients: 200 } })
+vi.stubEnv('VITE_API_BASE_URL', server.url)
+const { subscribePatientStream } = await import('./streamManager')
+
+afterAll(() => server.close())
+
+const streamRequests = () => server.stats.requests.filter(request => request.path.startsWith('/patients/with-risks/stream')).length
+
+describe('subscribePatientStream', () => {
+  it('downloads again after a failed stream instead of replaying the failure', async () => {
+    // Not resumable, so the dropped connection ends the stream with an error
+    server.scenario.streamDisconnects = 1
+    server.scenario.streamDisconnectAfterBatches = 1
+    const options = { batchSize: 20 }
+    const requestsBefore = streamRequests()
+
+    const onError = vi.fn()
+    const failed = new Promise<void>(resolve => {
+      const unsubscribe = subscribePatientStream(options, {
+        onError,
+        onEnd: () => {
+          unsubscribe()
+          resolve()
+        }
+      })
+    })
+    await failed
+    expect(onError).toHaveBeenCalledTimes(1)
+
+    const onRetryError = vi.fn()
+    const onSummary = vi.fn()
+    await new Promise<void>(resolve => {
+      const unsubscribe = subscribePatientStream(options, {
+        onError: onRetryError,
+        onSummary,
+        onEnd: () => {
+          unsubscribe()
+          resolve()
+        }
+      })
+    })
+
+    expect(onRetryError).not.toHaveBeenCalled()
+    expect(onSummary).toHaveBeenCalledTimes(1)
+    expect(streamRequests() - requestsBefore).toBe(2)
+  })
+})
@@ -0,0 +1,250 @@
+import { PatientInfo } from './patients';
+import { streamPatientsInWorker } from './patientStreamClient';
+import { StreamPatientsOptions } from './adapter';
+
+/**
+ * Shared patient streams
+ *
+ * Keeps at most one live `/patients/with-risks/stream` connection per set of
+ * stream parameters and fans its events out to every subscriber. Batches
+ * received so far are kept, so a subscriber that joins late (a second widget,
+ * or a remount) gets them replayed as one batch instead of starting another
+ * download. When the last subscriber leaves, an unfinished stream is closed
+ * after a short grace period (long enough for a StrictMode or route remount
+ * to pick it up again) and a finished one is kept for replay a while longer.
+ * A stream that ended with an error is dropped as soon as it ends, so the
+ * next subscriber downloads again instead of being replayed the failure.
+ *
+ * A subscriber's onBatch may return a promise that settles once the batch is
+ * on screen; the stream reads ahead only a few batches past the slowest
+ * subscriber. Subscribers report how long their commits take and the server
+ * batch size is tuned from that. A running response can't change its batch
+ * size; once the tuned size is at least twice or at most half the current
+ * one, the stream resumes from its cursor over a new connection with it.
+ */
+
+export type SharedStreamOptions = Omit<StreamPatientsOptions, 'signal' | 'onReconnect' | 'getBatchSize'>;
+
+export interface PatientStreamSubscriber {
+  onBatch?: (patients: PatientInfo[], processedCount: number, totalPatients: number) => void | Promise<void>;
+  onMetadata?: (metadata: any) => void;
+  onSummary?: (summary: any) => void;
+  onError?: (error: string) => void;
+  onReconnect?: (attempt: number, delayMs: number) => void;
+  // The stream was restarted; drop what has been received so far
+  onReset?: () => void;
+  // The stream ended (after its summary or error)
+  onEnd?: () => void;
+}
+
+interface SharedStream {
+  key: string;
+  options: SharedStreamOptions;
+  controller: AbortController;
+  subscribers: Set<PatientStreamSubscriber>;
+  batches: PatientInfo[][];
+  processedCount: number;
+  totalPatients: number;
+  metadata: any;
+  summary: any;
+  error: string | null;
+  done: boolean;
+  releaseTimer: ReturnType<typeof setTimeout> | null;
+}
+
+// How long an unfinished stream stays open without subscribers
+const LIVE_GRACE_MS = 2000;
+// How long a finished stream's batches stay available for replay
+const FINISHED_RETAIN_MS = 60 * 1000;
+
+// Batch size tuning: size batches so committing one takes about this long
+const COMMIT_BUDGET_MS = 8;
+const MIN_BATCH_SIZE = 10;
+const MAX_BATCH_SIZE = 500;
+const INITIAL_BATCH_SIZE = 20;
+// Weight of the newest sample in the moving average of commit cost
+const COMMIT_COST_SMOOTHING = 0.2;
+
+let batchSize = INITIAL_BATCH_SIZE;
+// Moving average of commit time per patient, null until the first report
+let commitCostPerPatient: number | null = null;
+
+/**
+ * Record how long a subscriber took to commit `patientCount` patients to the
+ * screen; the server batch size follows the measured cost per patient
+ */
+export function reportCommitTime(patientCount: number, durationMs: number): void {
+  if (patientCount <= 0) return;
+
+  const sample = Math.max(durationMs, 0.1) / patientCount;
+  commitCostPerPatient = commitCostPerPatient === null
+    ? sample
+    : commitCostPerPatient + COMMIT_COST_SMOOTHING * (sample - commitCostPerPatient);
+  batchSize = Math.round(Math.min(MAX_BATCH_SIZE, Math.max(MIN_BATCH_SIZE, COMMIT_BUDGET_MS / commitCostPerPatient)));
+}
+
+/**
+ * Batch size the server should be sending; a running stream switches to it once it diverges enough
+ */
+export function getStreamBatchSize(): number {
+  return batchSize;
+}
+
+const streams = new Map<string, SharedStream>();
+
+/**
+ * Key for a set of stream parameters, independent of property order
+ */
+function getStreamKey(options: SharedStreamOptions): string {
+  const entries = Object.entries(options)
+    .filter(([, value]) => value !== undefined)
+    .sort(([a], [b]) => a.localeCompare(b));
+  return JSON.stringify(entries);
+}
+
+function notify(stream: SharedStream, call: (subscriber: PatientStreamSubscriber) => void): void {
+  stream.subscribers.forEach(subscriber => {
+    try {
+      call(subscriber);
+    } catch (error) {
+      console.error('Patient stream subscriber failed:', error);
+    }
+  });
+}
+
+function openStream(key: string, options: SharedStreamOptions, subscribers = new Set<PatientStreamSubscriber>()): SharedStream {
+  const stream: SharedStream = {
+    key,
+    options,
+    controller: new AbortController(),
+    subscribers,
+    batches: [],
+    processedCount: 0,
+    totalPatients: 0,
+    metadata: null,
+    summary: null,
+    error: null,
+    done: false,
+    releaseTimer: null
+  };
+  streams.set(key, stream);
+
+  streamPatientsInWorker(
+    (patients, processedCount, totalPatients) => {
+      stream.batches.push(patients);
+      stream.processedCount = processedCount;
+      stream.totalPatients = totalPatients;
+
+      // The batch is consumed once every subscriber has committed it
+      const pending: Promise<void>[] = [];
+      notify(stream, subscriber => {
+        const result = subscriber.onBatch?.(patients, processedCount, totalPatients);
+        if (result) pending.push(result);
+      });
+      return pending.length > 0 ? Promise.all(pending).then(() => undefined) : undefined;
+    },
+    metadata => {
+      stream.metadata = metadata;
+      notify(stream, subscriber => subscriber.onMetadata?.(metadata));
+    },
+    summary => {
+      stream.summary = summary;
+      notify(stream, subscriber => subscriber.onSummary?.(summary));
+    },
+    error => {
+      stream.error = error;
+      notify(stream, subscriber => subscriber.onError?.(error));
+    },
+    {
+      ...options,
+      signal: stream.controller.signal,
+      getBatchSize: options.batchSize === undefined ? getStreamBatchSize : undefined,
+      onReconnect: (attempt, delayMs) => notify(stream, subscriber => subscriber.onReconnect?.(attempt, delayMs))
+    }
+  ).then(() => {
+    // Aborted streams have been closed or replaced; nothing left to report
+    if (stream.controller.signal.aborted) return;
+    stream.done = true;
+    notify(stream, subscriber => subscriber.onEnd?.());
+    if (stream.error !== null) {
+      closeStream(stream);
+      return;
+    }
+    if (stream.subscribers.size === 0) scheduleRelease(stream);
+  });
+
+  return stream;
+}
+
+function closeStream(stream: SharedStream): void {
+  if (stream.releaseTimer !== null) clearTimeout(stream.releaseTimer);
+  stream.controller.abort();
+  if (streams.get(stream.key) === stream) streams.delete(stream.key);
+}
+
+function scheduleRelease(stream: SharedStream): void {
+  if (stream.releaseTimer !== null) clearTimeout(stream.releaseTimer);
+  stream.releaseTimer = setTimeout(() => {
+    stream.releaseTimer = null;
+    if (stream.subscribers.size === 0) closeStream(stream);
+  }, stream.done ? FINISHED_RETAIN_MS : LIVE_GRACE_MS);
+}
+
+/**
+ * Bring a new subscriber up to date with everything the stream has delivered
+ */
+function replay(stream: SharedStream, subscriber: PatientStreamSubscriber): void {
+  if (stream.metadata !== null) subscriber.onMetadata?.(stream.metadata);
+  if (stream.batches.length > 0) {
+    subscriber.onBatch?.(stream.batches.flat(), stream.processedCount, stream.totalPatients);
+  }
+  if (stream.summary !== null) subscriber.onSummary?.(stream.summary);
+  if (stream.error !== null) subscriber.onError?.(stream.error);
+  if (stream.done) subscriber.onEnd?.();
+}
+
+/**
+ * Subscribe to the shared stream for `options`, opening it if needed.
+ * Returns a function that unsubscribes.
+ */
+export function subscribePatientStream(options: SharedStreamOptions, subscriber: PatientStreamSubscriber): () => void {
+  const key = getStreamKey(options);
+  let stream = streams.get(key);
+
+  if (stream) {
+    if (stream.releaseTimer !== null) {
+      clearTimeout(stream.releaseTimer);
+      stream.releaseTimer = null;
+    }
+    replay(stream, subscriber);
+    stream.subscribers.add(subscriber);
+  } else {
+    stream = openStream(key, options, new Set([subscriber]));
+  }
+
+  let subscribed = true;
+  return () => {
+    if (!subscribed) return;
+    subscribed = false;
+
+    // The stream may have been restarted under the same key since subscribing
+    const current = streams.get(key);
+    if (!current || !current.subscribers.delete(subscriber)) return;
+    if (current.subscribers.size === 0) scheduleRelease(current);
+  };
+}
+
+/**
+ * Download the stream for `options` again from the start; current
+ * subscribers are reset and move over to the new connection
+ */
+export function restartPatientStream(options: SharedStreamOptions): void {
+  const key = getStreamKey(options);
+  const stream = streams.get(key);
+  if (!stream) return;
+
+  closeStream(stream);
+  const restarted = openStream(key, options, stream.subscribers);
+  notify(restarted, subscriber => subscriber.onReset?.());
+  if (restarted.subscribers.size === 0) scheduleRelease(restarted);
+}
@@ -0,0 +1,391 @@
+import { createAbortError } from './queryCache';
+
+/**
+ * HTTP transport for the backend API
+ *
+ * Resolves request paths against the configured base URL and an ordered list
+ * of fallback URLs. Each request gets a per-endpoint timeout. Idempotent GETs
+ * are retried with jittered exponential backoff and fail over to the next
+ * base URL. Every base URL has its own circuit breaker: after repeated
+ * failures it is skipped for a cool-down period, then one probe request is
+ * let through. When every base URL is open requests fail fast with a
+ * CircuitOpenError, which callers can answer from cached data.
+ */
+
+export interface EndpointPolicy {
+  // Time allowed until the response (or, for JSON, its parsed body) arrives
+  timeoutMs: number;
+  // Extra attempts for idempotent requests after the first one
+  retries: number;
+  // Base delay for exponential backoff between retry rounds
+  retryDelayMs: number;
+}
+
+export interface RequestOptions {
+  method?: string;
+  headers?: Record<string, string>;
+  body?: string;
+  signal?: AbortSignal;
+}
+
+export interface TransportMetrics {
+  requests: number;
+  failures: number;
+  timeouts: number;
+  retries: number;
+  failovers: number;
+  // Requests refused because every base URL's circuit was open
+  circuitRejections: number;
+  endpoints: Array<{
+    baseUrl: string;
+    state: CircuitState;
+    consecutiveFailures: number;
+    failures: number;
+  }>;
+}
+
+type CircuitState = 'closed' | 'open' | 'half-open';
+
+const DEFAULT_BASE_URL = 'http://10.57.1.173:5000/api';
+
+const DEFAULT_POLICY: EndpointPolicy = {
+  timeoutMs: 8 * 1000,
+  retries: 2,
+  retryDelayMs: 300
+};
+
+// First matching pattern wins; unmatched paths use DEFAULT_POLICY
+const ENDPOINT_POLICIES: Array<[RegExp, Partial<EndpointPolicy>]> = [
+  // Only the time to first byte is bounded; the stream resumes on its own
+  [/^\/patients\/with-risks\/stream/, { timeoutMs: 15 * 1000, retries: 0 }],
+  // Live updates reconnect with their own backoff and Last-Event-ID
+  [/^\/events\/stream/, { timeoutMs: 15 * 1000, retries: 0 }],
+  // AI-backed endpoints are slow to answer
+  [/^\/weather-ai-analysis\//, { timeoutMs: 20 * 1000, retries: 1 }],
+  [/^\/risk-patients\/.*comprehensive/, { timeoutMs: 15 * 1000 }],
+  [/^\/risk-patients/, { timeoutMs: 10 * 1000 }]
+];
+
+const CIRCUIT_FAILURE_THRESHOLD = 5;
+const CIRCUIT_COOLDOWN_MS = 30 * 1000;
+
+/**
+ * Raised for HTTP error statuses
+ */
+export class HttpError extends Error {
+  constructor(public status: number) {
+    super(`HTTP error! status: ${status}`);
+    this.name = 'HttpError';
+  }
+}
+
+/**
+ * Raised instead of sending a request while every base URL's circuit is open
+ */
+export class CircuitOpenError extends Error {
+  constructor() {
+    super('Backend unavailable (circuit open)');
+    this.name = 'CircuitOpenError';
+  }
+}
+
+class TimeoutError extends Error {
+  constructor(timeoutMs: number) {
+    super(`Request timed out after ${timeoutMs}ms`);
+    this.name = 'TimeoutError';
+  }
+}
+
+class CircuitBreaker {
+  state: CircuitState = 'closed';
+  consecutiveFailures = 0;
+  failures = 0;
+  private openedAt = 0;
+  private probing = false;
+
+  constructor(public baseUrl: string) {}
+
+  /**
+   * Whether a request may be sent; in half-open state only one probe at a time
+   */
+  tryAcquire(): boolean {
+    if (this.state === 'open' && Date.now() - this.openedAt >= CIRCUIT_COOLDOWN_MS) {
+      this.state = 'half-open';
+    }
+    if (this.state === 'closed') return true;
+    if (this.state === 'half-open' && !this.probing) {
+      this.probing = true;
+      return true;
+    }
+    return false;
+  }
+
+  recordSuccess(): void {
+    this.state = 'closed';
+    this.consecutiveFailures = 0;
+    this.probing = false;
+  }
+
+  recordFailure(): void {
+    this.failures++;
+    this.consecutiveFailures++;
+    this.probing = false;
+    if (this.state === 'half-open' || this.consecutiveFailures >= CIRCUIT_FAILURE_THRESHOLD) {
+      this.state = 'open';
+      this.openedAt = Date.now();
+    }
+  }
+
+  // A request that ended without a verdict (e.g. aborted by the caller)
+  release(): void {
+    this.probing = false;
+  }
+}
+
+function readBaseUrls(): string[] {
+  const env = import.meta.env;
+  const primary = env.VITE_API_BASE_URL || DEFAULT_BASE_URL;
+  const fallbacks = (env.VITE_API_FALLBACK_URLS || '')
+    .split(',')
+    .map(url => url.trim())
+    .filter(Boolean);
+
+  return Array.from(new Set([primary, ...fallbacks])).map(url => url.replace(/\/+$/, ''));
+}
+
+const breakers = readBaseUrls().map(url => new CircuitBreaker(url));
+
+const counters = {
+  requests: 0,
+  failures: 0,
+  timeouts: 0,
+  retries: 0,
+  failovers: 0,
+  circuitRejections: 0
+};
+
+/**
+ * Base URL of the primary backend
+ */
+export function getApiBaseUrl(): string {
+  return breakers[0].baseUrl;
+}
+
+/**
+ * Snapshot of request counters and per-backend circuit state
+ */
+export function getTransportMetrics(): TransportMetrics {
+  return {
+    ...counters,
+    endpoints: breakers.map(breaker => ({
+      baseUrl: breaker.baseUrl,
+      state: breaker.state,
+      consecutiveFailures: breaker.consecutiveFailures,
+      failures: breaker.failures
+    }))
+  };
+}
+
+function getPolicy(path: string): EndpointPolicy {
+  const match = ENDPOINT_POLICIES.find(([pattern]) => pattern.test(path));
+  return { ...DEFAULT_POLICY, ...match?.[1] };
+}
+
+// Network errors, timeouts and server-side statuses are worth another attempt
+function isRetriable(error: unknown): boolean {
+  if (error instanceof HttpError) {
+    return error.status >= 500 || error.status === 408 || error.status === 429;
+  }
+  return error instanceof TimeoutError || error instanceof TypeError;
+}
+
+// Full jitter: a random delay up to the exponential backoff ceiling
+function backoffDelay(policy: EndpointPolicy, round: number): number {
+  return Math.random() * policy.retryDelayMs * 2 ** round;
+}
+
+/**
+ * Wait for `ms` milliseconds, rejecting early if the signal aborts
+ */
+export function delay(ms: number, signal?: AbortSignal): Promise<void> {
+  return new Promise<void>((resolve, reject) => {
+    if (signal?.aborted) return reject(createAbortError());
+    const onAbort = () => {
+      clearTimeout(timer);
+      reject(createAbortError());
+    };
+    const timer = setTimeout(() => {
+      signal?.removeEventListener('abort', onAbort);
+      resolve();
+    }, ms);
+    signal?.addEventListener('abort', onAbort, { once: true });
+  });
+}
+
+/**
+ * Hand back `response` with a body that calls `release` once it has been read
+ * to the end, has failed or has been cancelled
+ */
+function releaseWhenConsumed(response: Response, release: () => void): Response {
+  if (!response.body) {
+    release();
+    return response;
+  }
+  const reader = response.body.getReader();
+  const body = new ReadableStream<Uint8Array>({
+    async pull(controller) {
+      let finished = true;
+      try {
+        const { done, value } = await reader.read();
+        if (done) {
+          controller.close();
+        } else {
+          finished = false;
+          controller.enqueue(value);
+        }
+      } catch (error) {
+        controller.error(error);
+      } finally {
+        if (finished) release();
+      }
+    },
+    async cancel(reason) {
+      try {
+        await reader.cancel(reason);
+      } finally {
+        release();
+      }
+    }
+  });
+  return new Response(body, {
+    status: response.status,
+    statusText: response.statusText,
+    headers: response.headers
+  });
+}
+
+/**
+ * One attempt against one base URL. `read` runs inside the timeout, so for
+ * JSON requests the body must also arrive in time. With `bodyPending` the
+ * caller reads the body afterwards, so its signal stays attached to cancel it
+ * until the body has been consumed or cancelled.
+ */
+async function attempt<T>(
+  baseUrl: string,
+  path: string,
+  options: RequestOptions,
+  policy: EndpointPolicy,
+  read: (response: Response) => Promise<T>,
+  bodyPending: boolean
+): Promise<T> {
+  const controller = new AbortController();
+  let timedOut = false;
+  const timer = setTimeout(() => {
+    timedOut = true;
+    controller.abort();
+  }, policy.timeoutMs);
+  const forwardAbort = () => controller.abort();
+  const release = () => options.signal?.removeEventListener('abort', forwardAbort);
+  options.signal?.addEventListener('abort', forwardAbort, { once: true });
+
+  let handedOver = false;
+  try {
+    const response = await fetch(`${baseUrl}${path}`, {
+      method: options.method,
+      headers: options.headers,
+      body: options.body,
+      signal: controller.signal
+    });
+    if (response.status >= 500 || response.status === 408 || response.status === 429) {
+      throw new HttpError(response.status);
+    }
+    if (!bodyPending) return await read(response);
+    const result = await read(releaseWhenConsumed(response, release));
+    handedOver = true;
+    return result;
+  } catch (error) {
+    if (timedOut) throw new TimeoutError(policy.timeoutMs);
+    throw error;
+  } finally {
+    clearTimeout(timer);
+    if (!handedOver) release();
+  }
+}
+
+async function send<T>(
+  path: string,
+  options: RequestOptions,
+  read: (response: Response) => Promise<T>,
+  bodyPending: boolean
+): Promise<T> {
+  const policy = getPolicy(path);
+  const method = (options.method || 'GET').toUpperCase();
+  const idempotent = method === 'GET' || method === 'HEAD';
+  const rounds = idempotent ? policy.retries + 1 : 1;
+  let lastError: unknown = null;
+
+  counters.requests++;
+
+  for (let round = 0; round < rounds; round++) {
+    if (round > 0) {
+      counters.retries++;
+      await delay(backoffDelay(policy, round - 1), options.signal);
+    }
+
+    let tried = 0;
+    for (const breaker of breakers) {
+      if (!breaker.tryAcquire()) continue;
+      if (tried > 0) counters.failovers++;
+      tried++;
+
+      try {
+        const result = await attempt(breaker.baseUrl, path, options, policy, read, bodyPending);
+        breaker.recordSuccess();
+        return result;
+      } catch (error) {
+        if (options.signal?.aborted) {
+          breaker.release();
+          throw createAbortError();
+        }
+        if (!isRetriable(error)) {
+          // The backend answered; the request itself was rejected
+          breaker.recordSuccess();
+          throw error;
+        }
+
+        breaker.recordFailure();
+        if (error instanceof TimeoutError) counters.timeouts++;
+        lastError = error;
+        // A non-idempotent request may have reached the server; never resend it
+        if (!idempotent) break;
+      }
+    }
+
+    if (tried === 0) {
+      counters.circuitRejections++;
+      counters.failures++;
+      throw new CircuitOpenError();
+    }
+  }
+
+  counters.failures++;
+  throw lastError;
+}
+
+/**
+ * Send a request and return the response once its headers arrive.
+ * Used for streams and for callers that inspect the status themselves.
+ */
+export function request(path: string, options: RequestOptions = {}): Promise<Response> {
+  return send(path, options, async response => response, true);
+}
+
+/**
+ * Send a request and parse its JSON body, throwing HttpError for error statuses
+ */
+export function requestJson<T = any>(path: string, options: RequestOptions = {}): Promise<T> {
+  return send(path, options, async response => {
+    if (!response.ok) throw new HttpError(response.status);
+    return response.json() as Promise<T>;
+  }, false);
+}
@@ -0,0 +1,15 @@
+import { useEffect, useState } from 'react'
+
+/**
+ * Returns `value` once it has stopped changing for `delay` milliseconds
+ */
+export function useDebouncedValue<T>(value: T, delay: number): T {
+  const [debouncedValue, setDebouncedValue] = useState(value)
+
+  useEffect(() => {
+    const timer = setTimeout(() => setDebouncedValue(value), delay)
+    return () => clearTimeout(timer)
+  }, [value, delay])
+
+  return debouncedValue
+}
@@ -0,0 +1,30 @@
+import { useCallback, useEffect, useRef } from 'react'
+
+/**
+ * Mouse handlers that call `onIntent` once the pointer has rested on an element for `delay` milliseconds
+ * Leaving earlier cancels the call, so sweeping the pointer across a list triggers nothing
+ */
+export function useHoverIntent(onIntent: (() => void) | undefined, delay: number) {
+  const timerRef = useRef<ReturnType<typeof setTimeout> | null>(null)
+  const onIntentRef = useRef(onIntent)
+  onIntentRef.current = onIntent
+
+  const cancel = useCallback(() => {
+    if (timerRef.current === null) return
+    clearTimeout(timerRef.current)
+    timerRef.current = null
+  }, [])
+
+  const onMouseEnter = useCallback(() => {
+    if (!onIntentRef.current) return
+    cancel()
+    timerRef.current = setTimeout(() => {
+      timerRef.current = null
+      onIntentRef.current?.()
+    }, delay)
+  }, [cancel, delay])
+
+  useEffect(() => cancel, [cancel])
+
+  return { onMouseEnter, onMouseLeave: cancel }
+}
@@ -0,0 +1,59 @@
+import { useCallback, useEffect, useRef, useState } from 'react'
+
+interface MenuEntry {
+  container: React.RefObject<HTMLElement>
+  close: () => void
+}
+
+// At most one menu is open at a time, and only then is a document listener attached
+let openMenu: MenuEntry | null = null
+
+const handleDocumentMouseDown = (event: MouseEvent) => {
+  if (!openMenu || openMenu.container.current?.contains(event.target as Node)) return
+  setOpenMenu(null)
+}
+
+const setOpenMenu = (entry: MenuEntry | null) => {
+  const previous = openMenu
+  if (previous === entry) return
+
+  openMenu = entry
+  if (!previous) document.addEventListener('mousedown', handleDocumentMouseDown)
+  if (!entry) document.removeEventListener('mousedown', handleDocumentMouseDown)
+  previous?.close()
+}
+
+/**
+ * Open/close state for a dropdown menu that closes on clicks outside `containerRef`
+ * All menus share one delegated document listener, attached only while a menu is open
+ */
+export function useMenu<T extends HTMLElement = HTMLDivElement>() {
+  const containerRef = useRef<T>(null)
+  const [isOpen, setIsOpen] = useState(false)
+  const entryRef = useRef<MenuEntry | null>(null)
+  if (!entryRef.current) {
+    entryRef.current = { container: containerRef, close: () => setIsOpen(false) }
+  }
+
+  const open = useCallback(() => {
+    setOpenMenu(entryRef.current)
+    setIsOpen(true)
+  }, [])
+
+  const close = useCallback(() => {
+    if (openMenu === entryRef.current) setOpenMenu(null)
+    setIsOpen(false)
+  }, [])
+
+  const toggle = useCallback(() => {
+    if (openMenu === entryRef.current) close()
+    else open()
+  }, [open, close])
+
+  // Rows can unmount while their menu is open (e.g. scrolled out of a virtual list)
+  useEffect(() => () => {
+    if (openMenu === entryRef.current) setOpenMenu(null)
+  }, [])
+
+  return { containerRef, isOpen, open, close, toggle }
+}
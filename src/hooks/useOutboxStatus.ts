@@ -0,0 +1,9 @@
+import { useSyncExternalStore } from 'react'
+import { getOutboxStatus, OutboxStatus, subscribeOutbox } from '../data/outbox'
+
+/**
+ * Live counts of queued and rejected call requests, shared by all tabs
+ */
+export function useOutboxStatus(): OutboxStatus {
+  return useSyncExternalStore(subscribeOutbox, getOutboxStatus)
+}
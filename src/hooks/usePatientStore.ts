@@ -0,0 +1,38 @@
+import { useCallback, useRef, useSyncExternalStore } from 'react'
+import { patientStore, PatientEntity, PatientStore } from '../data/patientStore'
+
+/**
+ * Read a slice of the shared patient store
+ * The component re-renders only when the selected value changes according to `isEqual`
+ */
+export function usePatientStore<T>(
+  selector: (store: PatientStore) => T,
+  isEqual: (a: T, b: T) => boolean = Object.is
+): T {
+  const selectionRef = useRef<{ version: number; selector: (store: PatientStore) => T; value: T } | null>(null)
+
+  const getSelection = useCallback(() => {
+    const version = patientStore.getVersion()
+    const previous = selectionRef.current
+    if (previous && previous.version === version && previous.selector === selector) return previous.value
+
+    const value = selector(patientStore)
+    if (previous && isEqual(previous.value, value)) {
+      selectionRef.current = { version, selector, value: previous.value }
+      return previous.value
+    }
+    selectionRef.current = { version, selector, value }
+    return value
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [selector])
+
+  return useSyncExternalStore(patientStore.subscribe, getSelection)
+}
+
+/**
+ * A single patient entity; re-renders only when that patient changes
+ */
+export function usePatient(id: string | null | undefined): PatientEntity | undefined {
+  const selector = useCallback((store: PatientStore) => (id ? store.get(id) : undefined), [id])
+  return usePatientStore(selector)
+}
@@ -1,7 +1,7 @@
-import React, { useState, useEffect } from 'react'
+import React, { useState, useEffect, useCallback } from 'react'
 import { useNavigate } from 'react-router-dom'
-import { Message } from '../types'
-import { listMessages } from '../data/adapter'
+import { listMessages, invalidateQueries, selectRiskMessages, restoreSnapshot, subscribeLiveUpdates } from '../data/adapter'
+import { usePatientStore } from '../hooks/usePatientStore'
 import PatientNotificationWidget from '../components/PatientNotificationWidget'
 import DoctorWeatherWidget from '../components/DoctorWeatherWidget'
 import PatientRiskChart from '../components/PatientRiskChart'
@@ -13,32 +13,44 @@ import CuraViasLogo from '../components/CuraViasLogo'
  * Shows patient notifications, weather data, and patient health information
  */
 const DoctorDashboard: React.FC = () => {
-  const [messages, setMessages] = useState<Message[]>([])
+  // Patients come from the shared store, so revisiting the page renders immediately
+  const messages = usePatientStore(selectRiskMessages)
   const [loading, setLoading] = useState(true)
   const [lastUpdated, setLastUpdated] = useState<Date>(new Date())
   const navigate = useNavigate()
 
-  // Load messages on component mount
-  useEffect(() => {
-    loadMessages()
-  }, [])
-
-  const loadMessages = async () => {
+  const loadMessages = useCallback(async () => {
     try {
       setLoading(true)
-      const data = await listMessages()
-      setMessages(data)
+      await listMessages()
       setLastUpdated(new Date())
     } catch (error) {
       console.error('Error loading messages:', error)
     } finally {
       setLoading(false)
     }
-  }
+  }, [])
+
+  // Load messages on component mount; the saved snapshot fills the store until they arrive
+  useEffect(() => {
+    restoreSnapshot()
+    loadMessages()
+  }, [loadMessages])
+
+  // Pushed risk changes land in the patient store directly; only a resync needs a reload
+  useEffect(() => subscribeLiveUpdates(update => {
+    if (update.type === 'resync') {
+      loadMessages()
+    } else if (update.type !== 'weather') {
+      setLastUpdated(new Date())
+    }
+  }), [loadMessages])
 
-  const handleRefresh = () => {
+  const handleRefresh = useCallback(() => {
+    // Drop cached patient queries so widgets refetch fresh data
+    invalidateQueries('/risk-patients')
     loadMessages()
-  }
+  }, [loadMessages])
 
   // Categorize messages by risk level
   const highRiskPatients = messages.filter(msg => msg.risk === 'high')
@@ -160,9 +172,10 @@ const DoctorDashboard: React.FC = () => {
         <div className="grid grid-cols-1 lg:grid-cols-2 gap-8 mb-8">
           {/* Patient Risk Distribution Chart */}
           <div className="lg:col-span-1">
+            {/* Only the first load shows a spinner; refreshes keep the chart in place */}
             <PatientRiskChart 
               messages={messages}
-              loading={loading}
+              loading={loading && messages.length === 0}
             />
           </div>
 
@@ -1,7 +1,12 @@
-import React, { useState, useEffect, useCallback } from 'react'
+import React, { useState, useEffect, useCallback, useMemo, useRef } from 'react'
 import { useNavigate } from 'react-router-dom'
 import { Message, FilterType } from '../types'
-import { listMessages, markRead, loadSampleData } from '../data/adapter'
+import { listMessages, getMessageBody, setMessageRead, subscribeReadState, subscribeLiveUpdates, loadSampleData, invalidateQueries, selectRiskMessages, restoreSnapshot } from '../data/adapter'
+import { applyReadState } from '../data/readState'
+import { SearchIndex } from '../data/searchIndex'
+import { reconcileMessages } from '../data/reconcile'
+import { useDebouncedValue } from '../hooks/useDebouncedValue'
+import { usePatientStore } from '../hooks/usePatientStore'
 import { useToast } from '../components/Toast'
 import TopWidgets from '../components/TopWidgets'
 import InboxToolbar from '../components/InboxToolbar'
@@ -9,44 +14,143 @@ import InboxList from '../components/InboxList'
 import RightPanel from '../components/RightPanel'
 import CuraViasLogo from '../components/CuraViasLogo'
 
+// Startup timing is reported once per page load, not on every visit to the page
+let firstInboxReported = false
+
+// Bodies are generated on demand, so they are added once the inbox is first searched
+const indexMessage = (index: SearchIndex, message: Message, body?: string) => {
+  index.add(message.id, [message.patientName, message.subject, message.preview, body].filter(Boolean).join(' '))
+}
+
 /**
  * Home page component - main application interface
  * Manages state for messages, filters, and the reading panel
  */
 const Home: React.FC = () => {
-  const [messages, setMessages] = useState<Message[]>([])
+  // Start from patients already in the shared store (e.g. loaded by the dashboard)
+  const [messages, setMessages] = useState<Message[]>(selectRiskMessages)
   const [loading, setLoading] = useState(false)
   const [filter, setFilter] = useState<FilterType>('all')
   const [selectedMessage, setSelectedMessage] = useState<Message | null>(null)
+  const [searchQuery, setSearchQuery] = useState('')
+  const debouncedSearch = useDebouncedValue(searchQuery, 200)
   const { showToast } = useToast()
   const navigate = useNavigate()
+  const messagesRef = useRef(messages)
+  messagesRef.current = messages
+
+  // Full-text index over the inbox, kept in step with each reconcile diff
+  const searchIndexRef = useRef<SearchIndex | null>(null)
+  if (searchIndexRef.current === null) {
+    const index = new SearchIndex()
+    messages.forEach(message => indexMessage(index, message))
+    searchIndexRef.current = index
+  }
+  // The message version whose body is in the index, by id
+  const bodyIndexedRef = useRef(new Map<string, Message>())
+
+  // Show a new message list, keeping unchanged messages (and the list itself) by identity
+  const applyMessages = useCallback((data: Message[]) => {
+    const diff = reconcileMessages(messagesRef.current, data)
+    if (diff.messages === messagesRef.current) return
+
+    setMessages(diff.messages)
+    const index = searchIndexRef.current as SearchIndex
+    diff.removed.forEach(id => {
+      index.remove(id)
+      bodyIndexedRef.current.delete(id)
+    })
+    if (diff.added.length > 0 || diff.changed.length > 0 || diff.removed.length > 0) {
+      const byId = new Map(diff.messages.map(message => [message.id, message]))
+      diff.added.forEach(id => indexMessage(index, byId.get(id) as Message))
+      diff.changed.forEach(id => indexMessage(index, byId.get(id) as Message))
+      setSelectedMessage(prev => (prev ? byId.get(prev.id) ?? null : prev))
+    }
+  }, [])
 
   // Load messages from adapter
   const loadMessages = useCallback(async () => {
     setLoading(true)
     try {
-      const data = await listMessages()
-      setMessages(data)
+      applyMessages(await listMessages())
     } catch (error) {
       console.error('Failed to load messages:', error)
       showToast('Failed to load messages', 'error')
     } finally {
       setLoading(false)
     }
-  }, [showToast])
+  }, [applyMessages, showToast])
+
+  // The inbox follows the shared store, which fetches, snapshots and pushed updates all write to
+  const storeMessages = usePatientStore(selectRiskMessages)
+  useEffect(() => {
+    applyMessages(storeMessages)
+  }, [applyMessages, storeMessages])
+
+  // New high-risk patients are announced; the store subscription above updates the list
+  useEffect(() => subscribeLiveUpdates(update => {
+    if (update.type === 'resync') {
+      loadMessages()
+    } else if (update.type === 'patient-risk' && update.added && update.risk === 'high') {
+      showToast(`New high-risk alert: ${update.patientName}`, 'error')
+    }
+  }), [loadMessages, showToast])
+
+  // Refresh button bypasses the query cache
+  const handleRefresh = useCallback(() => {
+    invalidateQueries('/risk-patients')
+    loadMessages()
+  }, [loadMessages])
 
   // Load sample data for development/testing
   const handleLoadSampleData = useCallback(() => {
     const sampleMessages = loadSampleData()
-    setMessages(sampleMessages)
+    applyMessages(sampleMessages)
     showToast('Sample data loaded', 'success')
-  }, [showToast])
+  }, [applyMessages, showToast])
+
+  // The index is updated along with the list, so results are recomputed when either changes
+  const searchResults = useMemo(() => {
+    const index = searchIndexRef.current
+    if (!debouncedSearch.trim() || messages.length === 0 || !index) return null
+
+    // Index the body of every message not yet indexed with its current body, generating it if needed
+    const bodyIndexed = bodyIndexedRef.current
+    for (const message of messages) {
+      if (bodyIndexed.get(message.id) === message) continue
+      indexMessage(index, message, getMessageBody(message))
+      bodyIndexed.set(message.id, message)
+    }
+    return index.search(debouncedSearch)
+  }, [messages, debouncedSearch])
 
   // Initial load
   useEffect(() => {
     loadMessages()
   }, [loadMessages])
 
+  // Show the saved snapshot while the first load is in flight; the load then reconciles it
+  const restoredRef = useRef(false)
+  useEffect(() => {
+    let cancelled = false
+    restoreSnapshot().then(restored => {
+      if (cancelled || !restored || messagesRef.current.length > 0) return
+      restoredRef.current = true
+      applyMessages(selectRiskMessages())
+    })
+    return () => {
+      cancelled = true
+    }
+  }, [applyMessages])
+
+  // Time to first meaningful inbox, from navigation start, tagged with where the data came from
+  useEffect(() => {
+    if (firstInboxReported || messages.length === 0) return
+    firstInboxReported = true
+    const source = restoredRef.current ? 'snapshot' : 'network'
+    performance.measure('time-to-first-inbox', { start: 0, end: performance.now(), detail: { source } })
+  }, [messages])
+
   // Handle message row click
   const handleOpenMessage = useCallback((message: Message) => {
     setSelectedMessage(message)
@@ -57,36 +161,29 @@ const Home: React.FC = () => {
     setSelectedMessage(null)
   }, [])
 
+  // Apply read-state changes, including toggles made in other tabs
+  useEffect(() => subscribeReadState(() => {
+    setMessages(prev => applyReadState(prev))
+    setSelectedMessage(prev => (prev ? applyReadState([prev])[0] : prev))
+  }), [])
+
   // Handle toggle read status
+  // Reads current state through a ref so the callback stays stable for memoized rows;
+  // the read-state subscription above updates the list
   const handleToggleRead = useCallback(async (messageId: string) => {
+    const wasRead = messagesRef.current.find(m => m.id === messageId)?.read
     try {
-      // Update local state first for immediate UI feedback
-      setMessages(prev => prev.map(msg => 
-        msg.id === messageId ? { ...msg, read: !msg.read } : msg
-      ))
-      
-      // Update selected message if it's the one being toggled
-      if (selectedMessage?.id === messageId) {
-        setSelectedMessage(prev => prev ? { ...prev, read: !prev.read } : null)
-      }
-      
-      // Call adapter (no-op for now)
-      await markRead(messageId)
+      await setMessageRead(messageId, !wasRead)
       
       showToast(
-        `Message ${messages.find(m => m.id === messageId)?.read ? 'marked as unread' : 'marked as read'}`,
+        `Message ${wasRead ? 'marked as unread' : 'marked as read'}`,
         'success'
       )
     } catch (error) {
       console.error('Failed to toggle read status:', error)
       showToast('Failed to update message status', 'error')
-      
-      // Revert local state on error
-      setMessages(prev => prev.map(msg => 
-        msg.id === messageId ? { ...msg, read: !msg.read } : msg
-      ))
     }
-  }, [selectedMessage, messages, showToast])
+  }, [showToast])
 
 
   return (
@@ -145,8 +242,10 @@ const Home: React.FC = () => {
           <InboxToolbar
             currentFilter={filter}
             onFilterChange={setFilter}
-            onRefresh={loadMessages}
+            onRefresh={handleRefresh}
             onLoadSampleData={handleLoadSampleData}
+            searchQuery={searchQuery}
+            onSearchChange={setSearchQuery}
           />
 
           {/* Message list */}
@@ -155,6 +254,7 @@ const Home: React.FC = () => {
             filter={filter}
             onOpenMessage={handleOpenMessage}
             onToggleRead={handleToggleRead}
+            searchResults={searchResults}
           />
         </div>
       </div>
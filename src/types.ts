@@ -6,7 +6,8 @@ export interface Message {
   risk: HeatRisk;
   subject: string;
   preview: string;
-  body: string;
+  // Omitted from list messages; read it through getMessageBody
+  body?: string;
   createdAt: string;
   read: boolean;
 }
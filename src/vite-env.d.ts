@@ -0,0 +1,12 @@
+/// <reference types="vite/client" />
+
+interface ImportMetaEnv {
+  // Primary backend API URL, e.g. http://10.57.1.173:5000/api
+  readonly VITE_API_BASE_URL?: string
+  // Comma-separated fallback API URLs, tried in order when the primary fails
+  readonly VITE_API_FALLBACK_URLS?: string
+}
+
+interface ImportMeta {
+  readonly env: ImportMetaEnv
+}
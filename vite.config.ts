@@ -1,3 +1,4 @@
+/// <reference types="vitest" />
 import { defineConfig } from 'vite'
 import react from '@vitejs/plugin-react'
 
@@ -7,5 +8,13 @@ export default defineConfig({
   server: {
     port: 3000,
     open: true
+  },
+  test: {
+    // Data-layer tests run in Node against mock/server.js; component tests opt into jsdom per file
+    environment: 'node',
+    include: ['src/**/*.test.{ts,tsx}'],
+    benchmark: {
+      include: ['src/**/*.bench.{ts,tsx}']
+    }
   }
 })